@@ -4,7 +4,7 @@ from fastapi import Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.config import settings
-from ..core.db.database import async_get_db
+from ..core.db.database import async_get_read_db
 from ..core.exceptions.http_exceptions import (
     ForbiddenException,
     RateLimitException,
@@ -29,7 +29,7 @@ DEFAULT_PERIOD = settings.DEFAULT_RATE_LIMIT_PERIOD
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
 ) -> UserSchema:
     token_data: TokenData | None = await verify_token(token, db)
     if token_data is None:
@@ -59,7 +59,7 @@ async def get_current_user(
 
 
 async def get_optional_user(
-    request: Request, db: Annotated[AsyncSession, Depends(async_get_db)]
+    request: Request, db: Annotated[AsyncSession, Depends(async_get_read_db)]
 ) -> UserSchema | None:
     token = request.headers.get("Authorization")
     if not token:
@@ -70,10 +70,6 @@ async def get_optional_user(
         if token_type.lower() != "bearer" or not token_value:
             return None
 
-        token_data: TokenData | None = await verify_token(token_value, db)
-        if token_data is None:
-            return None
-
         return await get_current_user(token_value, db=db)
 
     except HTTPException as http_exc:
@@ -89,7 +85,7 @@ async def get_optional_user(
 
 
 async def get_current_superuser(
-    current_user: Annotated[UserSchema, Depends(get_current_user)]
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
 ) -> UserSchema:
     if not current_user.is_superuser:
         raise ForbiddenException("You do not have enough privileges.")
@@ -99,7 +95,7 @@ async def get_current_superuser(
 
 async def rate_limiter(
     request: Request,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     user: Annotated[UserSchema | None, Depends(get_optional_user)] = None,
 ) -> None:
     path = sanitize_path(request.url.path)
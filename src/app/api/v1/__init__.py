@@ -9,6 +9,9 @@ from .group_user import router as group_user_router
 from .login import router as login_router
 from .logout import router as logout_router
 from .statistics import router as statistics_router
+from .tasks import router as tasks_router
+from .transaction_export import router as transaction_export_router
+from .transaction_import import router as transaction_import_router
 from .user_purchase_category import router as user_purchase_category_router
 from .user_transaction_items import router as user_transaction_items_router
 from .user_transactions import router as user_transactions_router
@@ -19,6 +22,9 @@ router.include_router(login_router)
 router.include_router(logout_router)
 router.include_router(users_router)
 router.include_router(user_purchase_category_router)
+# Before the transaction routers, whose `{transaction_uuid}` would match
+router.include_router(transaction_export_router)
+router.include_router(transaction_import_router)
 router.include_router(user_transactions_router)
 router.include_router(user_transaction_items_router)
 router.include_router(group_router)
@@ -28,3 +34,4 @@ router.include_router(group_transactions_router)
 router.include_router(group_transaction_items_router)
 router.include_router(statistics_router)
 router.include_router(group_statistics_router)
+router.include_router(tasks_router)
@@ -0,0 +1,36 @@
+from enum import Enum
+
+from ....core.exceptions.http_exceptions import (
+    ForbiddenException,
+    NotFoundException,
+)
+
+
+class AccessDenial(Enum):
+    NOT_FOUND = "not_found"
+    DELETED = "deleted"
+    FORBIDDEN = "forbidden"
+
+
+def get_access_denial(
+    *, found: bool, deleted: bool, allowed: bool
+) -> AccessDenial | None:
+    if not found:
+        return AccessDenial.NOT_FOUND
+    if deleted:
+        return AccessDenial.DELETED
+    if not allowed:
+        return AccessDenial.FORBIDDEN
+    return None
+
+
+def raise_for_access_denial(
+    access_denial: AccessDenial | None,
+    not_found_detail: str,
+    forbidden_detail: str,
+) -> None:
+    # Deleted entities are reported as missing, like before
+    if access_denial in (AccessDenial.NOT_FOUND, AccessDenial.DELETED):
+        raise NotFoundException(not_found_detail)
+    if access_denial is AccessDenial.FORBIDDEN:
+        raise ForbiddenException(forbidden_detail)
@@ -1,92 +1,86 @@
 import uuid as uuid_pkg
-from typing import Annotated, Any
+from typing import Annotated
 
 from fastapi import Depends
-from fastcrud import JoinConfig
-from pydantic import BaseModel
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....core.db.database import async_get_db
-from ....core.exceptions.http_exceptions import (
-    ForbiddenException,
-    NotFoundException,
-)
-from ....crud.crud_groups import crud_groups
 from ....models.group import Group as GroupModel
 from ....models.links.group_user import GroupUser as GroupUserModel
 from ....schemas.group import Group as GroupSchema
 from ....schemas.user import User as UserSchema
 from ...dependencies import get_current_user
+from .access import AccessDenial, get_access_denial, raise_for_access_denial
 
 
-async def get_existing_non_deleted_group_uuid(
+async def get_group_access(
     group_uuid: uuid_pkg.UUID,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
-) -> uuid_pkg.UUID:
-    # Check if group exists
-    group_exists: bool = await crud_groups.exists(
-        db=db, uuid=group_uuid, is_deleted=False
-    )
-    if not group_exists:
-        raise NotFoundException("Group not found.")
-
-    return group_uuid
+    user_id: int,
+    db: AsyncSession,
+    allow_deleted: bool = False,
+) -> tuple[GroupSchema | None, AccessDenial | None]:
+    """Load a group and check that the user is a member in one query.
 
-
-async def get_existing_group_uuid(
-    group_uuid: uuid_pkg.UUID,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
-) -> uuid_pkg.UUID:
-    # Check if group exists
-    group_exists: bool = await crud_groups.exists(db=db, uuid=group_uuid)
-    if not group_exists:
-        raise NotFoundException("Group not found.")
-
-    return group_uuid
-
-
-async def _get_user_group(
-    group_uuid: uuid_pkg.UUID,
-    current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
-) -> GroupSchema:
-    # Check if user has access to group
-    user_group_join_config = JoinConfig(
-        model=GroupUserModel,
-        join_on=GroupUserModel.group_id == GroupModel.id,
-        schema_to_select=BaseModel,
-        filters={"user_id": current_user.id},
+    Returns the group and the reason the user may not access it, which is
+    `None` if access is granted.
+    """
+    statement = (
+        select(
+            GroupModel,
+            GroupUserModel.user_id.is_not(None).label("is_member"),
+        )
+        .outerjoin(
+            GroupUserModel,
+            and_(
+                GroupUserModel.group_id == GroupModel.id,
+                GroupUserModel.user_id == user_id,
+            ),
+        )
+        .filter(GroupModel.uuid == group_uuid)
     )
-    group_dict: dict[str, Any] | None = await crud_groups.get_joined(
-        db=db,
-        uuid=group_uuid,
-        joins_config=[user_group_join_config],
-        schema_to_select=GroupSchema,
-    )
-    if group_dict is None:
-        raise ForbiddenException("User does not have access to group.")
+    row = (await db.execute(statement)).one_or_none()
+    if row is None:
+        return None, AccessDenial.NOT_FOUND
 
-    group_schema = GroupSchema.model_validate(group_dict)
-    return group_schema
+    group_schema = GroupSchema.model_validate(vars(row.Group))
+    return group_schema, get_access_denial(
+        found=True,
+        deleted=group_schema.is_deleted and not allow_deleted,
+        allowed=row.is_member,
+    )
 
 
 async def get_non_deleted_user_group(
-    group_uuid: Annotated[
-        uuid_pkg.UUID, Depends(get_existing_non_deleted_group_uuid)
-    ],
+    group_uuid: uuid_pkg.UUID,
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> GroupSchema:
-    return await _get_user_group(
-        group_uuid=group_uuid, current_user=current_user, db=db
+    group_schema, access_denial = await get_group_access(
+        group_uuid=group_uuid, user_id=current_user.id, db=db
+    )
+    raise_for_access_denial(
+        access_denial,
+        not_found_detail="Group not found.",
+        forbidden_detail="User does not have access to group.",
     )
+    return group_schema  # type: ignore
 
 
 async def get_user_group(
-    group_uuid: Annotated[uuid_pkg.UUID, Depends(get_existing_group_uuid)],
+    group_uuid: uuid_pkg.UUID,
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> GroupSchema:
-    return await _get_user_group(
-        group_uuid=group_uuid, current_user=current_user, db=db
+    group_schema, access_denial = await get_group_access(
+        group_uuid=group_uuid,
+        user_id=current_user.id,
+        db=db,
+        allow_deleted=True,
+    )
+    raise_for_access_denial(
+        access_denial,
+        not_found_detail="Group not found.",
+        forbidden_detail="User does not have access to group.",
     )
+    return group_schema  # type: ignore
@@ -0,0 +1,158 @@
+import time
+import uuid as uuid_pkg
+from collections import OrderedDict
+
+from redis.exceptions import RedisError
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....core.config import settings
+from ....core.logger import logging
+from ....core.utils import cache
+from ....models.group import Group as GroupModel
+from ....models.links.group_user import GroupUser as GroupUserModel
+from ....schemas.links.group_user import GroupMembership
+
+logger = logging.getLogger(__name__)
+
+# (group uuid, user id) -> (expires at, membership)
+_local_cache: OrderedDict[
+    tuple[uuid_pkg.UUID, int], tuple[float, GroupMembership]
+] = OrderedDict()
+
+
+def _get_redis_key(group_uuid: uuid_pkg.UUID) -> str:
+    # One hash per group, so a whole group can be invalidated at once
+    return f"group_membership:{group_uuid}"
+
+
+def _get_local(
+    group_uuid: uuid_pkg.UUID, user_id: int
+) -> GroupMembership | None:
+    entry = _local_cache.get((group_uuid, user_id))
+    if entry is None:
+        return None
+
+    expires_at, membership = entry
+    if expires_at < time.monotonic():
+        del _local_cache[(group_uuid, user_id)]
+        return None
+
+    _local_cache.move_to_end((group_uuid, user_id))
+    return membership
+
+
+def _set_local(membership: GroupMembership) -> None:
+    key = (membership.group_uuid, membership.user_id)
+    _local_cache[key] = (
+        time.monotonic() + settings.GROUP_MEMBERSHIP_LOCAL_CACHE_EXPIRATION,
+        membership,
+    )
+    _local_cache.move_to_end(key)
+    while len(_local_cache) > settings.GROUP_MEMBERSHIP_LOCAL_CACHE_MAX_SIZE:
+        _local_cache.popitem(last=False)
+
+
+async def _get_remote(
+    group_uuid: uuid_pkg.UUID, user_id: int
+) -> GroupMembership | None:
+    if cache.client is None:
+        return None
+
+    try:
+        data = await cache.client.hget(  # type: ignore
+            _get_redis_key(group_uuid), str(user_id)
+        )
+    except RedisError as e:
+        logger.warning(f"Could not read group membership from cache: {e}")
+        return None
+
+    if data is None:
+        return None
+    return GroupMembership.model_validate_json(data)
+
+
+async def _set_remote(membership: GroupMembership) -> None:
+    if cache.client is None:
+        return
+
+    key = _get_redis_key(membership.group_uuid)
+    try:
+        async with cache.client.pipeline(transaction=False) as pipe:
+            pipe.hset(
+                key, str(membership.user_id), membership.model_dump_json()
+            )
+            pipe.expire(key, settings.GROUP_MEMBERSHIP_CACHE_EXPIRATION)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not write group membership to cache: {e}")
+
+
+async def get_group_membership(
+    db: AsyncSession, group_uuid: uuid_pkg.UUID, user_id: int
+) -> GroupMembership | None:
+    """Get the role of a user in a group together with the group's state.
+
+    Lookups go through a process local cache, then Redis, and only hit the
+    database on a miss. Returns `None` if the group does not exist; users
+    outside the group get a membership without a role.
+    """
+    membership = _get_local(group_uuid, user_id)
+    if membership is not None:
+        return membership
+
+    membership = await _get_remote(group_uuid, user_id)
+    if membership is not None:
+        _set_local(membership)
+        return membership
+
+    statement = (
+        select(GroupModel.id, GroupModel.is_deleted, GroupUserModel.user_role)
+        .outerjoin(
+            GroupUserModel,
+            and_(
+                GroupUserModel.group_id == GroupModel.id,
+                GroupUserModel.user_id == user_id,
+            ),
+        )
+        .filter(GroupModel.uuid == group_uuid)
+    )
+    row = (await db.execute(statement)).one_or_none()
+    if row is None:
+        return None
+
+    membership = GroupMembership(
+        group_id=row.id,
+        group_uuid=group_uuid,
+        group_is_deleted=row.is_deleted,
+        user_id=user_id,
+        user_role=row.user_role,
+    )
+    await _set_remote(membership)
+    _set_local(membership)
+    return membership
+
+
+async def invalidate_group_membership(
+    group_uuid: uuid_pkg.UUID, user_id: int | None = None
+) -> None:
+    """Drop cached memberships of a user, or of every user if `user_id` is
+    `None`, after the group or its members changed."""
+    if user_id is None:
+        for key in [key for key in _local_cache if key[0] == group_uuid]:
+            del _local_cache[key]
+    else:
+        _local_cache.pop((group_uuid, user_id), None)
+
+    if cache.client is None:
+        return
+
+    try:
+        if user_id is None:
+            await cache.client.delete(_get_redis_key(group_uuid))
+        else:
+            await cache.client.hdel(  # type: ignore
+                _get_redis_key(group_uuid), str(user_id)
+            )
+    except RedisError as e:
+        logger.error(f"Could not invalidate group membership cache: {e}")
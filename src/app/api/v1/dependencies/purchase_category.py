@@ -4,6 +4,7 @@ from typing import Annotated, Any
 from fastapi import Depends
 from fastcrud import JoinConfig
 from pydantic import BaseModel
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....core.db.database import async_get_db
@@ -28,6 +29,7 @@ from ....schemas.purchase_category import (
 from ....schemas.user import User as UserSchema
 from ...dependencies import get_current_user
 from ..dependencies.group import get_non_deleted_user_group
+from .access import get_access_denial, raise_for_access_denial
 
 
 async def get_existing_non_deleted_purchase_category_uuid(
@@ -245,3 +247,81 @@ async def get_optional_user_purchase_category(
         current_user=current_user,
         db=db,
     )
+
+
+async def _get_purchase_categories(
+    purchase_category_uuids: list[uuid_pkg.UUID],
+    link_model: type[UserPurchaseCategoryModel | GroupPurchaseCategoryModel],
+    owner_condition: Any,
+    forbidden_detail: str,
+    db: AsyncSession,
+) -> dict[uuid_pkg.UUID, PurchaseCategorySchema]:
+    # Existence and ownership of all categories are checked in one query
+    unique_uuids = list(dict.fromkeys(purchase_category_uuids))
+    if len(unique_uuids) == 0:
+        return {}
+
+    statement = (
+        select(
+            PurchaseCategoryModel,
+            link_model.purchase_category_id.is_not(None).label("is_owned"),
+        )
+        .outerjoin(
+            link_model,
+            and_(
+                link_model.purchase_category_id == PurchaseCategoryModel.id,
+                owner_condition,
+            ),
+        )
+        .filter(PurchaseCategoryModel.uuid.in_(unique_uuids))
+    )
+    rows = {
+        row.PurchaseCategory.uuid: row
+        for row in (await db.execute(statement)).all()
+    }
+
+    result = {}
+    for purchase_category_uuid in unique_uuids:
+        row = rows.get(purchase_category_uuid)
+        raise_for_access_denial(
+            get_access_denial(
+                found=row is not None,
+                deleted=row is not None and row.PurchaseCategory.is_deleted,
+                allowed=row is not None and row.is_owned,
+            ),
+            not_found_detail="Purchase category not found.",
+            forbidden_detail=forbidden_detail,
+        )
+        result[purchase_category_uuid] = PurchaseCategorySchema.model_validate(
+            vars(row.PurchaseCategory)  # type: ignore
+        )
+
+    return result
+
+
+async def get_non_deleted_user_purchase_categories(
+    purchase_category_uuids: list[uuid_pkg.UUID],
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+) -> dict[uuid_pkg.UUID, PurchaseCategorySchema]:
+    return await _get_purchase_categories(
+        purchase_category_uuids=purchase_category_uuids,
+        link_model=UserPurchaseCategoryModel,
+        owner_condition=UserPurchaseCategoryModel.user_id == current_user.id,
+        forbidden_detail="User does not have access to purchase category.",
+        db=db,
+    )
+
+
+async def get_non_deleted_group_purchase_categories(
+    purchase_category_uuids: list[uuid_pkg.UUID],
+    group: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+) -> dict[uuid_pkg.UUID, PurchaseCategorySchema]:
+    return await _get_purchase_categories(
+        purchase_category_uuids=purchase_category_uuids,
+        link_model=GroupPurchaseCategoryModel,
+        owner_condition=GroupPurchaseCategoryModel.group_id == group.id,
+        forbidden_detail="Group does not have access to purchase category.",
+        db=db,
+    )
@@ -4,7 +4,7 @@ from fastapi import Depends
 from sqlalchemy import not_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ....core.db.database import async_get_db
+from ....core.db.database import async_get_read_db
 from ....models.links.group_purchase_category import (
     GroupPurchaseCategory as GroupPurchaseCategoryModel,
 )
@@ -22,7 +22,7 @@ from ..dependencies.group import get_non_deleted_user_group
 
 async def get_user_purchase_categories(
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
 ) -> list[PurchaseCategoryModel]:
     purchase_categories: list[PurchaseCategoryModel] = []
     statement = (
@@ -41,7 +41,7 @@ async def get_user_purchase_categories(
 
 async def get_group_purchase_categories(
     group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
 ) -> list[PurchaseCategoryModel]:
     purchase_categories: list[PurchaseCategoryModel] = []
     statement = (
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import Annotated, Any
 
 from fastapi import Depends, Query
@@ -5,11 +6,11 @@ from fastcrud import JoinConfig
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ....core.config import settings
 from ....core.db.database import async_get_db
 from ....core.exceptions.http_exceptions import NotFoundException
-from ....crud.crud_tags import crud_tags
-from ....crud.links.crud_group_tag import crud_group_tag
-from ....crud.links.crud_user_tag import crud_user_tag
+from ....core.utils.queue import FOLLOW_UP_JOB_DELAY, enqueue_follow_up_job
+from ....crud.crud_tags import crud_tags, get_owned_tags_for_share
 from ....models.links.group_tag import GroupTag as GroupTagModel
 from ....models.links.user_tag import UserTag as UserTagModel
 from ....models.tag import Tag as TagModel
@@ -22,6 +23,12 @@ from ....schemas.user import User as UserSchema
 from ...dependencies import get_current_user
 from .group import get_non_deleted_user_group
 
+# Tags unlinked by a write are kept for the grace period, the cleanup runs
+# once it has passed
+TAG_CLEANUP_DELAY = FOLLOW_UP_JOB_DELAY + timedelta(
+    minutes=settings.TAG_GC_GRACE_PERIOD_MINUTES
+)
+
 
 async def _get_user_tag_dict(
     tag_name: str,
@@ -78,26 +85,28 @@ async def get_or_create_user_tags(
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> list[TagModel | TagSchema]:
+    # Not committed, the caller links the tags in the same transaction,
+    # while the existing ones are locked against the tag garbage collection
+    tag_names = list(dict.fromkeys(tag_name.strip() for tag_name in tag_names))
+    owned_tags: dict[str, TagModel] = await get_owned_tags_for_share(
+        db=db, tag_names=tag_names, user_id=current_user.id
+    )
     tags: list[TagSchema | TagModel] = []
     for tag_name in tag_names:
-        tag_dict: dict[str, Any] | None = await _get_user_tag_dict(
-            tag_name=tag_name, current_user=current_user, db=db
-        )
-        if tag_dict is None:
-            tag_create_internal = TagCreateInternal(tag_name=tag_name.strip())
-            tag_model: TagModel = await crud_tags.create(
-                db=db, object=tag_create_internal
-            )
+        tag_model: TagModel | None = owned_tags.get(tag_name)
+        if tag_model is None:
+            tag_create_internal = TagCreateInternal(tag_name=tag_name)
+            tag_model = TagModel(**tag_create_internal.model_dump())
+            db.add(tag_model)
+            await db.flush()
             user_tag_create_internal = UserTagCreateInternal(
                 user_id=current_user.id,
                 user_uuid=current_user.uuid,
                 tag_id=tag_model.id,
                 tag_uuid=tag_model.uuid,
             )
-            await crud_user_tag.create(db=db, object=user_tag_create_internal)
-            tags.append(tag_model)
-        else:
-            tags.append(TagSchema(**tag_dict))
+            db.add(UserTagModel(**user_tag_create_internal.model_dump()))
+        tags.append(tag_model)
 
     return tags
 
@@ -115,26 +124,28 @@ async def get_or_create_group_tags(
     group: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> list[TagModel | TagSchema]:
+    # Not committed, the caller links the tags in the same transaction,
+    # while the existing ones are locked against the tag garbage collection
+    tag_names = list(dict.fromkeys(tag_name.strip() for tag_name in tag_names))
+    owned_tags: dict[str, TagModel] = await get_owned_tags_for_share(
+        db=db, tag_names=tag_names, group_id=group.id
+    )
     tags: list[TagSchema | TagModel] = []
     for tag_name in tag_names:
-        tag_dict: dict[str, Any] | None = await _get_group_tag_dict(
-            tag_name=tag_name, group=group, db=db
-        )
-        if tag_dict is None:
-            tag_create_internal = TagCreateInternal(tag_name=tag_name.strip())
-            tag_model: TagModel = await crud_tags.create(
-                db=db, object=tag_create_internal
-            )
+        tag_model: TagModel | None = owned_tags.get(tag_name)
+        if tag_model is None:
+            tag_create_internal = TagCreateInternal(tag_name=tag_name)
+            tag_model = TagModel(**tag_create_internal.model_dump())
+            db.add(tag_model)
+            await db.flush()
             group_tag_create_internal = GroupTagCreateInternal(
                 group_id=group.id,
                 group_uuid=group.uuid,
                 tag_id=tag_model.id,
                 tag_uuid=tag_model.uuid,
             )
-            await crud_group_tag.create(db=db, object=group_tag_create_internal)
-            tags.append(tag_model)
-        else:
-            tags.append(TagSchema(**tag_dict))
+            db.add(GroupTagModel(**group_tag_create_internal.model_dump()))
+        tags.append(tag_model)
 
     return tags
 
@@ -187,3 +198,21 @@ async def get_non_deleted_group_tags(
         tags.append(TagSchema(**tag_dict))
 
     return tags
+
+
+async def schedule_user_tag_cleanup(current_user: UserSchema) -> None:
+    await enqueue_follow_up_job(
+        "cleanup_owner_tags",
+        deduplication_key=f"user:{current_user.id}",
+        defer_by=TAG_CLEANUP_DELAY,
+        user_id=current_user.id,
+    )
+
+
+async def schedule_group_tag_cleanup(group: GroupSchema) -> None:
+    await enqueue_follow_up_job(
+        "cleanup_owner_tags",
+        deduplication_key=f"group:{group.id}",
+        defer_by=TAG_CLEANUP_DELAY,
+        group_id=group.id,
+    )
@@ -2,104 +2,170 @@ import uuid as uuid_pkg
 from typing import Annotated, Any
 
 from fastapi import Depends, Path
-from fastcrud import JoinConfig
-from pydantic import BaseModel
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....core.db.database import async_get_db
-from ....core.exceptions.http_exceptions import (
-    ForbiddenException,
-    NotFoundException,
-)
 from ....crud.crud_transactions import crud_transactions
-from ....models.links.group_transaction import (
-    GroupTransaction as GroupTransactionModel,
-)
-from ....models.links.user_transaction import (
-    UserTransaction as UserTransactionModel,
-)
+from ....models.group import Group as GroupModel
+from ....models.links.group_user import GroupUser as GroupUserModel
 from ....models.transaction import Transaction as TransactionModel
 from ....schemas.group import Group as GroupSchema
 from ....schemas.transaction import Transaction as TransactionSchema
 from ....schemas.user import User as UserSchema
 from ...dependencies import get_current_user
-from .group import get_non_deleted_user_group
+from .access import AccessDenial, get_access_denial, raise_for_access_denial
 
+TRANSACTION_NOT_FOUND_DETAIL = "Transaction does not exist or has been deleted."
 
-async def get_non_deleted_transaction_uuid(
-    *,
+
+async def get_transaction_uuid(
     transaction_uuid: uuid_pkg.UUID = Path(
         examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
         description="UUID of the transaction",
     ),
-    current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> uuid_pkg.UUID:
-    # Check if transaction exists
-    transaction_exists: bool = await crud_transactions.exists(
-        db=db, uuid=transaction_uuid, is_deleted=False
-    )
-    if not transaction_exists:
-        raise NotFoundException(
-            "Transaction does not exist or has been deleted."
-        )
-
     return transaction_uuid
 
 
 async def get_non_deleted_user_transaction(
-    transaction_uuid: Annotated[
-        uuid_pkg.UUID, Depends(get_non_deleted_transaction_uuid)
-    ],
+    transaction_uuid: Annotated[uuid_pkg.UUID, Depends(get_transaction_uuid)],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> TransactionSchema:
-    # Check if user has access to transaction
-    user_transaction_join_config = JoinConfig(
-        model=UserTransactionModel,
-        join_on=UserTransactionModel.transaction_id == TransactionModel.id,
-        schema_to_select=BaseModel,
-        filters={"user_id": current_user.id},
+    transaction_dict: dict[str, Any] | None = await crud_transactions.get(
+        db=db, uuid=transaction_uuid, schema_to_select=TransactionSchema
     )
-    transaction_dict: dict[str, Any] | None = (
-        await crud_transactions.get_joined(
-            db=db,
-            uuid=transaction_uuid,
-            is_deleted=False,
-            joins_config=[user_transaction_join_config],
-            schema_to_select=TransactionSchema,
-        )
+    access_denial = get_access_denial(
+        found=transaction_dict is not None,
+        deleted=transaction_dict is not None and transaction_dict["is_deleted"],
+        allowed=(
+            transaction_dict is not None
+            and transaction_dict["owner_user_id"] == current_user.id
+        ),
+    )
+    raise_for_access_denial(
+        access_denial,
+        not_found_detail=TRANSACTION_NOT_FOUND_DETAIL,
+        forbidden_detail="User does not have access to transaction.",
     )
-    if transaction_dict is None:
-        raise ForbiddenException("User does not have access to transaction.")
 
     return TransactionSchema.model_validate(transaction_dict)
 
 
-async def get_non_deleted_group_transaction(
-    transaction_uuid: Annotated[
-        uuid_pkg.UUID, Depends(get_non_deleted_transaction_uuid)
-    ],
-    group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+async def get_non_deleted_user_transactions(
+    transaction_uuids: list[uuid_pkg.UUID],
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
-) -> TransactionSchema:
-    # Check if group has access to transaction
-    group_transaction_join_config = JoinConfig(
-        model=GroupTransactionModel,
-        join_on=GroupTransactionModel.transaction_id == TransactionModel.id,
-        schema_to_select=BaseModel,
-        filters={"group_id": group_schema.id},
+) -> list[TransactionSchema]:
+    unique_uuids = list(dict.fromkeys(transaction_uuids))
+    statement = select(TransactionModel).filter(
+        TransactionModel.uuid.in_(unique_uuids)
     )
-    transaction_dict: dict[str, Any] | None = (
-        await crud_transactions.get_joined(
-            db=db,
-            uuid=transaction_uuid,
-            is_deleted=False,
-            joins_config=[group_transaction_join_config],
-            schema_to_select=TransactionSchema,
+    transaction_models = {
+        transaction_model.uuid: transaction_model
+        for transaction_model in (await db.execute(statement)).scalars()
+    }
+
+    result = []
+    for transaction_uuid in unique_uuids:
+        transaction_model = transaction_models.get(transaction_uuid)
+        raise_for_access_denial(
+            get_access_denial(
+                found=transaction_model is not None,
+                deleted=(
+                    transaction_model is not None
+                    and transaction_model.is_deleted
+                ),
+                allowed=(
+                    transaction_model is not None
+                    and transaction_model.owner_user_id == current_user.id
+                ),
+            ),
+            not_found_detail=TRANSACTION_NOT_FOUND_DETAIL,
+            forbidden_detail="User does not have access to transaction.",
         )
+        result.append(TransactionSchema.model_validate(vars(transaction_model)))
+
+    return result
+
+
+async def get_non_deleted_group_and_transaction(
+    group_uuid: uuid_pkg.UUID,
+    transaction_uuid: Annotated[uuid_pkg.UUID, Depends(get_transaction_uuid)],
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+) -> tuple[GroupSchema, TransactionSchema]:
+    # Group, membership and transaction are loaded in a single query
+    statement = (
+        select(
+            GroupModel,
+            TransactionModel,
+            GroupUserModel.user_id.is_not(None).label("is_member"),
+        )
+        .outerjoin(
+            GroupUserModel,
+            and_(
+                GroupUserModel.group_id == GroupModel.id,
+                GroupUserModel.user_id == current_user.id,
+            ),
+        )
+        .outerjoin(TransactionModel, TransactionModel.uuid == transaction_uuid)
+        .filter(GroupModel.uuid == group_uuid)
     )
-    if transaction_dict is None:
-        raise ForbiddenException("Group does not have access to transaction.")
+    row = (await db.execute(statement)).one_or_none()
 
-    return TransactionSchema.model_validate(transaction_dict)
+    group_access_denial = (
+        AccessDenial.NOT_FOUND
+        if row is None
+        else get_access_denial(
+            found=True,
+            deleted=row.Group.is_deleted,
+            allowed=row.is_member,
+        )
+    )
+    raise_for_access_denial(
+        group_access_denial,
+        not_found_detail="Group not found.",
+        forbidden_detail="User does not have access to group.",
+    )
+
+    transaction_model: TransactionModel | None = row.Transaction  # type: ignore
+    group_model: GroupModel = row.Group  # type: ignore
+    raise_for_access_denial(
+        get_access_denial(
+            found=transaction_model is not None,
+            deleted=(
+                transaction_model is not None and transaction_model.is_deleted
+            ),
+            allowed=(
+                transaction_model is not None
+                and transaction_model.owner_group_id == group_model.id
+            ),
+        ),
+        not_found_detail=TRANSACTION_NOT_FOUND_DETAIL,
+        forbidden_detail="Group does not have access to transaction.",
+    )
+
+    return (
+        GroupSchema.model_validate(vars(group_model)),
+        TransactionSchema.model_validate(vars(transaction_model)),
+    )
+
+
+async def get_non_deleted_transaction_group(
+    group_and_transaction: Annotated[
+        tuple[GroupSchema, TransactionSchema],
+        Depends(get_non_deleted_group_and_transaction),
+    ],
+) -> GroupSchema:
+    return group_and_transaction[0]
+
+
+async def get_non_deleted_group_transaction(
+    group_and_transaction: Annotated[
+        tuple[GroupSchema, TransactionSchema],
+        Depends(get_non_deleted_group_and_transaction),
+    ],
+) -> TransactionSchema:
+    return group_and_transaction[1]
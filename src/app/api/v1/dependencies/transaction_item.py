@@ -1,3 +1,4 @@
+import uuid as uuid_pkg
 from typing import Annotated, Any
 
 from fastapi import Depends
@@ -7,7 +8,7 @@ from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....core.db.database import async_get_db
-from ....crud.crud_tags import crud_tags
+from ....crud.crud_tags import crud_tags, touch_tags_of_transaction_items
 from ....crud.crud_transaction_item import crud_transaction_item
 from ....crud.links.crud_transaction_item_tag import crud_transaction_item_tag
 from ....crud.links.crud_transaction_transaction_item import (
@@ -16,9 +17,6 @@ from ....crud.links.crud_transaction_transaction_item import (
 from ....models.links.transaction_item_tag import (
     TransactionItemTag as TransactionItemTagModel,
 )
-from ....models.links.transaction_transaction_item import (
-    TransactionTransactionItem as TransactionTransactionItemModel,
-)
 from ....models.purchase_category import (
     PurchaseCategory as PurchaseCategoryModel,
 )
@@ -49,12 +47,18 @@ from ....schemas.user import User as UserSchema
 from ...dependencies import get_current_user
 from .group import get_non_deleted_user_group
 from .purchase_category import (
-    get_non_deleted_group_purchase_category,
-    get_non_deleted_user_purchase_category,
+    get_non_deleted_group_purchase_categories,
+    get_non_deleted_user_purchase_categories,
+)
+from .tag import (
+    get_or_create_group_tags,
+    get_or_create_user_tags,
+    schedule_group_tag_cleanup,
+    schedule_user_tag_cleanup,
 )
-from .tag import get_or_create_group_tags, get_or_create_user_tags
 from .transaction import (
     get_non_deleted_group_transaction,
+    get_non_deleted_transaction_group,
     get_non_deleted_user_transaction,
 )
 
@@ -63,6 +67,9 @@ async def remove_tags_from_transaction_item(
     transaction_item: TransactionItemSchema | TransactionItemModel,
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> None:
+    await touch_tags_of_transaction_items(
+        db=db, transaction_item_ids=[transaction_item.id]
+    )
     try:
         await crud_transaction_item_tag.delete(
             db=db,
@@ -71,7 +78,6 @@ async def remove_tags_from_transaction_item(
         )
     except NoResultFound:
         pass
-    # TODO: Remove orphaned tags (from user_tags table or group_tags table)
 
 
 async def add_user_tags_to_transaction_item(
@@ -86,16 +92,20 @@ async def add_user_tags_to_transaction_item(
         db=db,
     )
 
+    # One commit with the tags, which are locked until then
     for tag in tags:
-        await crud_transaction_item_tag.create(
-            db=db,
-            object=TransactionItemTagCreateInternal(
-                transaction_item_id=transaction_item.id,
-                transaction_item_uuid=transaction_item.uuid,
-                tag_id=tag.id,
-                tag_uuid=tag.uuid,
-            ),
+        transaction_item_tag_create_internal = TransactionItemTagCreateInternal(
+            transaction_item_id=transaction_item.id,
+            transaction_item_uuid=transaction_item.uuid,
+            tag_id=tag.id,
+            tag_uuid=tag.uuid,
+        )
+        db.add(
+            TransactionItemTagModel(
+                **transaction_item_tag_create_internal.model_dump()
+            )
         )
+    await db.commit()
 
 
 async def add_group_tags_to_transaction_item(
@@ -110,16 +120,20 @@ async def add_group_tags_to_transaction_item(
         db=db,
     )
 
+    # One commit with the tags, which are locked until then
     for tag in tags:
-        await crud_transaction_item_tag.create(
-            db=db,
-            object=TransactionItemTagCreateInternal(
-                transaction_item_id=transaction_item.id,
-                transaction_item_uuid=transaction_item.uuid,
-                tag_id=tag.id,
-                tag_uuid=tag.uuid,
-            ),
+        transaction_item_tag_create_internal = TransactionItemTagCreateInternal(
+            transaction_item_id=transaction_item.id,
+            transaction_item_uuid=transaction_item.uuid,
+            tag_id=tag.id,
+            tag_uuid=tag.uuid,
         )
+        db.add(
+            TransactionItemTagModel(
+                **transaction_item_tag_create_internal.model_dump()
+            )
+        )
+    await db.commit()
 
 
 async def get_tags_for_transaction_item(
@@ -158,21 +172,12 @@ async def remove_user_transaction_items(
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> None:
-    transaction_transaction_item_join_config = JoinConfig(
-        model=TransactionTransactionItemModel,
-        join_on=(
-            TransactionTransactionItemModel.transaction_item_id
-            == TransactionItemModel.id
-        ),
-        schema_to_select=BaseModel,
-        filters={"transaction_id": transaction.id},
-    )
-    crud_data: dict[str, Any] = await crud_transaction_item.get_multi_joined(
+    crud_data: dict[str, Any] = await crud_transaction_item.get_multi(
         db=db,
+        transaction_id=transaction.id,
         is_deleted=False,
         return_as_model=True,
         schema_to_select=TransactionItemSchema,
-        joins_config=[transaction_transaction_item_join_config],
         limit=9999,
     )
     transaction_items = crud_data["data"]
@@ -186,7 +191,7 @@ async def remove_user_transaction_items(
             transaction_item_id=transaction_item.id,
         )
         await crud_transaction_item.delete(db=db, id=transaction_item.id)
-    # TODO: Remove orphaned tags (from user_tags table or group_tags table)
+    await schedule_user_tag_cleanup(current_user=current_user)
 
 
 async def remove_group_transaction_items(
@@ -194,21 +199,12 @@ async def remove_group_transaction_items(
     group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> None:
-    transaction_transaction_item_join_config = JoinConfig(
-        model=TransactionTransactionItemModel,
-        join_on=(
-            TransactionTransactionItemModel.transaction_item_id
-            == TransactionItemModel.id
-        ),
-        schema_to_select=BaseModel,
-        filters={"transaction_id": transaction.id},
-    )
-    crud_data: dict[str, Any] = await crud_transaction_item.get_multi_joined(
+    crud_data: dict[str, Any] = await crud_transaction_item.get_multi(
         db=db,
+        transaction_id=transaction.id,
         is_deleted=False,
         return_as_model=True,
         schema_to_select=TransactionItemSchema,
-        joins_config=[transaction_transaction_item_join_config],
         limit=9999,
     )
     transaction_items = crud_data["data"]
@@ -222,7 +218,7 @@ async def remove_group_transaction_items(
             transaction_item_id=transaction_item.id,
         )
         await crud_transaction_item.delete(db=db, id=transaction_item.id)
-    # TODO: Remove orphaned tags (from user_tags table or group_tags table)
+    await schedule_group_tag_cleanup(group=group_schema)
 
 
 async def create_user_transaction_items(
@@ -231,16 +227,23 @@ async def create_user_transaction_items(
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> list[TransactionItemSchema | TransactionItemModel]:
+    # Get purchase categories
+    purchase_categories: dict[uuid_pkg.UUID, PurchaseCategorySchema] = (
+        await get_non_deleted_user_purchase_categories(
+            purchase_category_uuids=[
+                transaction_item.purchase_category_uuid
+                for transaction_item in transaction_items
+            ],
+            current_user=current_user,
+            db=db,
+        )
+    )
+
     result = []
     for transaction_item in transaction_items:
-        # Get purchase category
-        purchase_category_schema: PurchaseCategorySchema = (
-            await get_non_deleted_user_purchase_category(
-                purchase_category_uuid=transaction_item.purchase_category_uuid,
-                current_user=current_user,
-                db=db,
-            )
-        )
+        purchase_category_schema = purchase_categories[
+            transaction_item.purchase_category_uuid
+        ]
 
         transaction_item_create_internal: TransactionItemCreateInternal = (
             TransactionItemCreateInternal(
@@ -249,6 +252,10 @@ async def create_user_transaction_items(
                 ),
                 purchase_category_id=purchase_category_schema.id,
                 purchase_category_uuid=purchase_category_schema.uuid,
+                transaction_id=transaction.id,
+                timestamp=transaction.timestamp,
+                currency=transaction.currency,
+                owner_user_id=current_user.id,
             )
         )
         transaction_item_model: TransactionItemModel = (
@@ -285,16 +292,23 @@ async def create_group_transaction_items(
     group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> list[TransactionItemSchema | TransactionItemModel]:
+    # Get purchase categories
+    purchase_categories: dict[uuid_pkg.UUID, PurchaseCategorySchema] = (
+        await get_non_deleted_group_purchase_categories(
+            purchase_category_uuids=[
+                transaction_item.purchase_category_uuid
+                for transaction_item in transaction_items
+            ],
+            group=group_schema,
+            db=db,
+        )
+    )
+
     result = []
     for transaction_item in transaction_items:
-        # Get purchase category
-        purchase_category_schema: PurchaseCategorySchema = (
-            await get_non_deleted_group_purchase_category(
-                purchase_category_uuid=transaction_item.purchase_category_uuid,
-                group=group_schema,
-                db=db,
-            )
-        )
+        purchase_category_schema = purchase_categories[
+            transaction_item.purchase_category_uuid
+        ]
 
         transaction_item_create_internal: TransactionItemCreateInternal = (
             TransactionItemCreateInternal(
@@ -303,6 +317,10 @@ async def create_group_transaction_items(
                 ),
                 purchase_category_id=purchase_category_schema.id,
                 purchase_category_uuid=purchase_category_schema.uuid,
+                transaction_id=transaction.id,
+                timestamp=transaction.timestamp,
+                currency=transaction.currency,
+                owner_group_id=group_schema.id,
             )
         )
         transaction_item_model: TransactionItemModel = (
@@ -341,21 +359,12 @@ async def get_user_transaction_items(
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> list[TransactionItemSchema]:
-    transaction_transaction_item_join_config = JoinConfig(
-        model=TransactionTransactionItemModel,
-        join_on=(
-            TransactionTransactionItemModel.transaction_item_id
-            == TransactionItemModel.id
-        ),
-        schema_to_select=BaseModel,
-        filters={"transaction_id": transaction.id},
-    )
-    crud_data: dict[str, Any] = await crud_transaction_item.get_multi_joined(
+    crud_data: dict[str, Any] = await crud_transaction_item.get_multi(
         db=db,
+        transaction_id=transaction.id,
         is_deleted=False,
         return_as_model=True,
         schema_to_select=TransactionItemSchema,
-        joins_config=[transaction_transaction_item_join_config],
         limit=9999,
     )
     return crud_data["data"]
@@ -366,24 +375,17 @@ async def get_group_transaction_items(
         TransactionSchema | TransactionModel,
         Depends(get_non_deleted_group_transaction),
     ],
-    group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+    group_schema: Annotated[
+        GroupSchema, Depends(get_non_deleted_transaction_group)
+    ],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> list[TransactionItemSchema]:
-    transaction_transaction_item_join_config = JoinConfig(
-        model=TransactionTransactionItemModel,
-        join_on=(
-            TransactionTransactionItemModel.transaction_item_id
-            == TransactionItemModel.id
-        ),
-        schema_to_select=BaseModel,
-        filters={"transaction_id": transaction.id},
-    )
-    crud_data: dict[str, Any] = await crud_transaction_item.get_multi_joined(
+    crud_data: dict[str, Any] = await crud_transaction_item.get_multi(
         db=db,
+        transaction_id=transaction.id,
         is_deleted=False,
         return_as_model=True,
         schema_to_select=TransactionItemSchema,
-        joins_config=[transaction_transaction_item_join_config],
         limit=9999,
     )
     return crud_data["data"]
@@ -393,15 +395,6 @@ async def get_transaction_items_with_data(
     transaction_dict: dict[str, Any],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> dict[str, Any]:
-    transaction_transaction_items_join_config = JoinConfig(
-        model=TransactionTransactionItemModel,
-        join_on=(
-            TransactionTransactionItemModel.transaction_item_id
-            == TransactionItemModel.id
-        ),
-        schema_to_select=BaseModel,
-        filters={"transaction_id": transaction_dict["id"]},
-    )
     purchase_category_join_config = JoinConfig(
         model=PurchaseCategoryModel,
         join_on=(
@@ -413,11 +406,9 @@ async def get_transaction_items_with_data(
     transaction_items_crud_data: dict[str, Any] = (
         await crud_transaction_item.get_multi_joined(
             db=db,
+            transaction_id=transaction_dict["id"],
             is_deleted=False,
-            joins_config=[
-                transaction_transaction_items_join_config,
-                purchase_category_join_config,
-            ],
+            joins_config=[purchase_category_join_config],
             return_as_model=False,
             schema_to_select=TransactionItemSchema,
             limit=9999,
@@ -4,15 +4,16 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Body, Depends, Path, Query, Request
 from fastcrud import JoinConfig
 from fastcrud.paginated import PaginatedListResponse, paginated_response
-from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import async_get_db
+from ...core.db.database import async_get_db, async_get_read_db
 from ...core.exceptions.http_exceptions import (
     ForbiddenException,
     NotFoundException,
 )
+from ...core.schemas.job import JobHandle
 from ...core.schemas.utils import Message
+from ...core.utils.queue import enqueue_job
 from ...crud.crud_groups import crud_groups
 from ...crud.links.crud_group_user import crud_group_user
 from ...models.group import Group as GroupModel
@@ -25,9 +26,17 @@ from ...schemas.group import (
     GroupReadWithUserRole,
     GroupUpdate,
 )
-from ...schemas.links.group_user import GroupUserBase, GroupUserCreateInternal
+from ...schemas.links.group_user import (
+    GroupMembership,
+    GroupUserBase,
+    GroupUserCreateInternal,
+)
 from ...schemas.user import User as UserSchema
 from ..dependencies import get_current_user
+from .dependencies.group_membership import (
+    get_group_membership,
+    invalidate_group_membership,
+)
 
 router = APIRouter(tags=["Group"])
 
@@ -63,7 +72,7 @@ async def get_groups(
     *,
     request: Request,
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     items_per_page: Annotated[int, Query(ge=1, le=100)] = 10,
 ) -> Any:
@@ -97,7 +106,7 @@ async def get_group(
         ),
     ],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
 ) -> Any:
     # Check if group exists
     group_exists: bool = await crud_groups.exists(
@@ -145,37 +154,23 @@ async def update_group(
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> Message:
     # Check if group exists
-    group_exists: bool = await crud_groups.exists(
-        db=db, uuid=group_uuid, is_deleted=False
+    membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=current_user.id
     )
-    if not group_exists:
+    if membership is None or membership.group_is_deleted:
         raise NotFoundException(
             "The group does not exist or has been deleted from the system."
         )
 
     # Check if user has permission to update the group
-    group_user_join_config = JoinConfig(
-        model=GroupUserModel,
-        join_on=GroupUserModel.group_id == GroupModel.id,
-        schema_to_select=BaseModel,
-        filters={"user_id": current_user.id, "user_role": UserRole.ADMIN},
-    )
-    group_dict: dict[str, Any] | None = await crud_groups.get_joined(
-        db=db,
-        uuid=group_uuid,
-        is_deleted=False,
-        joins_config=[group_user_join_config],
-        return_as_model=True,
-        schema_to_select=GroupRead,
-    )
-    if group_dict is None:
+    if not membership.is_admin:
         raise ForbiddenException()
 
     await crud_groups.update(db=db, uuid=group_uuid, object=group_update)
     return Message(message="Group updated successfully")
 
 
-@router.delete("/group/{group_uuid}", response_model=Message)
+@router.delete("/group/{group_uuid}", response_model=JobHandle)
 async def delete_group(
     *,
     request: Request,
@@ -188,28 +183,25 @@ async def delete_group(
     ],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
-) -> Message:
+) -> JobHandle:
     # Check if group exists
-    group_exists: bool = await crud_groups.exists(db=db, uuid=group_uuid)
-    if not group_exists:
+    membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=current_user.id
+    )
+    if membership is None:
         raise NotFoundException("The group does not exist.")
 
     # Check if user has permission to delete the group
-    group_user_join_config = JoinConfig(
-        model=GroupUserModel,
-        join_on=GroupUserModel.group_id == GroupModel.id,
-        schema_to_select=GroupUserBase,
-        filters={"user_id": current_user.id, "user_role": UserRole.ADMIN},
-    )
-    group_dict: dict[str, Any] | None = await crud_groups.get_joined(
-        db=db,
-        uuid=group_uuid,
-        joins_config=[group_user_join_config],
-        return_as_model=True,
-        schema_to_select=GroupRead,
-    )
-    if group_dict is None:
+    if not membership.is_admin:
         raise ForbiddenException()
 
     await crud_groups.delete(db=db, uuid=group_uuid)
-    return Message(message="Group deleted successfully")
+    await invalidate_group_membership(group_uuid=group_uuid)
+    # The group's data is deleted in the background, see the tasks endpoint
+    cascade_job = await enqueue_job(
+        "cascade_delete", group_id=membership.group_id
+    )
+    return JobHandle(
+        message="Group deleted successfully",
+        job_id=cascade_job.job_id if cascade_job is not None else None,
+    )
@@ -10,29 +10,27 @@ from fastcrud.paginated import (
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import async_get_db
+from ...core.db.database import async_get_db, async_get_read_db
 from ...core.exceptions.http_exceptions import (
     ForbiddenException,
     NotFoundException,
 )
 from ...core.schemas.utils import Message
-from ...crud.crud_groups import crud_groups
 from ...crud.crud_purchase_categories import crud_purchase_categories
 from ...crud.crud_transactions import crud_transactions
 from ...crud.links.crud_group_purchase_category import (
     crud_group_purchase_category,
 )
-from ...crud.links.crud_group_user import crud_group_user
 from ...models.links.group_purchase_category import (
     GroupPurchaseCategory as GroupPurchaseCategoryModel,
 )
 from ...models.purchase_category import (
     PurchaseCategory as PurchaseCategoryModel,
 )
-from ...schemas.group import Group as GroupSchema
 from ...schemas.links.group_purchase_category import (
     GroupPurchaseCategoryCreateInternal,
 )
+from ...schemas.links.group_user import GroupMembership
 from ...schemas.purchase_category import (
     PurchaseCategoryCreate,
     PurchaseCategoryCreateInternal,
@@ -41,6 +39,7 @@ from ...schemas.purchase_category import (
 )
 from ...schemas.user import User as UserSchema
 from ..dependencies import get_current_user
+from .dependencies.group_membership import get_group_membership
 
 router = APIRouter(tags=["Group Purchase Category"])
 
@@ -65,21 +64,14 @@ async def create_group_purchase_category(
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> Any:
     # Check if group exists
-    group_schema: GroupSchema | None = await crud_groups.get(
-        db=db,
-        uuid=group_uuid,
-        is_deleted=False,
-        return_as_model=True,
-        schema_to_select=GroupSchema,
+    membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=current_user.id
     )
-    if group_schema is None:
+    if membership is None or membership.group_is_deleted:
         raise NotFoundException("The group with this UUID does not exist.")
 
     # Check if user is a member of the group
-    user_is_member: bool = await crud_group_user.exists(
-        db=db, user_id=current_user.id, group_id=group_schema.id
-    )
-    if not user_is_member:
+    if not membership.is_member:
         raise ForbiddenException(
             "You are not a member of the group with this UUID."
         )
@@ -99,8 +91,8 @@ async def create_group_purchase_category(
         await crud_group_purchase_category.create(
             db=db,
             object=GroupPurchaseCategoryCreateInternal(
-                group_id=group_schema.id,
-                group_uuid=group_schema.uuid,
+                group_id=membership.group_id,
+                group_uuid=membership.group_uuid,
                 purchase_category_id=purchase_category_model.id,
                 purchase_category_uuid=purchase_category_model.uuid,
             ),
@@ -125,24 +117,19 @@ async def get_group_purchase_categories(
         ),
     ],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: int = Query(ge=1, default=1),
     items_per_page: int = Query(ge=1, le=100, default=10),
 ) -> Any:
     # Check if group exists
-    group_exists: bool = await crud_groups.exists(
-        db=db, uuid=group_uuid, is_deleted=False
+    membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=current_user.id
     )
-    if not group_exists:
+    if membership is None or membership.group_is_deleted:
         raise NotFoundException("The group with this UUID does not exist.")
 
     # Check if user is a member of the group
-    user_is_member: bool = await crud_group_user.exists(
-        db=db,
-        user_id=current_user.id,
-        group_uuid=group_uuid,
-    )
-    if not user_is_member:
+    if not membership.is_member:
         raise ForbiddenException(
             "You are not a member of the group with this UUID."
         )
@@ -195,19 +182,14 @@ async def update_group_purchase_category(
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> Message:
     # Check if group exists
-    group_exists: bool = await crud_groups.exists(
-        db=db, uuid=group_uuid, is_deleted=False
+    membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=current_user.id
     )
-    if not group_exists:
+    if membership is None or membership.group_is_deleted:
         raise NotFoundException("The group with this UUID does not exist.")
 
     # Check if user is a member of the group
-    user_is_member: bool = await crud_group_user.exists(
-        db=db,
-        user_id=current_user.id,
-        group_uuid=group_uuid,
-    )
-    if not user_is_member:
+    if not membership.is_member:
         raise ForbiddenException(
             "You are not a member of the group with this UUID."
         )
@@ -270,19 +252,14 @@ async def delete_group_purchase_category(
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> Message:
     # Check if group exists
-    group_exists: bool = await crud_groups.exists(
-        db=db, uuid=group_uuid, is_deleted=False
+    membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=current_user.id
     )
-    if not group_exists:
+    if membership is None or membership.group_is_deleted:
         raise NotFoundException("The group with this UUID does not exist.")
 
     # Check if user is a member of the group
-    user_is_member: bool = await crud_group_user.exists(
-        db=db,
-        user_id=current_user.id,
-        group_uuid=group_uuid,
-    )
-    if not user_is_member:
+    if not membership.is_member:
         raise ForbiddenException(
             "You are not a member of the group with this UUID."
         )
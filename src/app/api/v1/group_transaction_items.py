@@ -10,17 +10,10 @@ from fastcrud.paginated import (
 from sqlalchemy import func, not_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import async_get_db
-from ...models.links.group_transaction import (
-    GroupTransaction as GroupTransactionModel,
-)
-from ...models.links.group_user import GroupUser as GroupUserModel
+from ...core.db.database import async_get_read_db
 from ...models.links.transaction_item_tag import (
     TransactionItemTag as TransactionItemTagModel,
 )
-from ...models.links.transaction_transaction_item import (
-    TransactionTransactionItem as TransactionTransactionItemModel,
-)
 from ...models.purchase_category import (
     PurchaseCategory as PurchaseCategoryModel,
 )
@@ -75,7 +68,7 @@ async def get_group_transaction_items(
         Depends(get_optional_non_deleted_group_purchase_category),
     ],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     items_per_page: Annotated[int, Query(ge=1, le=100)] = 10,
 ) -> Any:
@@ -86,19 +79,15 @@ async def get_group_transaction_items(
             PurchaseCategoryModel.category_name,
             PurchaseCategoryModel.category_description,
         )
-        .outerjoin(TransactionTransactionItemModel)
-        .outerjoin(TransactionModel)
-        .add_columns(TransactionModel.uuid, TransactionModel.timestamp)
-        .outerjoin(GroupTransactionModel)
         .outerjoin(
-            GroupUserModel,
-            GroupUserModel.group_id == GroupTransactionModel.group_id,
+            TransactionModel,
+            TransactionModel.id == TransactionItemModel.transaction_id,
         )
+        .add_columns(TransactionModel.uuid)
         .outerjoin(TransactionItemTagModel)
         .outerjoin(TagModel)
         .filter(
-            GroupUserModel.user_id == current_user.id,
-            GroupTransactionModel.group_id == group_schema.id,
+            TransactionItemModel.owner_group_id == group_schema.id,
             not_(TransactionModel.is_deleted),
             not_(TransactionItemModel.is_deleted),
             not_(TagModel.is_deleted),
@@ -119,9 +108,9 @@ async def get_group_transaction_items(
         .limit(items_per_page)
     )
     if before:
-        statement = statement.filter(TransactionModel.timestamp < before)
+        statement = statement.filter(TransactionItemModel.timestamp < before)
     if after:
-        statement = statement.filter(TransactionModel.timestamp > after)
+        statement = statement.filter(TransactionItemModel.timestamp > after)
     if purchase_category_schema:
         statement = statement.filter(
             PurchaseCategoryModel.id == purchase_category_schema.id
@@ -139,7 +128,6 @@ async def get_group_transaction_items(
             "category_description"
         ]
         transaction_item_dict["transaction_uuid"] = row_dict["uuid"]
-        transaction_item_dict["timestamp"] = row_dict["timestamp"]
 
         tags_statement = (
             select(TagModel)
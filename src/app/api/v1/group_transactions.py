@@ -2,33 +2,26 @@ from datetime import UTC, datetime, timedelta
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, Depends, Query, Request
-from fastcrud import JoinConfig
 from fastcrud.paginated import (
     PaginatedListResponse,
     compute_offset,
     paginated_response,
 )
-from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import async_get_db
+from ...core.db.database import async_get_db, async_get_read_db
 from ...core.exceptions.http_exceptions import (
     CustomException,
     UnprocessableEntityException,
 )
+from ...core.responses import ORJSONResponse
 from ...core.schemas.utils import Message
-from ...crud.crud_transaction_item import crud_transaction_item
-from ...crud.crud_transactions import crud_transactions
+from ...crud.crud_transactions import crud_transactions, delete_transactions
 from ...crud.links.crud_group_transaction import crud_group_transactions
-from ...crud.links.crud_transaction_transaction_item import (
-    crud_transaction_transaction_item,
-)
-from ...models.links.group_transaction import (
-    GroupTransaction as GroupTransactionModel,
-)
 from ...models.transaction import Transaction as TransactionModel
 from ...schemas.group import Group as GroupSchema
 from ...schemas.links.group_transaction import GroupTransactionCreateInternal
+from ...schemas.mixins.amount import to_minor_units
 from ...schemas.purchase_category import (
     PurchaseCategory as PurchaseCategorySchema,
 )
@@ -40,7 +33,6 @@ from ...schemas.transaction import (
     TransactionUpdate,
     TransactionUpdateInternal,
 )
-from ...schemas.transaction_item import TransactionItem as TransactionItemSchema
 from ...schemas.transaction_item import TransactionItemCreate
 from ...schemas.user import User as UserSchema
 from ..dependencies import get_current_user
@@ -48,10 +40,13 @@ from .dependencies.group import get_non_deleted_user_group
 from .dependencies.purchase_category import (
     get_optional_non_deleted_group_purchase_category,
 )
-from .dependencies.transaction import get_non_deleted_group_transaction
+from .dependencies.tag import schedule_group_tag_cleanup
+from .dependencies.transaction import (
+    get_non_deleted_group_transaction,
+    get_non_deleted_transaction_group,
+)
 from .dependencies.transaction_item import (
     create_group_transaction_items,
-    get_group_transaction_items,
     get_transaction_items_with_data,
     remove_group_transaction_items,
 )
@@ -115,15 +110,13 @@ async def add_group_transaction(
         transaction_create.transaction_items.append(transaction_item_create)
 
     # Check if transaction_create.amount is the sum of all transaction_items.amount
-    if (
-        sum(
-            [
-                transaction_item.amount
-                for transaction_item in transaction_create.transaction_items
-            ]
-        )
-        != transaction_create.amount
-    ):
+    # Compared in minor units, so float rounding can't break the check
+    if sum(
+        [
+            to_minor_units(transaction_item.amount, transaction_create.currency)
+            for transaction_item in transaction_create.transaction_items
+        ]
+    ) != to_minor_units(transaction_create.amount, transaction_create.currency):
         raise UnprocessableEntityException(
             "Transaction amount should be the sum of all transaction items amount"
         )
@@ -132,7 +125,8 @@ async def add_group_transaction(
     transaction_create_internal = TransactionCreateInternal(
         **transaction_create.model_dump(
             exclude={"purchase_category_uuid", "tag_names", "transaction_items"}
-        )
+        ),
+        owner_group_id=group_schema.id,
     )
     transaction_model: TransactionModel = await crud_transactions.create(
         db=db, object=transaction_create_internal
@@ -187,28 +181,22 @@ async def get_group_transactions(
     ),
     group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     items_per_page: Annotated[int, Query(ge=1, le=100)] = 10,
 ) -> Any:
     # Get transactions
     kwargs = {}
     if before is not None:
-        kwargs["before"] = before
+        kwargs["timestamp__lt"] = before
     if after is not None:
-        kwargs["after"] = after
+        kwargs["timestamp__gt"] = after
 
-    group_transaction_join_config = JoinConfig(
-        model=GroupTransactionModel,
-        join_on=GroupTransactionModel.transaction_id == TransactionModel.id,
-        schema_to_select=BaseModel,
-        filters={"group_id": group_schema.id},
-    )
-    crud_data: dict[str, Any] = await crud_transactions.get_multi_joined(
+    crud_data: dict[str, Any] = await crud_transactions.get_multi(
         db=db,
+        owner_group_id=group_schema.id,
         is_deleted=False,
         **kwargs,
-        joins_config=[group_transaction_join_config],
         return_as_model=False,
         schema_to_select=TransactionSchema,
         offset=compute_offset(page=page, items_per_page=items_per_page),
@@ -221,8 +209,12 @@ async def get_group_transactions(
             )
         )
 
-    return paginated_response(
-        crud_data=crud_data, page=page, items_per_page=items_per_page
+    return ORJSONResponse(
+        PaginatedListResponse[TransactionRead].model_validate(
+            paginated_response(
+                crud_data=crud_data, page=page, items_per_page=items_per_page
+            )
+        )
     )
 
 
@@ -233,12 +225,14 @@ async def get_group_transactions(
 async def get_group_transaction(
     *,
     request: Request,
-    group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+    group_schema: Annotated[
+        GroupSchema, Depends(get_non_deleted_transaction_group)
+    ],
     transaction_schema: Annotated[
         TransactionSchema, Depends(get_non_deleted_group_transaction)
     ],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
 ) -> Any:
     transaction_dict: dict[str, Any] = transaction_schema.model_dump()
 
@@ -262,7 +256,9 @@ async def update_group_transaction(
         TransactionSchema, Depends(get_non_deleted_group_transaction)
     ],
     transaction_update: Annotated[TransactionUpdate, Body()],
-    group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+    group_schema: Annotated[
+        GroupSchema, Depends(get_non_deleted_transaction_group)
+    ],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> Message:
@@ -295,16 +291,19 @@ async def update_group_transaction(
                 "Tags should be provided if transaction_items list is empty"
             )
 
-    # Check if transaction_create.amount is the sum of all transaction_items.amount
-    if (
-        sum(
-            [
-                transaction_item.amount
-                for transaction_item in transaction_update.transaction_items
-            ]
+    if transaction_update.amount is None:
+        raise UnprocessableEntityException(
+            "Transaction amount should be provided"
         )
-        != transaction_update.amount
-    ):
+
+    # Check if transaction_create.amount is the sum of all transaction_items.amount
+    # Compared in minor units, so float rounding can't break the check
+    if sum(
+        [
+            to_minor_units(transaction_item.amount, transaction_update.currency)
+            for transaction_item in transaction_update.transaction_items
+        ]
+    ) != to_minor_units(transaction_update.amount, transaction_update.currency):
         raise UnprocessableEntityException(
             "Transaction amount should be the sum of all transaction items amount"
         )
@@ -338,14 +337,17 @@ async def update_group_transaction(
         group_schema=group_schema,
         db=db,
     )
+    # Items carry a copy of the transaction timestamp and currency
+    updated_transaction_schema = transaction_schema.model_copy(
+        update=transaction_update_internal.model_dump()
+    )
     await create_group_transaction_items(
-        transaction=transaction_schema,
+        transaction=updated_transaction_schema,
         transaction_items=transaction_update.transaction_items,
         group_schema=group_schema,
         db=db,
     )
     # TODO: check if removing and creating transaction items is necessary for performance
-    # TODO: clean up tags that are no longer in use
     return Message(message="Transaction updated successfully.")
 
 
@@ -359,27 +361,13 @@ async def delete_group_transaction(
     transaction_schema: Annotated[
         TransactionSchema, Depends(get_non_deleted_group_transaction)
     ],
-    group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+    group_schema: Annotated[
+        GroupSchema, Depends(get_non_deleted_transaction_group)
+    ],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> Message:
-    # Get transaction items
-    transaction_items: list[TransactionItemSchema] = (
-        await get_group_transaction_items(
-            transaction=transaction_schema,
-            group_schema=group_schema,
-            db=db,
-        )
-    )
-    for transaction_item in transaction_items:
-        await crud_transaction_transaction_item.delete(
-            db=db,
-            transaction_id=transaction_schema.id,
-            transaction_item_id=transaction_item.id,
-        )
-        await crud_transaction_item.delete(db=db, uuid=transaction_item.uuid)
-
-    # Delete transaction
-    await crud_transactions.delete(db=db, uuid=transaction_schema.uuid)
-    # TODO: clean up tags that are no longer in use
+    # Delete transaction and its items
+    await delete_transactions(db=db, transactions=[transaction_schema])
+    await schedule_group_tag_cleanup(group=group_schema)
     return Message(message="Transaction deleted successfully.")
@@ -15,25 +15,28 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...models.user import User as UserModel
 
-from ...core.db.database import async_get_db
+from ...core.db.database import async_get_db, async_get_read_db
 from ...core.exceptions.http_exceptions import (
     ForbiddenException,
     NotFoundException,
 )
 from ...core.schemas.utils import Message
-from ...crud.crud_groups import crud_groups
 from ...crud.crud_users import crud_users
 from ...crud.links.crud_group_user import crud_group_user
 from ...models.links.group_user import UserRole
 from ...models.links.group_user import GroupUser as GroupUserModel
-from ...schemas.group import Group as GroupSchema
 from ...schemas.links.group_user import (
+    GroupMembership,
     GroupUserBase,
     GroupUserCreateInternal,
     GroupUserUpdateInternal,
 )
 from ...schemas.user import User as UserSchema, UserReadWithUserRole
 from ..dependencies import get_current_user
+from .dependencies.group_membership import (
+    get_group_membership,
+    invalidate_group_membership,
+)
 
 router = APIRouter(tags=["Group Members"])
 
@@ -76,24 +79,14 @@ async def add_group_user(
         raise ForbiddenException("You cannot add yourself to a group")
 
     # Check if group exists
-    group_schema: GroupSchema | None = await crud_groups.get(
-        db=db,
-        uuid=group_uuid,
-        is_deleted=False,
-        return_as_model=True,
-        schema_to_select=GroupSchema,
+    membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=current_user.id
     )
-    if group_schema is None:
+    if membership is None or membership.group_is_deleted:
         raise NotFoundException("The group with this UUID does not exist")
 
     # Check if user is in the group and is an admin
-    user_has_permission: bool = await crud_group_user.exists(
-        db=db,
-        group_uuid=group_uuid,
-        user_uuid=current_user.uuid,
-        user_role=UserRole.ADMIN,
-    )
-    if not user_has_permission:
+    if not membership.is_admin:
         raise ForbiddenException()
 
     # Check if user exists
@@ -108,10 +101,10 @@ async def add_group_user(
         raise NotFoundException("The user with this UUID does not exist")
 
     # Check if user is already in the group
-    user_in_group: bool = await crud_group_user.exists(
-        db=db, group_uuid=group_uuid, user_uuid=user_schema.uuid
+    user_membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=user_schema.id
     )
-    if user_in_group:
+    if user_membership is not None and user_membership.is_member:
         response.status_code = 200
         return Message(message="User is already in the group")
 
@@ -119,13 +112,16 @@ async def add_group_user(
     await crud_group_user.create(
         db=db,
         object=GroupUserCreateInternal(
-            group_id=group_schema.id,
+            group_id=membership.group_id,
             group_uuid=group_uuid,
             user_id=user_schema.id,
             user_uuid=user_schema.uuid,
             user_role=user_role,
         ),
     )
+    await invalidate_group_membership(
+        group_uuid=group_uuid, user_id=user_schema.id
+    )
     return Message(message="User added to group")
 
 
@@ -144,24 +140,19 @@ async def get_group_users(
         ),
     ],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: int = Query(ge=1, default=1),
     items_per_page: int = Query(ge=1, le=100, default=10),
 ) -> Any:
     # Check if group exists
-    group_exists: bool = await crud_groups.exists(
-        db=db, uuid=group_uuid, is_deleted=False
+    membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=current_user.id
     )
-    if not group_exists:
+    if membership is None or membership.group_is_deleted:
         raise NotFoundException("The group with this UUID does not exist")
 
     # Check if user is in the group
-    user_in_group: bool = await crud_group_user.exists(
-        db=db,
-        group_uuid=group_uuid,
-        user_uuid=current_user.uuid,
-    )
-    if not user_in_group:
+    if not membership.is_member:
         raise ForbiddenException()
 
     # Get group users
@@ -218,24 +209,14 @@ async def change_group_user_role(
         raise ForbiddenException("You cannot change your own role")
 
     # Check if group exists
-    group_schema: GroupSchema | None = await crud_groups.get(
-        db=db,
-        uuid=group_uuid,
-        is_deleted=False,
-        return_as_model=True,
-        schema_to_select=GroupSchema,
+    membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=current_user.id
     )
-    if group_schema is None:
+    if membership is None or membership.group_is_deleted:
         raise NotFoundException("The group with this UUID does not exist")
 
     # Check if user is in the group and is an admin
-    user_has_permission: bool = await crud_group_user.exists(
-        db=db,
-        group_uuid=group_uuid,
-        user_uuid=current_user.uuid,
-        user_role=UserRole.ADMIN,
-    )
-    if not user_has_permission:
+    if not membership.is_admin:
         raise ForbiddenException()
 
     # Check if user exists
@@ -250,10 +231,10 @@ async def change_group_user_role(
         raise NotFoundException("The user with this UUID does not exist")
 
     # Check if user is in the group
-    user_in_group: bool = await crud_group_user.exists(
-        db=db, group_uuid=group_uuid, user_uuid=user_schema.uuid
+    user_membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=user_schema.id
     )
-    if not user_in_group:
+    if user_membership is None or not user_membership.is_member:
         raise NotFoundException("The user is not in the group")
 
     # Change user role
@@ -263,6 +244,9 @@ async def change_group_user_role(
         user_uuid=user_schema.uuid,
         object=GroupUserUpdateInternal(user_role=user_role),
     )
+    await invalidate_group_membership(
+        group_uuid=group_uuid, user_id=user_schema.id
+    )
     return Message(message="User role updated")
 
 
@@ -294,20 +278,14 @@ async def remove_group_user(
         raise ForbiddenException("You cannot remove yourself from the group")
 
     # Check if group exists
-    group_exists: bool = await crud_groups.exists(
-        db=db, uuid=group_uuid, is_deleted=False
+    membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=current_user.id
     )
-    if not group_exists:
+    if membership is None or membership.group_is_deleted:
         raise NotFoundException("The group with this UUID does not exist")
 
     # Check if user is in the group and is an admin
-    user_has_permission: bool = await crud_group_user.exists(
-        db=db,
-        group_uuid=group_uuid,
-        user_uuid=current_user.uuid,
-        user_role=UserRole.ADMIN,
-    )
-    if not user_has_permission:
+    if not membership.is_admin:
         raise ForbiddenException()
 
     # Check if user exists
@@ -322,14 +300,17 @@ async def remove_group_user(
         raise NotFoundException("The user with this UUID does not exist")
 
     # Check if user is in the group
-    user_in_group: bool = await crud_group_user.exists(
-        db=db, group_uuid=group_uuid, user_uuid=user_schema.uuid
+    user_membership: GroupMembership | None = await get_group_membership(
+        db=db, group_uuid=group_uuid, user_id=user_schema.id
     )
-    if not user_in_group:
+    if user_membership is None or not user_membership.is_member:
         raise NotFoundException("The user is not in the group")
 
     # Remove user from group
     await crud_group_user.delete(
         db=db, group_uuid=group_uuid, user_uuid=user_schema.uuid
     )
+    await invalidate_group_membership(
+        group_uuid=group_uuid, user_id=user_schema.id
+    )
     return Message(message="User removed from group")
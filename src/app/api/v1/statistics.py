@@ -5,19 +5,13 @@ from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy import func, not_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import async_get_db
-from ...models.links.transaction_transaction_item import (
-    TransactionTransactionItem as TransactionTransactionItemModel,
-)
-from ...models.links.user_transaction import (
-    UserTransaction as UserTransactionModel,
-)
+from ...core.db.database import async_get_read_db
 from ...models.purchase_category import (
     PurchaseCategory as PurchaseCategoryModel,
 )
 from ...models.transaction import Currency
-from ...models.transaction import Transaction as TransactionModel
 from ...models.transaction_item import TransactionItem as TransactionItemModel
+from ...schemas.mixins.amount import to_major_units
 from ...schemas.purchase_category import (
     PurchaseCategory as PurchaseCategorySchema,
 )
@@ -65,43 +59,43 @@ async def get_purchase_category_statistics(
         ],
     ),
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
 ) -> Any:
     total_count: int = 0
     total: float = 0
     items: list[PurchaseCategoryStatisticsItem] = []
 
-    for purchase_category in purchase_categories:
-        statement = (
-            select(
-                func.sum(TransactionItemModel.amount).label("total"),
-                func.count(TransactionItemModel.id).label("item_count"),
-            )
-            .select_from(TransactionItemModel)
-            .outerjoin(PurchaseCategoryModel)
-            .outerjoin(TransactionTransactionItemModel)
-            .outerjoin(TransactionModel)
-            .outerjoin(UserTransactionModel)
-            .filter(
-                UserTransactionModel.user_id == current_user.id,
-                PurchaseCategoryModel.id == purchase_category.id,
-                not_(TransactionModel.is_deleted),
-                not_(TransactionItemModel.is_deleted),
-                not_(PurchaseCategoryModel.is_deleted),
-                TransactionModel.currency == currency,
-            )
-            .group_by(PurchaseCategoryModel.id)
+    statement = (
+        select(
+            TransactionItemModel.purchase_category_id,
+            func.sum(TransactionItemModel.amount_minor).label("total"),
+            func.count(TransactionItemModel.id).label("item_count"),
+        )
+        .filter(
+            TransactionItemModel.owner_user_id == current_user.id,
+            TransactionItemModel.purchase_category_id.in_(
+                [
+                    purchase_category.id
+                    for purchase_category in purchase_categories
+                ]
+            ),
+            not_(TransactionItemModel.is_deleted),
+            TransactionItemModel.currency == currency,
         )
+        .group_by(TransactionItemModel.purchase_category_id)
+    )
+    if before:
+        statement = statement.filter(TransactionItemModel.timestamp < before)
+    if after:
+        statement = statement.filter(TransactionItemModel.timestamp > after)
 
-        if before:
-            statement = statement.filter(TransactionModel.timestamp < before)
-        if after:
-            statement = statement.filter(TransactionModel.timestamp > after)
+    result = await db.execute(statement)
+    rows = {row.purchase_category_id: row for row in result.fetchall()}
 
-        result = await db.execute(statement)
-        row = result.fetchone()
+    for purchase_category in purchase_categories:
+        row = rows.get(purchase_category.id)
         if row:
-            category_total = row.total or 0
+            category_total = to_major_units(row.total or 0, currency)
             category_count = row.item_count or 0
         else:
             category_total = 0
@@ -0,0 +1,83 @@
+import re
+from typing import Annotated, Any
+
+from arq.jobs import Job as ArqJob
+from arq.jobs import JobStatus as ArqJobStatus
+from fastapi import APIRouter, Path, Request
+
+from ...core.exceptions.http_exceptions import NotFoundException
+from ...core.schemas.job import JobStatus
+from ...core.utils import queue
+from ...core.worker.registry import get_progress
+
+router = APIRouter(tags=["Tasks"])
+
+# arq's own job ids, `uuid4().hex`. Ids chosen by the app, e.g. of cron or
+# follow-up jobs, name their owner and are never served without auth.
+RANDOM_JOB_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+async def get_job_status(
+    job_id: str, function: str | None = None, **job_kwargs: Any
+) -> JobStatus:
+    """Look up a job and its result.
+
+    Raises `NotFoundException` if the job does not exist, or if `function`
+    or `job_kwargs` are given and the job was enqueued with other values,
+    e.g. for another owner.
+    """
+    if queue.pool is None:
+        raise NotFoundException("Job not found.")
+
+    job = ArqJob(job_id, queue.pool)
+    status = await job.status()
+    if status == ArqJobStatus.not_found:
+        raise NotFoundException("Job not found.")
+    if function is not None or job_kwargs:
+        info = await job.info()
+        if (
+            info is None
+            or (function is not None and info.function != function)
+            or any(
+                info.kwargs.get(name) != value
+                for name, value in job_kwargs.items()
+            )
+        ):
+            raise NotFoundException("Job not found.")
+
+    job_status = JobStatus(
+        job_id=job_id,
+        status=status.value,
+        progress=await get_progress(queue.pool, job_id),
+    )
+    if status == ArqJobStatus.complete:
+        result = await job.result_info()
+        if result is not None:
+            job_status.success = result.success
+            job_status.result = result.result if result.success else None
+    return job_status
+
+
+def _get_counts(result: Any) -> dict[str, int] | None:
+    if not isinstance(result, dict):
+        return None
+    return {
+        name: value for name, value in result.items() if isinstance(value, int)
+    }
+
+
+# Not authenticated, a user's token is revoked when their deletion starts.
+# Only jobs with random ids are served and only the counts of results are
+# returned, anything else, e.g. the errors of an import, is served by owner
+# checked endpoints.
+@router.get("/tasks/{job_id}", response_model=JobStatus)
+async def get_task(
+    request: Request,
+    job_id: Annotated[str, Path(description="Id of the job to look up")],
+) -> JobStatus:
+    if not RANDOM_JOB_ID_PATTERN.fullmatch(job_id):
+        raise NotFoundException("Job not found.")
+
+    job_status = await get_job_status(job_id)
+    job_status.result = _get_counts(job_status.result)
+    return job_status
@@ -0,0 +1,246 @@
+import csv
+import io
+import uuid as uuid_pkg
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query, Request
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import Select
+
+from ...core.db.database import get_read_sessionmaker
+from ...core.exceptions.http_exceptions import NotFoundException
+from ...core.schemas.job import ExportHandle
+from ...core.utils.export_store import ExportFormat, find_export, get_owner_key
+from ...core.utils.queue import enqueue_job
+from ...crud.crud_transaction_item import select_transaction_items_for_export
+from ...schemas.group import Group as GroupSchema
+from ...schemas.mixins.amount import to_major_units_decimal
+from ...schemas.user import User as UserSchema
+from ..dependencies import get_current_user
+from .dependencies.group import get_non_deleted_user_group
+
+router = APIRouter(tags=["Export"])
+
+# Rows fetched from the server side cursor at a time, each batch is sent as
+# one chunk of the response
+EXPORT_YIELD_PER = 1000
+
+EXPORT_CSV_COLUMNS = (
+    "transaction_uuid",
+    "timestamp",
+    "transaction_name",
+    "transaction_description",
+    "transaction_item_uuid",
+    "name",
+    "description",
+    "amount",
+    "currency",
+    "purchase_category",
+    "tags",
+)
+
+
+async def _stream_csv(statement: Select) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_CSV_COLUMNS)
+
+    # The session of the route is closed before the body is sent
+    async with get_read_sessionmaker()() as db:
+        result = await db.stream(
+            statement.execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        async for rows in result.partitions():
+            for row in rows:
+                writer.writerow(
+                    (
+                        row.transaction_uuid,
+                        row.timestamp.isoformat(),
+                        row.transaction_name,
+                        row.transaction_description,
+                        row.transaction_item_uuid,
+                        row.name,
+                        row.description,
+                        to_major_units_decimal(row.amount_minor, row.currency),
+                        row.currency.value,
+                        row.purchase_category,
+                        ";".join(row.tags or ()),
+                    )
+                )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell() > 0:
+        yield buffer.getvalue()
+
+
+def _csv_response(statement: Select, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        _stream_csv(statement),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/transaction/export.csv", response_class=StreamingResponse)
+async def export_user_transactions_csv(
+    *,
+    request: Request,
+    before: datetime | None = Query(
+        default=None,
+        description="Export transactions before this date",
+        examples=[datetime.now(UTC)],
+    ),
+    after: datetime | None = Query(
+        default=None,
+        description="Export transactions after this date",
+        examples=[datetime.now(UTC) - timedelta(days=365)],
+    ),
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
+) -> StreamingResponse:
+    return _csv_response(
+        select_transaction_items_for_export(
+            user_id=current_user.id, before=before, after=after
+        ),
+        filename="transactions.csv",
+    )
+
+
+@router.get(
+    "/group/{group_uuid}/transactions/export.csv",
+    response_class=StreamingResponse,
+)
+async def export_group_transactions_csv(
+    *,
+    request: Request,
+    before: datetime | None = Query(
+        default=None,
+        description="Export transactions before this date",
+        examples=[datetime.now(UTC)],
+    ),
+    after: datetime | None = Query(
+        default=None,
+        description="Export transactions after this date",
+        examples=[datetime.now(UTC) - timedelta(days=365)],
+    ),
+    group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+) -> StreamingResponse:
+    return _csv_response(
+        select_transaction_items_for_export(
+            group_id=group_schema.id, before=before, after=after
+        ),
+        filename=f"group-{group_schema.uuid}-transactions.csv",
+    )
+
+
+async def _enqueue_export(
+    request: Request,
+    export_format: ExportFormat,
+    download_route: str,
+    user_id: int | None = None,
+    group_id: int | None = None,
+    **path_params: str,
+) -> ExportHandle:
+    # The id is chosen up front, so the download link can be returned now
+    export_id = uuid_pkg.uuid4().hex
+    export_job = await enqueue_job(
+        "export_owner_transaction_items",
+        export_format=export_format.value,
+        user_id=user_id,
+        group_id=group_id,
+        _job_id=export_id,
+    )
+    if export_job is None:
+        return ExportHandle(message="Export could not be started")
+
+    return ExportHandle(
+        message="Export started",
+        job_id=export_job.job_id,
+        download_url=str(
+            request.url_for(download_route, export_id=export_id, **path_params)
+        ),
+    )
+
+
+def _file_response(owner_key: str, export_id: str) -> FileResponse:
+    export = find_export(owner_key=owner_key, export_id=export_id)
+    if export is None:
+        raise NotFoundException("Export not found or not finished yet.")
+
+    path, export_format = export
+    return FileResponse(
+        path,
+        media_type=export_format.media_type,
+        filename=f"transactions.{export_format.value}",
+    )
+
+
+@router.post(
+    "/transaction/export", response_model=ExportHandle, status_code=202
+)
+async def export_user_transactions(
+    *,
+    request: Request,
+    export_format: Annotated[
+        ExportFormat, Query(alias="format")
+    ] = ExportFormat.PARQUET,
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
+) -> ExportHandle:
+    return await _enqueue_export(
+        request,
+        export_format=export_format,
+        download_route="download_user_transactions_export",
+        user_id=current_user.id,
+    )
+
+
+@router.get("/transaction/export/{export_id}", response_class=FileResponse)
+async def download_user_transactions_export(
+    *,
+    request: Request,
+    export_id: Annotated[str, Path(description="Id of the export job")],
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
+) -> FileResponse:
+    return _file_response(
+        owner_key=get_owner_key(user_id=current_user.id), export_id=export_id
+    )
+
+
+@router.post(
+    "/group/{group_uuid}/transactions/export",
+    response_model=ExportHandle,
+    status_code=202,
+)
+async def export_group_transactions(
+    *,
+    request: Request,
+    export_format: Annotated[
+        ExportFormat, Query(alias="format")
+    ] = ExportFormat.PARQUET,
+    group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+) -> ExportHandle:
+    return await _enqueue_export(
+        request,
+        export_format=export_format,
+        download_route="download_group_transactions_export",
+        group_id=group_schema.id,
+        group_uuid=str(group_schema.uuid),
+    )
+
+
+@router.get(
+    "/group/{group_uuid}/transactions/export/{export_id}",
+    response_class=FileResponse,
+)
+async def download_group_transactions_export(
+    *,
+    request: Request,
+    export_id: Annotated[str, Path(description="Id of the export job")],
+    group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+) -> FileResponse:
+    return _file_response(
+        owner_key=get_owner_key(group_id=group_schema.id), export_id=export_id
+    )
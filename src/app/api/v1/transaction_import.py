@@ -0,0 +1,171 @@
+import os
+import uuid as uuid_pkg
+from typing import Annotated, Any, BinaryIO
+
+from fastapi import APIRouter, Depends, Form, Path, Request, UploadFile
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from ...core.config import settings
+from ...core.exceptions.http_exceptions import (
+    CustomException,
+    UnprocessableEntityException,
+)
+from ...core.schemas.job import JobHandle, JobStatus
+from ...core.utils.export_store import get_owner_key
+from ...core.utils.queue import enqueue_job
+from ...crud.transaction_import import get_import_path
+from ...schemas.group import Group as GroupSchema
+from ...schemas.transaction_import import TransactionImportMapping
+from ...schemas.user import User as UserSchema
+from ..dependencies import get_current_user
+from .dependencies.group import get_non_deleted_user_group
+from .tasks import get_job_status
+
+router = APIRouter(tags=["Import"])
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+MAPPING_DESCRIPTION = (
+    "JSON object of `TransactionImportMapping` fields, e.g. "
+    '`{"amount_column": "Amount", "negative_expenses": true}`. '
+    "Defaults to the columns of the CSV export."
+)
+
+
+def _parse_mapping(mapping: str) -> TransactionImportMapping:
+    try:
+        return TransactionImportMapping.model_validate_json(mapping)
+    except ValidationError as e:
+        raise UnprocessableEntityException(
+            f"Invalid mapping: {e.errors(include_url=False)}"
+        )
+
+
+def _copy_upload(source: BinaryIO, path: str, max_size: int) -> int:
+    """Copy up to just over `max_size` bytes, returns the copied size."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    size = 0
+    with open(path, "wb") as stored_file:
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_size:
+                break
+            stored_file.write(chunk)
+    return size
+
+
+async def _store_upload(file: UploadFile, path: str) -> None:
+    """Copy the upload in chunks, rejecting files over the size limit."""
+    max_size = settings.IMPORT_MAX_FILE_SIZE_MB * 1024 * 1024
+    # Blocking file IO, kept off the event loop
+    size = await run_in_threadpool(_copy_upload, file.file, path, max_size)
+
+    if size > max_size:
+        os.remove(path)
+        raise CustomException(
+            status_code=413,
+            detail=f"File is larger than {settings.IMPORT_MAX_FILE_SIZE_MB} MB.",
+        )
+
+
+async def _enqueue_import(
+    file: UploadFile,
+    mapping: TransactionImportMapping,
+    owner_key: str,
+    **owner: Any,
+) -> JobHandle:
+    # The id is chosen up front, the upload is stored under it
+    import_id = uuid_pkg.uuid4().hex
+    path = get_import_path(owner_key=owner_key, import_id=import_id)
+    await _store_upload(file, path)
+
+    import_job = await enqueue_job(
+        "import_owner_transactions",
+        path=path,
+        mapping=mapping.model_dump(mode="json"),
+        **owner,
+        _job_id=import_id,
+    )
+    if import_job is None:
+        os.remove(path)
+        return JobHandle(message="Import could not be started")
+
+    return JobHandle(message="Import started", job_id=import_job.job_id)
+
+
+@router.post("/transaction/import", response_model=JobHandle, status_code=202)
+async def import_user_transactions(
+    *,
+    request: Request,
+    file: UploadFile,
+    mapping: Annotated[str, Form(description=MAPPING_DESCRIPTION)] = "{}",
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
+) -> JobHandle:
+    return await _enqueue_import(
+        file,
+        mapping=_parse_mapping(mapping),
+        owner_key=get_owner_key(user_id=current_user.id),
+        owner_id=current_user.id,
+        owner_uuid=current_user.uuid,
+        is_group=False,
+    )
+
+
+# The report echoes cells of the statement, so only its owner may read it
+@router.get("/transaction/import/{import_id}", response_model=JobStatus)
+async def get_user_transaction_import(
+    *,
+    request: Request,
+    import_id: Annotated[str, Path(description="Job id of the import")],
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
+) -> JobStatus:
+    return await get_job_status(
+        import_id,
+        function="import_owner_transactions",
+        owner_id=current_user.id,
+        is_group=False,
+    )
+
+
+@router.post(
+    "/group/{group_uuid}/transactions/import",
+    response_model=JobHandle,
+    status_code=202,
+)
+async def import_group_transactions(
+    *,
+    request: Request,
+    file: UploadFile,
+    mapping: Annotated[str, Form(description=MAPPING_DESCRIPTION)] = "{}",
+    group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
+) -> JobHandle:
+    return await _enqueue_import(
+        file,
+        mapping=_parse_mapping(mapping),
+        owner_key=get_owner_key(group_id=group_schema.id),
+        owner_id=group_schema.id,
+        owner_uuid=group_schema.uuid,
+        is_group=True,
+        created_by_user_id=current_user.id,
+        created_by_user_uuid=current_user.uuid,
+    )
+
+
+@router.get(
+    "/group/{group_uuid}/transactions/import/{import_id}",
+    response_model=JobStatus,
+)
+async def get_group_transaction_import(
+    *,
+    request: Request,
+    import_id: Annotated[str, Path(description="Job id of the import")],
+    group_schema: Annotated[GroupSchema, Depends(get_non_deleted_user_group)],
+) -> JobStatus:
+    return await get_job_status(
+        import_id,
+        function="import_owner_transactions",
+        owner_id=group_schema.id,
+        is_group=True,
+    )
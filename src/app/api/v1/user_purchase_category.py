@@ -12,7 +12,7 @@ from pydantic import BaseModel
 from sqlalchemy import func, not_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import async_get_db
+from ...core.db.database import async_get_db, async_get_read_db
 from ...core.exceptions.http_exceptions import (
     ForbiddenException,
     NotFoundException,
@@ -112,7 +112,7 @@ async def get_purchase_categories(
     *,
     request: Request,
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: int = Query(ge=1, default=1),
     items_per_page: int = Query(ge=1, le=100, default=10),
 ) -> Any:
@@ -10,16 +10,11 @@ from fastcrud.paginated import (
 from sqlalchemy import func, not_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import async_get_db
+from ...core.db.database import async_get_read_db
+from ...core.responses import ORJSONResponse
 from ...models.links.transaction_item_tag import (
     TransactionItemTag as TransactionItemTagModel,
 )
-from ...models.links.transaction_transaction_item import (
-    TransactionTransactionItem as TransactionTransactionItemModel,
-)
-from ...models.links.user_transaction import (
-    UserTransaction as UserTransactionModel,
-)
 from ...models.purchase_category import (
     PurchaseCategory as PurchaseCategoryModel,
 )
@@ -69,7 +64,7 @@ async def get_user_transaction_items(
         Depends(get_optional_non_deleted_user_purchase_category),
     ],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     items_per_page: Annotated[int, Query(ge=1, le=100)] = 10,
 ) -> Any:
@@ -80,14 +75,15 @@ async def get_user_transaction_items(
             PurchaseCategoryModel.category_name,
             PurchaseCategoryModel.category_description,
         )
-        .outerjoin(TransactionTransactionItemModel)
-        .outerjoin(TransactionModel)
-        .add_columns(TransactionModel.uuid, TransactionModel.timestamp)
-        .outerjoin(UserTransactionModel)
+        .outerjoin(
+            TransactionModel,
+            TransactionModel.id == TransactionItemModel.transaction_id,
+        )
+        .add_columns(TransactionModel.uuid)
         .outerjoin(TransactionItemTagModel)
         .outerjoin(TagModel)
         .filter(
-            UserTransactionModel.user_id == current_user.id,
+            TransactionItemModel.owner_user_id == current_user.id,
             not_(TransactionModel.is_deleted),
             not_(TransactionItemModel.is_deleted),
             not_(TagModel.is_deleted),
@@ -108,9 +104,9 @@ async def get_user_transaction_items(
         .limit(items_per_page)
     )
     if before:
-        statement = statement.filter(TransactionModel.timestamp < before)
+        statement = statement.filter(TransactionItemModel.timestamp < before)
     if after:
-        statement = statement.filter(TransactionModel.timestamp > after)
+        statement = statement.filter(TransactionItemModel.timestamp > after)
     if purchase_category_schema:
         statement = statement.filter(
             PurchaseCategoryModel.id == purchase_category_schema.id
@@ -128,7 +124,6 @@ async def get_user_transaction_items(
             "category_description"
         ]
         transaction_item_dict["transaction_uuid"] = row_dict["uuid"]
-        transaction_item_dict["timestamp"] = row_dict["timestamp"]
 
         tags_statement = (
             select(TagModel)
@@ -152,6 +147,12 @@ async def get_user_transaction_items(
         )
 
     crud_data = {"data": data, "total_count": len(data)}
-    return paginated_response(
-        crud_data=crud_data, page=page, items_per_page=items_per_page
+    return ORJSONResponse(
+        PaginatedListResponse[
+            TransactionItemReadWithTransactionData
+        ].model_validate(
+            paginated_response(
+                crud_data=crud_data, page=page, items_per_page=items_per_page
+            )
+        )
     )
@@ -2,55 +2,51 @@ from datetime import UTC, datetime, timedelta
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, Depends, Query, Request
-from fastcrud import JoinConfig
 from fastcrud.paginated import (
     PaginatedListResponse,
     compute_offset,
     paginated_response,
 )
-from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import async_get_db
+from ...core.db.database import async_get_db, async_get_read_db
 from ...core.exceptions.http_exceptions import (
     CustomException,
     UnprocessableEntityException,
 )
+from ...core.responses import ORJSONResponse
 from ...core.schemas.utils import Message
-from ...crud.crud_transaction_item import crud_transaction_item
-from ...crud.crud_transactions import crud_transactions
-from ...crud.links.crud_transaction_transaction_item import (
-    crud_transaction_transaction_item,
-)
+from ...crud.crud_transactions import crud_transactions, delete_transactions
 from ...crud.links.crud_user_transaction import crud_user_transaction
-from ...models.links.user_transaction import (
-    UserTransaction as UserTransactionModel,
-)
 from ...models.transaction import Transaction as TransactionModel
 from ...schemas.links.user_transaction import UserTransactionCreateInternal
+from ...schemas.mixins.amount import to_minor_units
 from ...schemas.purchase_category import (
     PurchaseCategory as PurchaseCategorySchema,
 )
 from ...schemas.transaction import Transaction as TransactionSchema
 from ...schemas.transaction import (
+    TransactionBulkDelete,
     TransactionCreate,
     TransactionCreateInternal,
     TransactionRead,
     TransactionUpdate,
     TransactionUpdateInternal,
 )
-from ...schemas.transaction_item import TransactionItem as TransactionItemSchema
 from ...schemas.transaction_item import TransactionItemCreate
 from ...schemas.user import User as UserSchema
 from ..dependencies import get_current_user
 from .dependencies.purchase_category import (
     get_optional_non_deleted_user_purchase_category,
 )
-from .dependencies.transaction import get_non_deleted_user_transaction
+from .dependencies.tag import schedule_user_tag_cleanup
+from .dependencies.transaction import (
+    get_non_deleted_user_transaction,
+    get_non_deleted_user_transactions,
+)
 from .dependencies.transaction_item import (
     create_user_transaction_items,
     get_transaction_items_with_data,
-    get_user_transaction_items,
     remove_user_transaction_items,
 )
 
@@ -108,15 +104,13 @@ async def create_user_transaction(
         transaction_create.transaction_items.append(transaction_item_create)
 
     # Check if transaction_create.amount is the sum of all transaction_items.amount
-    if (
-        sum(
-            [
-                transaction_item.amount
-                for transaction_item in transaction_create.transaction_items
-            ]
-        )
-        != transaction_create.amount
-    ):
+    # Compared in minor units, so float rounding can't break the check
+    if sum(
+        [
+            to_minor_units(transaction_item.amount, transaction_create.currency)
+            for transaction_item in transaction_create.transaction_items
+        ]
+    ) != to_minor_units(transaction_create.amount, transaction_create.currency):
         raise UnprocessableEntityException(
             "Transaction amount should be the sum of all transaction items amount"
         )
@@ -126,6 +120,7 @@ async def create_user_transaction(
         **transaction_create.model_dump(
             exclude={"purchase_category_uuid", "tag_names", "transaction_items"}
         ),
+        owner_user_id=current_user.id,
     )
     transaction_model: TransactionModel = await crud_transactions.create(
         db=db, object=transaction_create_internal
@@ -176,7 +171,7 @@ async def get_user_transactions(
         examples=[datetime.now(UTC) - timedelta(days=7)],
     ),
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     items_per_page: Annotated[int, Query(ge=1, le=100)] = 10,
 ) -> Any:
@@ -187,17 +182,11 @@ async def get_user_transactions(
     if after is not None:
         kwargs["timestamp__gt"] = after
 
-    user_transaction_join_config = JoinConfig(
-        model=UserTransactionModel,
-        join_on=UserTransactionModel.transaction_id == TransactionModel.id,
-        schema_to_select=BaseModel,
-        filters={"user_id": current_user.id},
-    )
-    crud_data: dict[str, Any] = await crud_transactions.get_multi_joined(
+    crud_data: dict[str, Any] = await crud_transactions.get_multi(
         db=db,
+        owner_user_id=current_user.id,
         is_deleted=False,
         **kwargs,
-        joins_config=[user_transaction_join_config],
         return_as_model=False,
         schema_to_select=TransactionSchema,
         offset=compute_offset(page=page, items_per_page=items_per_page),
@@ -210,8 +199,12 @@ async def get_user_transactions(
             )
         )
 
-    return paginated_response(
-        crud_data=crud_data, page=page, items_per_page=items_per_page
+    return ORJSONResponse(
+        PaginatedListResponse[TransactionRead].model_validate(
+            paginated_response(
+                crud_data=crud_data, page=page, items_per_page=items_per_page
+            )
+        )
     )
 
 
@@ -223,7 +216,7 @@ async def get_transaction(
         TransactionSchema, Depends(get_non_deleted_user_transaction)
     ],
     current_user: Annotated[UserSchema, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
 ) -> Any:
     transaction_dict: dict[str, Any] = transaction_schema.model_dump()
 
@@ -276,16 +269,19 @@ async def update_transaction(
                 "Tags should be provided if transaction_items list is empty"
             )
 
-    # Check if transaction_create.amount is the sum of all transaction_items.amount
-    if (
-        sum(
-            [
-                transaction_item.amount
-                for transaction_item in transaction_update.transaction_items
-            ]
+    if transaction_update.amount is None:
+        raise UnprocessableEntityException(
+            "Transaction amount should be provided"
         )
-        != transaction_update.amount
-    ):
+
+    # Check if transaction_create.amount is the sum of all transaction_items.amount
+    # Compared in minor units, so float rounding can't break the check
+    if sum(
+        [
+            to_minor_units(transaction_item.amount, transaction_update.currency)
+            for transaction_item in transaction_update.transaction_items
+        ]
+    ) != to_minor_units(transaction_update.amount, transaction_update.currency):
         raise UnprocessableEntityException(
             "Transaction amount should be the sum of all transaction items amount"
         )
@@ -319,14 +315,17 @@ async def update_transaction(
         current_user=current_user,
         db=db,
     )
+    # Items carry a copy of the transaction timestamp and currency
+    updated_transaction_schema = transaction_schema.model_copy(
+        update=transaction_update_internal.model_dump()
+    )
     await create_user_transaction_items(
-        transaction=transaction_schema,
+        transaction=updated_transaction_schema,
         transaction_items=transaction_update.transaction_items,
         current_user=current_user,
         db=db,
     )
     # TODO: check if removing and creating transaction items is necessary for performance
-    # TODO: clean up tags that are no longer in use
     return Message(message="Transaction updated successfully.")
 
 
@@ -340,23 +339,31 @@ async def delete_transaction(
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> Message:
-    # Get transaction items
-    transaction_items: list[TransactionItemSchema] = (
-        await get_user_transaction_items(
-            transaction=transaction_schema,
+    # Delete transaction and its items
+    await delete_transactions(db=db, transactions=[transaction_schema])
+    await schedule_user_tag_cleanup(current_user=current_user)
+    return Message(message="Transaction deleted successfully.")
+
+
+@router.delete("/transaction", response_model=Message)
+async def delete_transactions_bulk(
+    *,
+    request: Request,
+    transaction_bulk_delete: Annotated[TransactionBulkDelete, Body()],
+    current_user: Annotated[UserSchema, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+) -> Message:
+    transaction_schemas: list[TransactionSchema] = (
+        await get_non_deleted_user_transactions(
+            transaction_uuids=transaction_bulk_delete.transaction_uuids,
             current_user=current_user,
             db=db,
         )
     )
-    for transaction_item in transaction_items:
-        await crud_transaction_transaction_item.delete(
-            db=db,
-            transaction_id=transaction_schema.id,
-            transaction_item_id=transaction_item.id,
-        )
-        await crud_transaction_item.delete(db=db, uuid=transaction_item.uuid)
 
-    # Delete transaction
-    await crud_transactions.delete(db=db, uuid=transaction_schema.uuid)
-    # TODO: clean up tags that are no longer in use
-    return Message(message="Transaction deleted successfully.")
+    # Delete transactions and their items
+    await delete_transactions(db=db, transactions=transaction_schemas)
+    await schedule_user_tag_cleanup(current_user=current_user)
+    return Message(
+        message=f"{len(transaction_schemas)} transactions deleted successfully."
+    )
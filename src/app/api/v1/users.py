@@ -9,14 +9,16 @@ from fastcrud.paginated import (
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...api.dependencies import get_current_superuser, get_current_user
-from ...core.db.database import async_get_db
+from ...core.db.database import async_get_db, async_get_read_db
 from ...core.exceptions.http_exceptions import (
     DuplicateValueException,
     ForbiddenException,
     NotFoundException,
 )
+from ...core.schemas.job import JobHandle
 from ...core.schemas.utils import Message
 from ...core.security import blacklist_token, get_password_hash, oauth2_scheme
+from ...core.utils.queue import enqueue_job
 from ...crud.crud_rate_limit import crud_rate_limits
 from ...crud.crud_tier import crud_tiers
 from ...crud.crud_users import crud_users
@@ -75,7 +77,7 @@ async def create_user(
 @router.get("/user", response_model=PaginatedListResponse[UserRead])
 async def get_users(
     request: Request,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     items_per_page: Annotated[int, Query(ge=1, le=100)] = 10,
 ) -> Any:
@@ -105,7 +107,7 @@ async def get_users_me(
 async def get_user(
     request: Request,
     username: str,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
 ) -> Any:
     user_read: UserRead | None = await crud_users.get(
         db=db,
@@ -159,14 +161,14 @@ async def update_user(
     return Message(message="User updated")
 
 
-@router.delete("/user/{username}", response_model=Message)
+@router.delete("/user/{username}", response_model=JobHandle)
 async def delete_user(
     request: Request,
     username: str,
     current_user: Annotated[UserSchema, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(async_get_db)],
     token: Annotated[str, Depends(oauth2_scheme)],
-) -> Message:
+) -> JobHandle:
     user_read: UserRead | None = await crud_users.get(
         db=db,
         return_as_model=True,
@@ -181,7 +183,12 @@ async def delete_user(
 
     await crud_users.delete(db=db, username=username)
     await blacklist_token(token=token, db=db)
-    return Message(message="User deleted")
+    # The user's data is deleted in the background, see the tasks endpoint
+    cascade_job = await enqueue_job("cascade_delete", user_id=current_user.id)
+    return JobHandle(
+        message="User deleted",
+        job_id=cascade_job.job_id if cascade_job is not None else None,
+    )
 
 
 @router.delete(
@@ -213,7 +220,7 @@ async def db_delete_user(
 async def get_user_rate_limits(
     request: Request,
     username: str,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
 ) -> dict[str, Any]:
     user_read: dict | None = await crud_users.get(
         db=db, username=username, schema_to_select=UserRead
@@ -249,7 +256,7 @@ async def get_user_rate_limits(
 async def get_user_tier(
     request: Request,
     username: str,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
 ) -> dict | None:
     user_read: UserRead = await crud_users.get(
         db=db,
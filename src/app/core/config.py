@@ -51,6 +51,88 @@ class PostgresSettings(DatabaseSettings):
     POSTGRES_URL: str | None = config("POSTGRES_URL", default=None)
 
 
+class PostgresReplicaSettings(BaseSettings):
+    # Comma separated list in the same format as POSTGRES_URI
+    POSTGRES_REPLICA_URIS: str = config("POSTGRES_REPLICA_URIS", default="")
+    REPLICA_PRIMARY_PIN_SECONDS: int = config(
+        "REPLICA_PRIMARY_PIN_SECONDS", default=5
+    )
+
+
+class DatabasePoolSettings(BaseSettings):
+    DATABASE_POOL_SIZE: int = config("DATABASE_POOL_SIZE", default=5)
+    DATABASE_MAX_OVERFLOW: int = config("DATABASE_MAX_OVERFLOW", default=10)
+    DATABASE_POOL_TIMEOUT: float = config("DATABASE_POOL_TIMEOUT", default=30)
+    DATABASE_POOL_RECYCLE: int = config("DATABASE_POOL_RECYCLE", default=1800)
+    DATABASE_POOL_PRE_PING: bool = config(
+        "DATABASE_POOL_PRE_PING", default=True
+    )
+    DATABASE_STATEMENT_CACHE_SIZE: int = config(
+        "DATABASE_STATEMENT_CACHE_SIZE", default=100
+    )
+    DATABASE_STATEMENT_TIMEOUT_MS: int = config(
+        "DATABASE_STATEMENT_TIMEOUT_MS", default=30000
+    )
+    DATABASE_POOL_SLOW_CHECKOUT_MS: int = config(
+        "DATABASE_POOL_SLOW_CHECKOUT_MS", default=100
+    )
+
+
+class DatabaseQueryStatsSettings(BaseSettings):
+    DATABASE_QUERY_STATS: bool = config("DATABASE_QUERY_STATS", default=True)
+    DATABASE_REPEATED_QUERY_THRESHOLD: int = config(
+        "DATABASE_REPEATED_QUERY_THRESHOLD", default=10
+    )
+
+
+class DatabasePartitioningSettings(BaseSettings):
+    # Read by the partitioning migration, enable before running it
+    DATABASE_PARTITIONING: bool = config("DATABASE_PARTITIONING", default=False)
+    DATABASE_PARTITIONS_AHEAD: int = config(
+        "DATABASE_PARTITIONS_AHEAD", default=3
+    )
+
+
+class GarbageCollectionSettings(BaseSettings):
+    # Rows handled per batch, each batch runs in its own transaction
+    GC_BATCH_SIZE: int = config("GC_BATCH_SIZE", default=1000)
+    # Pause between batches to leave room for regular traffic
+    GC_BATCH_DELAY_MS: int = config("GC_BATCH_DELAY_MS", default=100)
+    GC_MAX_BATCHES_PER_RUN: int = config("GC_MAX_BATCHES_PER_RUN", default=100)
+    TAG_GC_HARD_DELETE: bool = config("TAG_GC_HARD_DELETE", default=False)
+    # Tags created or unlinked more recently are kept, e.g. while a
+    # transaction is updated
+    TAG_GC_GRACE_PERIOD_MINUTES: int = config(
+        "TAG_GC_GRACE_PERIOD_MINUTES", default=5
+    )
+
+
+class DataRetentionSettings(BaseSettings):
+    # Soft deleted rows are kept this long before they are purged
+    SOFT_DELETE_RETENTION_DAYS: int = config(
+        "SOFT_DELETE_RETENTION_DAYS", default=90
+    )
+    # Copy purged rows to the `archived_row` table instead of dropping them
+    SOFT_DELETE_ARCHIVE: bool = config("SOFT_DELETE_ARCHIVE", default=True)
+
+
+class ExportSettings(BaseSettings):
+    # Shared by the API and the worker, e.g. a mounted volume
+    EXPORT_STORE_PATH: str = config("EXPORT_STORE_PATH", default="./exports")
+    # Files older than this are removed by the worker
+    EXPORT_EXPIRATION_HOURS: int = config("EXPORT_EXPIRATION_HOURS", default=24)
+    # Rows per Arrow record batch, also the rows fetched per round trip
+    EXPORT_BATCH_SIZE: int = config("EXPORT_BATCH_SIZE", default=10000)
+
+
+class ImportSettings(BaseSettings):
+    # Uploads wait here for the worker, shared like the export store
+    IMPORT_STORE_PATH: str = config("IMPORT_STORE_PATH", default="./imports")
+    IMPORT_MAX_FILE_SIZE_MB: int = config("IMPORT_MAX_FILE_SIZE_MB", default=50)
+    # Rows sent to the staging table per COPY
+    IMPORT_BATCH_SIZE: int = config("IMPORT_BATCH_SIZE", default=10000)
+
+
 class FirstUserSettings(BaseSettings):
     ADMIN_NAME: str = config("ADMIN_NAME", default="admin")
     ADMIN_EMAIL: str = config("ADMIN_EMAIL", default="admin@admin.com")
@@ -73,6 +155,19 @@ class RedisCacheSettings(BaseSettings):
     REDIS_CACHE_URL: str = f"redis://{REDIS_CACHE_HOST}:{REDIS_CACHE_PORT}"
 
 
+class GroupMembershipCacheSettings(BaseSettings):
+    GROUP_MEMBERSHIP_CACHE_EXPIRATION: int = config(
+        "GROUP_MEMBERSHIP_CACHE_EXPIRATION", default=3600
+    )
+    # Other processes only see invalidations once their local copy expires
+    GROUP_MEMBERSHIP_LOCAL_CACHE_EXPIRATION: int = config(
+        "GROUP_MEMBERSHIP_LOCAL_CACHE_EXPIRATION", default=5
+    )
+    GROUP_MEMBERSHIP_LOCAL_CACHE_MAX_SIZE: int = config(
+        "GROUP_MEMBERSHIP_LOCAL_CACHE_MAX_SIZE", default=10000
+    )
+
+
 class ClientSideCacheSettings(BaseSettings):
     CLIENT_CACHE_MAX_AGE: int = config("CLIENT_CACHE_MAX_AGE", default=60)
 
@@ -80,6 +175,10 @@ class ClientSideCacheSettings(BaseSettings):
 class RedisQueueSettings(BaseSettings):
     REDIS_QUEUE_HOST: str = config("REDIS_QUEUE_HOST", default="localhost")
     REDIS_QUEUE_PORT: int = config("REDIS_QUEUE_PORT", default=6379)
+    # For jobs that work through all rows of an owner, e.g. cascade deletes
+    LONG_JOB_TIMEOUT_SECONDS: int = config(
+        "LONG_JOB_TIMEOUT_SECONDS", default=60 * 60
+    )
 
 
 class RedisRateLimiterSettings(BaseSettings):
@@ -114,10 +213,19 @@ class EnvironmentSettings(BaseSettings):
 class Settings(
     AppSettings,
     PostgresSettings,
+    PostgresReplicaSettings,
+    DatabasePoolSettings,
+    DatabaseQueryStatsSettings,
+    DatabasePartitioningSettings,
+    GarbageCollectionSettings,
+    DataRetentionSettings,
+    ExportSettings,
+    ImportSettings,
     CryptSettings,
     FirstUserSettings,
     TestSettings,
     RedisCacheSettings,
+    GroupMembershipCacheSettings,
     # ClientSideCacheSettings,
     RedisQueueSettings,
     RedisRateLimiterSettings,
@@ -1,4 +1,9 @@
+import asyncio
+from datetime import UTC, datetime
+
 from fastcrud import FastCRUD
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.token_blacklist import TokenBlacklist
 from ..schemas.token import TokenBlacklistCreate, TokenBlacklistUpdate
@@ -11,3 +16,42 @@ CRUDTokenBlacklist = FastCRUD[
     None,
 ]
 crud_token_blacklist = CRUDTokenBlacklist(TokenBlacklist)
+
+
+async def purge_expired_tokens(
+    db: AsyncSession,
+    *,
+    batch_size: int = 1000,
+    max_batches: int | None = None,
+    batch_delay: float = 0,
+) -> int:
+    """Delete blacklist entries of tokens that have expired.
+
+    Expired tokens are rejected by their signature check already, so their
+    entries are no longer needed. Rows are deleted in batches of
+    `batch_size`, each in its own transaction, waiting `batch_delay`
+    seconds in between. Returns the number of deleted rows.
+    """
+    now = datetime.now(UTC)
+    deleted_count = 0
+    batch_count = 0
+    while max_batches is None or batch_count < max_batches:
+        if batch_count > 0 and batch_delay > 0:
+            await asyncio.sleep(batch_delay)
+
+        expired_ids = (
+            select(TokenBlacklist.id)
+            .filter(TokenBlacklist.expires_at < now)
+            .limit(batch_size)
+        )
+        result = await db.execute(
+            delete(TokenBlacklist).filter(TokenBlacklist.id.in_(expired_ids))
+        )
+        await db.commit()
+        batch_count += 1
+        deleted_count += result.rowcount  # type: ignore
+
+        if result.rowcount < batch_size:  # type: ignore
+            break
+
+    return deleted_count
@@ -1,16 +1,22 @@
+from itertools import cycle
 from typing import AsyncGenerator
 
+from fastapi import Request
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import (
     DeclarativeBase,
     MappedAsDataclass,
+    Session,
     declared_attr,
     sessionmaker,
 )
 
 from ..config import settings
 from ..utils.snake_case import snake_case
+from .pool import InstrumentedAsyncQueuePool
+from .replica import is_pinned_to_primary, pin_to_primary
 
 
 class Base(MappedAsDataclass, DeclarativeBase):
@@ -23,16 +29,93 @@ DATABASE_URI = settings.POSTGRES_URI
 DATABASE_PREFIX = settings.POSTGRES_ASYNC_PREFIX
 DATABASE_URL = f"{DATABASE_PREFIX}{DATABASE_URI}"
 
-async_engine: AsyncEngine = create_async_engine(
-    DATABASE_URL, echo=False, future=True
-)
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            "server_settings": {
+                "statement_timeout": str(settings.DATABASE_STATEMENT_TIMEOUT_MS)
+            },
+        },
+    )
+
+
+async_engine: AsyncEngine = _create_engine(DATABASE_URL)
 
 local_session = sessionmaker(
     bind=async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
+REPLICA_URLS = [
+    f"{DATABASE_PREFIX}{uri.strip()}"
+    for uri in settings.POSTGRES_REPLICA_URIS.split(",")
+    if uri.strip()
+]
+
+replica_engines: list[AsyncEngine] = [
+    _create_engine(url) for url in REPLICA_URLS
+]
+
+replica_sessions = [
+    sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    for engine in replica_engines
+]
+_next_replica_session = cycle(replica_sessions)
 
-async def async_get_db() -> AsyncGenerator[AsyncSession, None]:
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed(session: Session) -> None:
+    session.info["committed"] = True
+
+
+async def async_get_db(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Request scoped session on the primary database.
+
+    The session only checks out a pooled connection when the first statement
+    is executed, so requests rejected by authentication or served from cache
+    never touch the pool. Avoid calling `begin()` or `connection()` eagerly in
+    dependencies, as that would check out a connection up front.
+    """
     async_session = local_session
     async with async_session() as db:
         yield db
+
+        if replica_sessions and db.info.get("committed"):
+            await pin_to_primary(request)
+
+
+async def _async_get_replica_db(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, None]:
+    async_session = next(_next_replica_session)
+    if await is_pinned_to_primary(request):
+        async_session = local_session
+
+    async with async_session() as db:
+        yield db
+
+
+def get_read_sessionmaker() -> sessionmaker:
+    """Session factory for reads that outlive the request scoped session.
+
+    E.g. streamed responses, which are sent after the dependencies of the
+    route have closed their sessions.
+    """
+    return next(_next_replica_session) if replica_sessions else local_session
+
+
+# Read-only routes depend on this one. Without replicas it is the primary
+# dependency itself, so FastAPI shares a single session per request.
+async_get_read_db = _async_get_replica_db if replica_sessions else async_get_db
@@ -0,0 +1,117 @@
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+
+_BIND_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|%s")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions can be grouped.
+
+    Bind parameters are replaced by `?` and parameter lists (e.g. from an
+    expanded `IN`) are collapsed, so the same query issued with different
+    values yields the same string.
+
+    Example
+    -------
+    >>> normalize_statement("SELECT * FROM t WHERE id IN ($1, $2, $3)")
+    'SELECT * FROM t WHERE id IN (?)'
+    """
+    statement = _BIND_PARAMETER.sub("?", statement)
+    statement = _PARAMETER_LIST.sub("(?)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[normalize_statement(statement)] += 1
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def get_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+@contextmanager
+def collect_query_stats() -> Iterator[QueryStats]:
+    """Collect the statements executed in the current context.
+
+    Every statement executed on any engine while the context manager is open
+    is counted and timed, including statements issued from tasks spawned
+    inside it.
+
+    Example
+    -------
+    ```python
+    with collect_query_stats() as stats:
+        await crud_transactions.get_multi(db=db)
+    print(stats.count, stats.duration)
+    ```
+    """
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    # Kept on the execution context rather than the pooled connection, so a
+    # failed statement, which gets no after_cursor_execute, leaves nothing
+    # behind
+    if _query_stats.get() is not None and context is not None:
+        context._query_start_time = time.perf_counter()  # type: ignore
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    stats = _query_stats.get()
+    start_time: float | None = getattr(context, "_query_start_time", None)
+    if stats is None or start_time is None:
+        return
+
+    stats.record(statement, time.perf_counter() - start_time)
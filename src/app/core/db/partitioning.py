@@ -0,0 +1,106 @@
+import re
+from datetime import UTC, date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..logger import logging
+
+logger = logging.getLogger(__name__)
+
+# Tables that the partitioning migration converts, partitioned by `timestamp`
+PARTITIONED_TABLES = ("transaction", "transaction_item")
+
+_PARTITION_NAME = re.compile(
+    rf"^({'|'.join(PARTITIONED_TABLES)})_(p\d{{4}}_\d{{2}}|default)$"
+)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def is_partition_table(name: str) -> bool:
+    """Whether `name` is a partition created for one of the partitioned tables.
+
+    Partitions are not part of the models, so autogenerate has to skip them.
+    """
+    return _PARTITION_NAME.match(name) is not None
+
+
+def create_partition_statement(table: str, month: date) -> str:
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(table, month)}" '
+        f'PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') "
+        f"TO ('{add_months(month, 1).isoformat()} 00:00+00')"
+    )
+
+
+async def is_partitioned(db: AsyncSession, table: str) -> bool:
+    result = await db.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(:table))"
+        ),
+        {"table": f'"{table}"'},
+    )
+    return bool(result.scalar())
+
+
+async def create_upcoming_partitions(
+    db: AsyncSession, months_ahead: int
+) -> list[str]:
+    """Create the monthly partitions up to `months_ahead` months from now.
+
+    Tables that have not been partitioned are skipped, so this is safe to run
+    against any database. Existing partitions are left untouched.
+
+    Parameters
+    ----------
+    db: AsyncSession
+        The database session.
+    months_ahead: int
+        How many months after the current one should have a partition.
+
+    Returns
+    -------
+    list[str]
+        The names of the partitions that were checked or created.
+
+    Note
+    ----
+        - A partition cannot be created while the default partition holds rows
+        for its month. Such months are logged and skipped, the rows stay in the
+        default partition until they are moved manually.
+    """
+    current_month = datetime.now(UTC).date().replace(day=1)
+    partitions: list[str] = []
+
+    for table in PARTITIONED_TABLES:
+        if not await is_partitioned(db, table):
+            continue
+
+        for offset in range(months_ahead + 1):
+            month = add_months(current_month, offset)
+            try:
+                async with db.begin_nested():
+                    await db.execute(
+                        text(create_partition_statement(table, month))
+                    )
+            except DBAPIError as e:
+                logger.warning(
+                    f"Could not create partition "
+                    f"{partition_name(table, month)}: {e.orig}"
+                )
+                continue
+            partitions.append(partition_name(table, month))
+
+    await db.commit()
+    return partitions
@@ -0,0 +1,86 @@
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from ..config import settings
+from ..logger import logging
+
+logger = logging.getLogger(__name__)
+
+SLOW_CHECKOUT_SECONDS = settings.DATABASE_POOL_SLOW_CHECKOUT_MS / 1000
+
+
+@dataclass
+class PoolMetrics:
+    checkouts: int = 0
+    slow_checkouts: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waits.
+
+    Checkouts slower than `DATABASE_POOL_SLOW_CHECKOUT_MS` are logged together
+    with the pool utilization at that moment, and pool timeouts are logged
+    before the error is propagated, so pool sizes can be tuned per worker.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            logger.error(
+                f"Database pool checkout timed out after "
+                f"{time.perf_counter() - start:.3f}s "
+                f"(pid {os.getpid()}): {self.status()}"
+            )
+            raise
+
+        wait = time.perf_counter() - start
+        self.metrics.record(wait)
+        if wait >= SLOW_CHECKOUT_SECONDS:
+            self.metrics.slow_checkouts += 1
+            logger.warning(
+                f"Slow database pool checkout: waited {wait * 1000:.1f}ms "
+                f"(pid {os.getpid()}): {self.status()}"
+            )
+        return entry
+
+    def utilization(self) -> dict[str, Any]:
+        capacity = self.size() + max(self._max_overflow, 0)
+        checked_out = self.checkedout()
+        return {
+            "pid": os.getpid(),
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_in": self.checkedin(),
+            "checked_out": checked_out,
+            "overflow": self.overflow(),
+            "utilization": checked_out / capacity if capacity else 0.0,
+            "checkouts": self.metrics.checkouts,
+            "slow_checkouts": self.metrics.slow_checkouts,
+            "timeouts": self.metrics.timeouts,
+            "avg_wait_ms": (
+                self.metrics.total_wait / self.metrics.checkouts * 1000
+                if self.metrics.checkouts
+                else 0.0
+            ),
+            "max_wait_ms": self.metrics.max_wait * 1000,
+        }
@@ -0,0 +1,72 @@
+import time
+
+from fastapi import Request
+from jose import JWTError, jwt
+
+from ..config import settings
+from ..utils import cache
+
+PRIMARY_PIN_SECONDS = settings.REPLICA_PRIMARY_PIN_SECONDS
+PRIMARY_PIN_PREFIX = "primary_pin"
+
+# Fallback used when the Redis cache is not available (e.g. scripts, tests).
+_local_pins: dict[str, float] = {}
+
+
+def _get_pin_key(request: Request) -> str | None:
+    """Build the primary pin key for the user making the request.
+
+    The token is only decoded to identify who is reading, not to authenticate
+    them, so its signature is not verified here.
+    """
+    authorization = request.headers.get("Authorization")
+    if not authorization:
+        return None
+
+    token_type, _, token = authorization.partition(" ")
+    if token_type.lower() != "bearer" or not token:
+        return None
+
+    try:
+        subject: str | None = jwt.get_unverified_claims(token).get("sub")
+    except JWTError:
+        return None
+
+    if subject is None:
+        return None
+
+    return f"{PRIMARY_PIN_PREFIX}:{subject}"
+
+
+async def pin_to_primary(request: Request) -> None:
+    """Route the requesting user's reads to the primary for a few seconds.
+
+    Called after a request has committed a write, so the user reads their
+    own writes while the replicas catch up.
+    """
+    key = _get_pin_key(request)
+    if key is None:
+        return
+
+    if cache.client is None:
+        _local_pins[key] = time.monotonic() + PRIMARY_PIN_SECONDS
+        return
+
+    await cache.client.set(key, 1, ex=PRIMARY_PIN_SECONDS)
+
+
+async def is_pinned_to_primary(request: Request) -> bool:
+    key = _get_pin_key(request)
+    if key is None:
+        return False
+
+    if cache.client is None:
+        expires_at = _local_pins.get(key)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del _local_pins[key]
+            return False
+        return True
+
+    return bool(await cache.client.exists(key))
@@ -0,0 +1,265 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import (
+    ColumnElement,
+    Table,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    null,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models import (
+    Group,
+    Income,
+    PurchaseCategory,
+    Receipt,
+    Tag,
+    Transaction,
+    TransactionItem,
+    User,
+)
+from ..models.archived_row import ArchivedRow
+from ..schemas.retention import RetentionReport
+from .database import Base
+
+# Purged in this order, rows before the rows they reference
+PURGED_TABLES: tuple[Table, ...] = tuple(
+    model.__table__  # type: ignore
+    for model in (
+        TransactionItem,
+        Transaction,
+        Tag,
+        PurchaseCategory,
+        Receipt,
+        Income,
+        Group,
+        User,
+    )
+)
+
+
+def _get_references(
+    table: Table,
+) -> tuple[list[ColumnElement], list[ColumnElement]]:
+    """Split the columns referencing `table` into link and blocking columns.
+
+    Link rows, whose primary key contains the reference, only describe the
+    purged row and are purged with it. Any other reference keeps the row
+    until the referencing row is purged itself.
+    """
+    links: list[ColumnElement] = []
+    blocking: list[ColumnElement] = []
+    for other in Base.metadata.tables.values():
+        for foreign_key in other.foreign_keys:
+            if foreign_key.column is not table.c.id:
+                continue
+            if foreign_key.parent.primary_key:
+                links.append(foreign_key.parent)
+            else:
+                blocking.append(foreign_key.parent)
+    return links, blocking
+
+
+async def get_purgeable_ids(
+    db: AsyncSession,
+    table: Table,
+    *,
+    deleted_before: datetime,
+    after_id: int = 0,
+    limit: int,
+) -> list[int]:
+    """Get the ids, in ascending order after `after_id`, of rows soft deleted
+    before `deleted_before` that no remaining row references."""
+    _, blocking = _get_references(table)
+    statement = (
+        select(table.c.id)
+        .filter(
+            table.c.id > after_id,
+            table.c.is_deleted.is_(True),
+            table.c.deleted_at < deleted_before,
+            *(~exists().where(column == table.c.id) for column in blocking),
+        )
+        .order_by(table.c.id)
+        .limit(limit)
+    )
+    return list((await db.execute(statement)).scalars())
+
+
+async def _purge_rows(
+    db: AsyncSession,
+    table: Table,
+    condition: ColumnElement[bool],
+    archive: bool,
+) -> int:
+    if not archive:
+        result = await db.execute(delete(table).filter(condition))
+        return result.rowcount  # type: ignore
+
+    # Deleting and archiving in one statement, the rows are read only once
+    purged = delete(table).filter(condition).returning(*table.c).cte("purged")
+    result = await db.execute(
+        insert(ArchivedRow)
+        .from_select(
+            [
+                "table_name",
+                "row_id",
+                "row_uuid",
+                "data",
+                "deleted_at",
+                "archived_at",
+            ],
+            select(
+                literal(table.name),
+                purged.c.id if "id" in purged.c else null(),
+                purged.c.uuid if "uuid" in purged.c else null(),
+                func.to_jsonb(purged.table_valued()),
+                purged.c.deleted_at if "deleted_at" in purged.c else null(),
+                func.now(),
+            ),
+        )
+        .add_cte(purged)
+    )
+    return result.rowcount  # type: ignore
+
+
+async def purge_rows(
+    db: AsyncSession, table: Table, ids: list[int], archive: bool = True
+) -> dict[str, int]:
+    """Physically delete rows of `table` together with their link rows.
+
+    Rows that were restored or got referenced since they were found are
+    skipped. Returns the number of purged rows per table.
+    """
+    links, blocking = _get_references(table)
+    # Locking the rows keeps them from being restored until the commit
+    ids = list(
+        (
+            await db.execute(
+                select(table.c.id)
+                .filter(
+                    table.c.id.in_(ids),
+                    table.c.is_deleted.is_(True),
+                    *(
+                        ~exists().where(column == table.c.id)
+                        for column in blocking
+                    ),
+                )
+                .with_for_update()
+            )
+        ).scalars()
+    )
+
+    purged_counts: dict[str, int] = {}
+    for column in links:
+        count = await _purge_rows(
+            db, column.table, column.in_(ids), archive  # type: ignore
+        )
+        if count > 0:
+            name = column.table.name  # type: ignore
+            purged_counts[name] = purged_counts.get(name, 0) + count
+    purged_counts[table.name] = await _purge_rows(
+        db, table, table.c.id.in_(ids), archive
+    )
+    await db.commit()
+    return purged_counts
+
+
+def _parse_checkpoint(checkpoint: str | None) -> tuple[int, int]:
+    """Get the index of the table and the id to continue after."""
+    if checkpoint is None:
+        return 0, 0
+
+    table_name, after_id = checkpoint.split(":")
+    names = [table.name for table in PURGED_TABLES]
+    if table_name not in names:
+        return 0, 0
+    return names.index(table_name), int(after_id)
+
+
+async def purge_soft_deleted(
+    db: AsyncSession,
+    *,
+    deleted_before: datetime,
+    resume_after: str | None = None,
+    batch_size: int = 1000,
+    max_batches: int | None = None,
+    batch_delay: float = 0,
+    archive: bool = True,
+) -> RetentionReport:
+    """Purge rows that were soft deleted before `deleted_before`.
+
+    The tables in `PURGED_TABLES` are scanned one after another in batches of
+    `batch_size` by ascending id. Each batch is purged in its own
+    transaction, `batch_delay` seconds are waited between batches.
+
+    Parameters
+    ----------
+    db: AsyncSession
+        The database session.
+    deleted_before: datetime
+        Rows soft deleted at or after this time are kept.
+    resume_after: str | None
+        The `resume_after` of the report of an earlier, unfinished run.
+    batch_size: int
+        The number of rows purged per transaction.
+    max_batches: int | None
+        Stop after this many batches, unlimited if `None`.
+    batch_delay: float
+        Seconds to wait between batches.
+    archive: bool
+        Whether to copy the rows to `archived_row` before deleting them.
+
+    Returns
+    -------
+    RetentionReport
+        The purged row counts. `resume_after` is set if `max_batches` was
+        reached before all tables were scanned.
+
+    Note
+    ----
+        - A row is kept while rows of other tables, other than link rows,
+        still reference it. E.g. a user is purged only after the
+        transactions they own, so rows that are soft deleted together are
+        purged together, children in earlier batches than their parents.
+    """
+    report = RetentionReport(archive=archive)
+    table_index, after_id = _parse_checkpoint(resume_after)
+
+    while table_index < len(PURGED_TABLES):
+        table = PURGED_TABLES[table_index]
+        if max_batches is not None and report.batch_count >= max_batches:
+            report.resume_after = f"{table.name}:{after_id}"
+            return report
+        if report.batch_count > 0 and batch_delay > 0:
+            await asyncio.sleep(batch_delay)
+
+        ids = await get_purgeable_ids(
+            db=db,
+            table=table,
+            deleted_before=deleted_before,
+            after_id=after_id,
+            limit=batch_size,
+        )
+        if len(ids) > 0:
+            report.batch_count += 1
+            purged_counts = await purge_rows(
+                db=db, table=table, ids=ids, archive=archive
+            )
+            for name, count in purged_counts.items():
+                report.purged_row_count += count
+                report.purged_row_counts[name] = (
+                    report.purged_row_counts.get(name, 0) + count
+                )
+            after_id = ids[-1]
+
+        if len(ids) < batch_size:
+            table_index += 1
+            after_id = 0
+
+    return report
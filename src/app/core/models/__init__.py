@@ -1,5 +1,7 @@
+from .archived_row import ArchivedRow
 from .token_blacklist import TokenBlacklist
 
 __all__ = [
+    "ArchivedRow",
     "TokenBlacklist",
 ]
@@ -0,0 +1,30 @@
+import uuid as uuid_pkg
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.database import Base
+from ..models.mixins import IDMixin
+
+
+class ArchivedRow(IDMixin, Base, kw_only=True):
+    """A row purged from another table after its retention period."""
+
+    table_name: Mapped[str] = mapped_column(String(63), index=True)
+    # Unset for rows of link tables, which have neither
+    row_id: Mapped[int | None] = mapped_column(default=None)
+    row_uuid: Mapped[uuid_pkg.UUID | None] = mapped_column(
+        index=True, default=None
+    )
+    data: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), default=None
+    )
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default_factory=lambda: datetime.now(UTC),
+        index=True,
+    )
@@ -1,8 +1,47 @@
 import uuid as uuid_pkg
+from collections.abc import Callable
 from datetime import UTC, datetime
+from typing import ClassVar
 
-from sqlalchemy import DateTime
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DDL, DateTime, event, text
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+
+from ..db.database import Base
+from ..utils.uuid7 import uuid7
+
+# Server side counterpart of `uuid7`, used for rows inserted with plain SQL
+UUID_GENERATE_V7 = DDL("""
+    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(
+                        int8send(
+                            floor(
+                                extract(epoch FROM clock_timestamp()) * 1000
+                            )::bigint
+                        )
+                        FROM 3
+                    )
+                    FROM 1 FOR 6
+                ),
+                52,
+                1
+            ),
+            53,
+            1
+        ),
+        'hex'
+    )::uuid
+    $$ LANGUAGE sql VOLATILE
+    """)
+event.listen(
+    Base.metadata,
+    "before_create",
+    UUID_GENERATE_V7.execute_if(dialect="postgresql"),
+)
 
 
 class IDMixin:
@@ -18,9 +57,23 @@ class IDMixin:
 
 
 class UUIDMixin:
-    uuid: Mapped[uuid_pkg.UUID] = mapped_column(
-        default_factory=uuid_pkg.uuid4, index=True, unique=True, nullable=False
-    )
+    """Adds a unique `uuid` column, generated as a time-ordered UUIDv7.
+
+    Set `uuid_factory` on a model to generate its UUIDs differently, e.g.
+    `uuid_factory = uuid_pkg.uuid4`.
+    """
+
+    uuid_factory: ClassVar[Callable[[], uuid_pkg.UUID]] = uuid7
+
+    @declared_attr
+    def uuid(cls) -> Mapped[uuid_pkg.UUID]:
+        return mapped_column(
+            default_factory=cls.uuid_factory,
+            server_default=text("uuid_generate_v7()"),
+            index=True,
+            unique=True,
+            nullable=False,
+        )
 
 
 class TimestampMixin:
@@ -38,6 +91,4 @@ class SoftDeleteMixin:
     deleted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), default=None, nullable=True, init=False
     )
-    is_deleted: Mapped[bool] = mapped_column(
-        default=False, index=True, nullable=False
-    )
+    is_deleted: Mapped[bool] = mapped_column(default=False, nullable=False)
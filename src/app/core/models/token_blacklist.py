@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, LargeBinary
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..db.database import Base
@@ -10,8 +10,9 @@ from ..models.mixins import IDMixin, SoftDeleteMixin, TimestampMixin
 class TokenBlacklist(
     IDMixin, TimestampMixin, SoftDeleteMixin, Base, kw_only=True
 ):
-    token: Mapped[str] = mapped_column(
-        String, unique=True, index=True, nullable=False
+    # SHA-256 of the token, keeps the index small regardless of JWT size
+    token_digest: Mapped[bytes] = mapped_column(
+        LargeBinary(32), unique=True, index=True, nullable=False
     )
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), index=True, nullable=False
@@ -0,0 +1,57 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize the types orjson does not support natively.
+
+    UUID, datetime, date, time and Enum values are handled by orjson itself,
+    this function only covers what `jsonable_encoder` would otherwise convert.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, set | frozenset):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson.
+
+    Pydantic models passed as `content` are serialized directly by
+    pydantic-core, so a route can return an already validated model wrapped in
+    this response and skip the re-validation FastAPI performs for
+    `response_model`. Any other content is serialized by orjson, which handles
+    UUID, datetime and Enum values without going through `jsonable_encoder`.
+
+    Example
+    -------
+    ```python
+    @router.get("/items", response_model=PaginatedListResponse[ItemRead])
+    async def get_items(...) -> Any:
+        ...
+        return ORJSONResponse(
+            PaginatedListResponse[ItemRead].model_validate(crud_data)
+        )
+    ```
+
+    Note
+    ----
+        - Returning a response object bypasses `response_model` filtering, so
+          the content must already be shaped as the documented schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return orjson.dumps(
+            content, default=_orjson_default, option=ORJSON_OPTIONS
+        )
@@ -0,0 +1,23 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class JobHandle(BaseModel):
+    message: str
+    # Unset if the job could not be enqueued
+    job_id: str | None = None
+
+
+class JobStatus(BaseModel):
+    job_id: str
+    # One of arq's `JobStatus` values, e.g. `queued` or `complete`
+    status: str
+    progress: dict[str, int] = {}
+    success: bool | None = None
+    result: Any = None
+
+
+class ExportHandle(JobHandle):
+    # Serves the file once the job has completed
+    download_url: str | None = None
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class RetentionReport(BaseModel):
+    archive: bool
+    batch_count: int = 0
+    # Rows of link tables are included
+    purged_row_count: int = 0
+    purged_row_counts: dict[str, int] = {}
+    # Set if the run stopped at the batch limit, the next run resumes there
+    resume_after: str | None = None
@@ -20,7 +20,7 @@ class TokenData(BaseModel):
 
 
 class TokenBlacklistBase(BaseModel):
-    token: str
+    token_digest: bytes
     expires_at: datetime
 
 
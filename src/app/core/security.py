@@ -1,3 +1,4 @@
+import hashlib
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -93,6 +94,10 @@ async def create_refresh_token(
     return encoded_jwt
 
 
+def get_token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
 async def verify_token(token: str, db: AsyncSession) -> TokenData | None:
     """Verify a JWT token and return TokenData if valid.
 
@@ -108,27 +113,31 @@ async def verify_token(token: str, db: AsyncSession) -> TokenData | None:
     TokenData | None
         TokenData instance if the token is valid, None otherwise.
     """
-    is_blacklisted = await crud_token_blacklist.exists(db, token=token)
-    if is_blacklisted:
-        return None
-
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username_or_email: str | None = payload.get("sub")
-        if username_or_email is None:
-            return None
-        return TokenData(username_or_email=username_or_email)
-
     except JWTError:
         return None
 
+    username_or_email: str | None = payload.get("sub")
+    if username_or_email is None:
+        return None
+
+    # Only tokens with a valid signature reach the database
+    is_blacklisted = await crud_token_blacklist.exists(
+        db, token_digest=get_token_digest(token)
+    )
+    if is_blacklisted:
+        return None
+
+    return TokenData(username_or_email=username_or_email)
+
 
 async def blacklist_token(token: str, db: AsyncSession) -> None:
     payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    expires_at = datetime.fromtimestamp(payload.get("exp"))
+    expires_at = datetime.fromtimestamp(payload.get("exp"), tz=UTC)
     await crud_token_blacklist.create(
         db,
         object=TokenBlacklistCreate(
-            **{"token": token, "expires_at": expires_at}
+            token_digest=get_token_digest(token), expires_at=expires_at
         ),
     )
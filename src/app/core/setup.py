@@ -14,9 +14,11 @@ from fastapi.openapi.utils import get_openapi
 
 from ..api.dependencies import get_current_superuser
 from ..middleware.client_cache_middleware import ClientCacheMiddleware
+from ..middleware.query_stats_middleware import QueryStatsMiddleware
 from .config import (
     AppSettings,
     ClientSideCacheSettings,
+    DatabaseQueryStatsSettings,
     DatabaseSettings,
     EnvironmentOption,
     EnvironmentSettings,
@@ -27,8 +29,14 @@ from .config import (
 )
 from .db.database import Base
 from .db.database import async_engine as engine
+from .db.database import replica_engines
+from .db.pool import InstrumentedAsyncQueuePool
+from .logger import logging
+from .responses import ORJSONResponse
 from .utils import cache, queue, rate_limit
 
+logger = logging.getLogger(__name__)
+
 
 # -------------- database --------------
 async def create_tables() -> None:
@@ -36,6 +44,16 @@ async def create_tables() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def close_database_pool() -> None:
+    for db_engine in [engine, *replica_engines]:
+        if isinstance(db_engine.pool, InstrumentedAsyncQueuePool):
+            logger.info(
+                f"Database pool utilization ({db_engine.url.host}): "
+                f"{db_engine.pool.utilization()}"
+            )
+        await db_engine.dispose()
+
+
 # -------------- cache --------------
 async def create_redis_cache_pool() -> None:
     cache.pool = redis.ConnectionPool.from_url(settings.REDIS_CACHE_URL)
@@ -115,6 +133,9 @@ def lifespan_factory(
 
         yield
 
+        if isinstance(settings, DatabaseSettings):
+            await close_database_pool()
+
         if isinstance(settings, RedisCacheSettings):
             await close_redis_cache_pool()
 
@@ -135,6 +156,7 @@ def create_application(
         | RedisCacheSettings
         | AppSettings
         | ClientSideCacheSettings
+        | DatabaseQueryStatsSettings
         | RedisQueueSettings
         | RedisRateLimiterSettings
         | EnvironmentSettings
@@ -160,6 +182,7 @@ def create_application(
         - DatabaseSettings: Adds event handlers for initializing database tables during startup.
         - RedisCacheSettings: Sets up event handlers for creating and closing a Redis cache pool.
         - ClientSideCacheSettings: Integrates middleware for client-side caching.
+        - DatabaseQueryStatsSettings: Integrates middleware counting the database statements of each request.
         - RedisQueueSettings: Sets up event handlers for creating and closing a Redis queue pool.
         - RedisRateLimiterSettings: Sets up event handlers for creating and closing a Redis rate limiter pool.
         - EnvironmentSettings: Conditionally sets documentation URLs and integrates custom routes for API documentation
@@ -171,6 +194,7 @@ def create_application(
 
     **kwargs
         Additional keyword arguments passed directly to the FastAPI constructor.
+        `default_response_class` defaults to `ORJSONResponse` if not provided.
 
     Returns
     -------
@@ -205,6 +229,8 @@ def create_application(
         settings, create_tables_on_start=create_tables_on_start
     )
 
+    kwargs.setdefault("default_response_class", ORJSONResponse)
+
     application = FastAPI(
         lifespan=lifespan,
         generate_unique_id_function=custom_generate_unique_id,
@@ -217,6 +243,15 @@ def create_application(
             ClientCacheMiddleware, max_age=settings.CLIENT_CACHE_MAX_AGE
         )
 
+    if (
+        isinstance(settings, DatabaseQueryStatsSettings)
+        and settings.DATABASE_QUERY_STATS
+    ):
+        application.add_middleware(
+            QueryStatsMiddleware,
+            repeated_query_threshold=settings.DATABASE_REPEATED_QUERY_THRESHOLD,
+        )
+
     if isinstance(settings, EnvironmentSettings):
         if settings.ENVIRONMENT != EnvironmentOption.PRODUCTION:
             docs_router = APIRouter()
@@ -0,0 +1,146 @@
+import os
+import time
+from collections.abc import AsyncIterator
+from enum import Enum
+from typing import Any
+
+from ..config import settings
+from ..logger import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ExportFormat(Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+    @property
+    def media_type(self) -> str:
+        if self is ExportFormat.PARQUET:
+            return "application/vnd.apache.parquet"
+        return "application/vnd.apache.arrow.file"
+
+
+def import_pyarrow() -> Any:
+    """Import `pyarrow`, only needed where exports are written."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError(
+            "Parquet and Arrow exports need pyarrow to be installed"
+        ) from e
+    return pyarrow
+
+
+def get_owner_key(
+    user_id: int | None = None, group_id: int | None = None
+) -> str:
+    return f"user-{user_id}" if user_id is not None else f"group-{group_id}"
+
+
+def get_export_path(
+    owner_key: str, export_id: str, export_format: ExportFormat
+) -> str:
+    """Path of an export in the store, one directory per owner.
+
+    `export_id` is the id of the job that writes the file, ids that could
+    escape the owner's directory are rejected.
+    """
+    if not export_id.isalnum():
+        raise ValueError(f"Invalid export id {export_id!r}")
+    return os.path.join(
+        settings.EXPORT_STORE_PATH,
+        owner_key,
+        f"{export_id}.{export_format.value}",
+    )
+
+
+def find_export(
+    owner_key: str, export_id: str
+) -> tuple[str, ExportFormat] | None:
+    """Get the path and format of a finished export of an owner."""
+    if not export_id.isalnum():
+        return None
+
+    for export_format in ExportFormat:
+        path = get_export_path(owner_key, export_id, export_format)
+        if os.path.isfile(path):
+            return path, export_format
+    return None
+
+
+def remove_expired_files(path: str, max_age_seconds: float) -> int:
+    """Remove files below `path` older than `max_age_seconds`, e.g. served
+    exports or files of interrupted jobs. Returns the number of removed
+    files."""
+    if not os.path.isdir(path):
+        return 0
+
+    removed_count = 0
+    expires_before = time.time() - max_age_seconds
+    for directory, _, file_names in os.walk(path):
+        for file_name in file_names:
+            file_path = os.path.join(directory, file_name)
+            try:
+                if os.path.getmtime(file_path) < expires_before:
+                    os.remove(file_path)
+                    removed_count += 1
+            except OSError as e:
+                logger.warning(f"Could not remove file {file_path}: {e}")
+    return removed_count
+
+
+async def write_record_batches(
+    path: str,
+    export_format: ExportFormat,
+    schema: Any,
+    batches: AsyncIterator[dict[str, list[Any]]],
+) -> int:
+    """Write column batches to a Parquet or Arrow IPC file.
+
+    Only one batch is held in memory at a time. The file is written next to
+    `path` and renamed once complete, so a file at `path` is always whole.
+
+    Parameters
+    ----------
+    path: str
+        Where the file is stored, see `get_export_path`.
+    export_format: ExportFormat
+        The file format.
+    schema: pyarrow.Schema
+        The columns of the file.
+    batches: AsyncIterator[dict[str, list[Any]]]
+        Column values by column name, one dict per record batch.
+
+    Returns
+    -------
+    int
+        The number of written rows.
+    """
+    pa = import_pyarrow()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial_path = f"{path}.partial"
+
+    if export_format is ExportFormat.PARQUET:
+        writer = pa.parquet.ParquetWriter(
+            partial_path, schema, compression="zstd"
+        )
+    else:
+        writer = pa.ipc.new_file(
+            partial_path,
+            schema,
+            options=pa.ipc.IpcWriteOptions(compression="zstd"),
+        )
+
+    row_count = 0
+    try:
+        async for columns in batches:
+            record_batch = pa.RecordBatch.from_pydict(columns, schema=schema)
+            writer.write_batch(record_batch)
+            row_count += record_batch.num_rows
+    finally:
+        writer.close()
+
+    os.replace(partial_path, path)
+    return row_count
@@ -1,3 +1,71 @@
+from datetime import timedelta
+from typing import Any
+
 from arq.connections import ArqRedis
+from arq.jobs import Job
+from redis.exceptions import RedisError
+
+from ..logger import logging
+
+logger = logging.getLogger(__name__)
 
 pool: ArqRedis | None = None
+
+FOLLOW_UP_JOB_DELAY = timedelta(seconds=30)
+
+
+async def enqueue_job(function: str, *args: Any, **kwargs: Any) -> Job | None:
+    """Enqueue a job, logging instead of raising if the queue is unavailable.
+
+    Arguments are passed to `ArqRedis.enqueue_job`.
+    """
+    if pool is None:
+        logger.warning(f"Queue is not initialized, skipping job {function}.")
+        return None
+
+    try:
+        return await pool.enqueue_job(function, *args, **kwargs)
+    except RedisError as e:
+        logger.error(f"Could not enqueue job {function}: {e}")
+        return None
+
+
+async def enqueue_follow_up_job(
+    function: str,
+    *args: Any,
+    deduplication_key: str,
+    defer_by: timedelta = FOLLOW_UP_JOB_DELAY,
+    **kwargs: Any,
+) -> Job | None:
+    """Enqueue work that may run after a write has been answered.
+
+    The job id is derived from `function` and `deduplication_key`, and arq
+    refuses a job whose id is already queued, so writes made while a job is
+    pending collapse into a single run. Such jobs should be registered with
+    `keep_result=0`, otherwise the id stays taken while the result is kept.
+
+    Failing to enqueue never fails the request, the error is only logged.
+
+    Parameters
+    ----------
+    function: str
+        The name of the registered worker job.
+    deduplication_key: str
+        Identifies the owner of the work, e.g. `user:1`.
+    defer_by: timedelta
+        How long to wait before running the job, so bursts of writes are
+        coalesced.
+
+    Returns
+    -------
+    Job | None
+        The enqueued job, or `None` if an equal job is already queued or
+        the queue is unavailable.
+    """
+    return await enqueue_job(
+        function,
+        *args,
+        _job_id=f"{function}:{deduplication_key}",
+        _defer_by=defer_by,
+        **kwargs,
+    )
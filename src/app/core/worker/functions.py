@@ -0,0 +1,330 @@
+import csv
+import os
+import uuid as uuid_pkg
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from ...crud.cascade import cascade_delete_owner, get_owners_pending_cascade
+from ...crud.crud_tags import cleanup_tags
+from ...crud.crud_transaction_item import export_transaction_items
+from ...crud.transaction_import import ImportOwner, import_transactions
+from ...schemas.cascade import CascadeDeleteReport
+from ...schemas.transaction_import import (
+    TransactionImportMapping,
+    TransactionImportReport,
+)
+from ..config import settings
+from ..db.crud_token_blacklist import purge_expired_tokens
+from ..db.database import local_session
+from ..db.partitioning import create_upcoming_partitions
+from ..db.retention import purge_soft_deleted
+from ..logger import logging
+from ..setup import (
+    close_database_pool,
+    close_redis_cache_pool,
+    create_redis_cache_pool,
+)
+from ..utils import queue
+from ..utils.export_store import (
+    ExportFormat,
+    get_export_path,
+    get_owner_key,
+    remove_expired_files,
+)
+from .registry import (
+    PROGRESS_EXPIRATION,
+    cron_job,
+    get_checkpoint,
+    job,
+    set_checkpoint,
+    set_progress,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# -------------- background tasks --------------
+# Daily, so a missed run still leaves months of partitions in place
+@cron_job(hour=3, minute=0, run_at_startup=True)
+async def maintain_partitions(ctx: dict[str, Any]) -> list[str]:
+    async with local_session() as db:
+        partitions = await create_upcoming_partitions(
+            db=db, months_ahead=settings.DATABASE_PARTITIONS_AHEAD
+        )
+
+    logger.info(f"Partitions up to date: {', '.join(partitions) or 'none'}")
+    return partitions
+
+
+# Enqueued after writes, deduplicated per owner, so no result is kept
+@job(keep_result=0)
+async def cleanup_owner_tags(
+    ctx: dict[str, Any], user_id: int | None = None, group_id: int | None = None
+) -> int:
+    async with local_session() as db:
+        report = await cleanup_tags(
+            db=db,
+            user_id=user_id,
+            group_id=group_id,
+            batch_size=settings.GC_BATCH_SIZE,
+            hard_delete=settings.TAG_GC_HARD_DELETE,
+            grace_period=timedelta(
+                minutes=settings.TAG_GC_GRACE_PERIOD_MINUTES
+            ),
+        )
+
+    logger.info(
+        f"Deleted {report.deleted_tag_count} orphaned tags "
+        f"(user_id={user_id}, group_id={group_id})"
+    )
+    return report.deleted_tag_count
+
+
+# Polled through the tasks endpoint, so the result is kept as long as progress
+@job(keep_result=PROGRESS_EXPIRATION, timeout=settings.LONG_JOB_TIMEOUT_SECONDS)
+async def cascade_delete(
+    ctx: dict[str, Any], user_id: int | None = None, group_id: int | None = None
+) -> dict[str, int]:
+    async def on_progress(report: CascadeDeleteReport) -> None:
+        await set_progress(ctx, report.model_dump())
+
+    async with local_session() as db:
+        report = await cascade_delete_owner(
+            db=db,
+            user_id=user_id,
+            group_id=group_id,
+            batch_size=settings.GC_BATCH_SIZE,
+            batch_delay=settings.GC_BATCH_DELAY_MS / 1000,
+            on_progress=on_progress,
+        )
+
+    logger.info(
+        f"Cascade delete (user_id={user_id}, group_id={group_id}): "
+        f"{report.model_dump_json()}"
+    )
+    return report.model_dump()
+
+
+# Deletions whose cascade was never enqueued, or was killed by its timeout,
+# are picked up once the cascade had that much time to finish
+@cron_job(minute=45)
+async def resume_cascade_deletes(ctx: dict[str, Any]) -> int:
+    async with local_session() as db:
+        user_ids, group_ids = await get_owners_pending_cascade(
+            db=db,
+            deleted_before=datetime.now(UTC)
+            - timedelta(seconds=settings.LONG_JOB_TIMEOUT_SECONDS),
+            limit=settings.GC_BATCH_SIZE,
+        )
+
+    owners = [{"user_id": user_id} for user_id in user_ids] + [
+        {"group_id": group_id} for group_id in group_ids
+    ]
+    enqueued_count = 0
+    for owner in owners:
+        # Marked until a cascade enqueued here had its time to finish. The
+        # job itself gets a random id, like cascades enqueued by the API.
+        key = f"worker:cascade:{get_owner_key(**owner)}"
+        if not await ctx["redis"].set(
+            key, 1, nx=True, ex=settings.LONG_JOB_TIMEOUT_SECONDS
+        ):
+            continue
+
+        cascade_job = await queue.enqueue_job("cascade_delete", **owner)
+        if cascade_job is None:
+            await ctx["redis"].delete(key)
+        else:
+            enqueued_count += 1
+
+    logger.info(f"Resumed the cascade of {enqueued_count} deletions")
+    return enqueued_count
+
+
+# Polled through the tasks endpoint, the file is named after the job id
+@job(keep_result=PROGRESS_EXPIRATION, timeout=settings.LONG_JOB_TIMEOUT_SECONDS)
+async def export_owner_transaction_items(
+    ctx: dict[str, Any],
+    export_format: str,
+    user_id: int | None = None,
+    group_id: int | None = None,
+) -> dict[str, int]:
+    async with local_session() as db:
+        row_count = await export_transaction_items(
+            db=db,
+            path=get_export_path(
+                owner_key=get_owner_key(user_id=user_id, group_id=group_id),
+                export_id=ctx["job_id"],
+                export_format=ExportFormat(export_format),
+            ),
+            export_format=ExportFormat(export_format),
+            user_id=user_id,
+            group_id=group_id,
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        )
+
+    logger.info(
+        f"Exported {row_count} transaction items "
+        f"(user_id={user_id}, group_id={group_id}, format={export_format})"
+    )
+    return {"row_count": row_count}
+
+
+def _remove_upload(path: str) -> None:
+    with suppress(FileNotFoundError):
+        os.remove(path)
+
+
+# Polled through the import endpoints, the upload is named after the job id
+@job(keep_result=PROGRESS_EXPIRATION, timeout=settings.LONG_JOB_TIMEOUT_SECONDS)
+async def import_owner_transactions(
+    ctx: dict[str, Any],
+    path: str,
+    mapping: dict[str, Any],
+    owner_id: int,
+    owner_uuid: uuid_pkg.UUID,
+    is_group: bool = False,
+    created_by_user_id: int | None = None,
+    created_by_user_uuid: uuid_pkg.UUID | None = None,
+) -> dict[str, Any]:
+    async def on_progress(report: TransactionImportReport) -> None:
+        await set_progress(
+            ctx,
+            report.model_dump(
+                include={"row_count", "invalid_row_count", "skipped_row_count"}
+            ),
+        )
+
+    try:
+        async with local_session() as db:
+            report = await import_transactions(
+                db=db,
+                owner=ImportOwner(
+                    id=owner_id,
+                    uuid=owner_uuid,
+                    is_group=is_group,
+                    created_by_user_id=created_by_user_id,
+                    created_by_user_uuid=created_by_user_uuid,
+                ),
+                path=path,
+                mapping=TransactionImportMapping(**mapping),
+                batch_size=settings.IMPORT_BATCH_SIZE,
+                on_progress=on_progress,
+            )
+    # Files that can't be read at all, e.g. a missing column or not UTF-8
+    except (ValueError, csv.Error) as e:
+        report = TransactionImportReport(errors=[str(e)])
+    # E.g. swept as expired before a retry of the job ran
+    except FileNotFoundError:
+        report = TransactionImportReport(
+            errors=["The uploaded file no longer exists"]
+        )
+    # Failed for good, arq only retries jobs that were cancelled, e.g. by a
+    # worker restart, and those still need the upload
+    except Exception:
+        _remove_upload(path)
+        raise
+    _remove_upload(path)
+
+    logger.info(
+        f"Transaction import (owner_id={owner_id}, is_group={is_group}): "
+        f"{report.model_dump_json(exclude={'errors'})}"
+    )
+    return report.model_dump()
+
+
+@cron_job(minute=15)
+async def purge_expired_files(ctx: dict[str, Any]) -> int:
+    max_age_seconds = settings.EXPORT_EXPIRATION_HOURS * 60 * 60
+    removed_count = remove_expired_files(
+        settings.EXPORT_STORE_PATH, max_age_seconds=max_age_seconds
+    )
+    # Uploads normally are removed by their job, unless it never ran
+    removed_count += remove_expired_files(
+        settings.IMPORT_STORE_PATH, max_age_seconds=max_age_seconds
+    )
+    logger.info(f"Removed {removed_count} expired export and import files")
+    return removed_count
+
+
+@cron_job(hour=4, minute=0)
+async def collect_orphaned_tags(
+    ctx: dict[str, Any], dry_run: bool = False
+) -> dict[str, Any]:
+    # Large tables take several runs, each one continues where the last ended
+    checkpoint = await get_checkpoint(ctx, "collect_orphaned_tags")
+    async with local_session() as db:
+        report = await cleanup_tags(
+            db=db,
+            after_id=int(checkpoint) if checkpoint and not dry_run else 0,
+            batch_size=settings.GC_BATCH_SIZE,
+            max_batches=settings.GC_MAX_BATCHES_PER_RUN,
+            batch_delay=settings.GC_BATCH_DELAY_MS / 1000,
+            hard_delete=settings.TAG_GC_HARD_DELETE,
+            grace_period=timedelta(
+                minutes=settings.TAG_GC_GRACE_PERIOD_MINUTES
+            ),
+            dry_run=dry_run,
+        )
+    if not dry_run:
+        await set_checkpoint(
+            ctx,
+            "collect_orphaned_tags",
+            (
+                None
+                if report.resume_after_id is None
+                else str(report.resume_after_id)
+            ),
+        )
+
+    logger.info(f"Orphaned tag collection: {report.model_dump_json()}")
+    return report.model_dump()
+
+
+@cron_job(minute=30)
+async def purge_token_blacklist(ctx: dict[str, Any]) -> int:
+    async with local_session() as db:
+        deleted_count = await purge_expired_tokens(
+            db=db,
+            batch_size=settings.GC_BATCH_SIZE,
+            max_batches=settings.GC_MAX_BATCHES_PER_RUN,
+            batch_delay=settings.GC_BATCH_DELAY_MS / 1000,
+        )
+
+    logger.info(f"Purged {deleted_count} expired blacklisted tokens")
+    return deleted_count
+
+
+@cron_job(hour=5, minute=0)
+async def purge_soft_deleted_rows(ctx: dict[str, Any]) -> dict[str, Any]:
+    checkpoint = await get_checkpoint(ctx, "purge_soft_deleted_rows")
+    async with local_session() as db:
+        report = await purge_soft_deleted(
+            db=db,
+            deleted_before=datetime.now(UTC)
+            - timedelta(days=settings.SOFT_DELETE_RETENTION_DAYS),
+            resume_after=checkpoint,
+            batch_size=settings.GC_BATCH_SIZE,
+            max_batches=settings.GC_MAX_BATCHES_PER_RUN,
+            batch_delay=settings.GC_BATCH_DELAY_MS / 1000,
+            archive=settings.SOFT_DELETE_ARCHIVE,
+        )
+    await set_checkpoint(ctx, "purge_soft_deleted_rows", report.resume_after)
+
+    logger.info(f"Soft deleted row purge: {report.model_dump_json()}")
+    return report.model_dump()
+
+
+# -------------- base functions --------------
+async def startup(ctx: dict[str, Any]) -> None:
+    # Same clients as the API, so jobs can reuse its cache and queue helpers
+    await create_redis_cache_pool()
+    queue.pool = ctx["redis"]
+    logger.info("Worker started")
+
+
+async def shutdown(ctx: dict[str, Any]) -> None:
+    await close_redis_cache_pool()
+    queue.pool = None
+    await close_database_pool()
+    logger.info("Worker stopped")
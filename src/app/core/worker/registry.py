@@ -0,0 +1,193 @@
+import functools
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from arq import cron
+from arq import func as arq_func
+from arq.cron import CronJob
+from arq.worker import Function
+from redis.exceptions import RedisError
+
+from ..db.instrumentation import QueryStats, collect_query_stats
+from ..logger import logging
+
+logger = logging.getLogger(__name__)
+
+JobFunction = Callable[..., Awaitable[Any]]
+
+# Filled by the `job` and `cron_job` decorators at import time
+functions: list[JobFunction | Function] = []
+cron_jobs: list[CronJob] = []
+
+PROGRESS_EXPIRATION = 24 * 60 * 60
+
+
+def get_metrics_key(job_name: str) -> str:
+    return f"worker:metrics:{job_name}"
+
+
+def get_checkpoint_key(job_name: str) -> str:
+    return f"worker:checkpoint:{job_name}"
+
+
+def get_progress_key(job_id: str) -> str:
+    return f"worker:progress:{job_id}"
+
+
+async def set_progress(ctx: dict[str, Any], progress: dict[str, int]) -> None:
+    """Publish the progress of the running job, e.g. counts of handled rows.
+
+    Kept for `PROGRESS_EXPIRATION` seconds after the last update, so it can
+    be polled while the job runs and shortly after it finished.
+    """
+    redis = ctx.get("redis")
+    if redis is None or ctx.get("job_id") is None:
+        return
+
+    key = get_progress_key(ctx["job_id"])
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=progress)
+            pipe.expire(key, PROGRESS_EXPIRATION)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not store progress of job {ctx['job_id']}: {e}")
+
+
+async def get_progress(redis: Any, job_id: str) -> dict[str, int]:
+    progress = await redis.hgetall(get_progress_key(job_id))
+    return {
+        (key.decode() if isinstance(key, bytes) else key): int(value)
+        for key, value in progress.items()
+    }
+
+
+async def get_checkpoint(ctx: dict[str, Any], job_name: str) -> str | None:
+    """Get where the previous run of a resumable job stopped."""
+    redis = ctx.get("redis")
+    if redis is None:
+        return None
+
+    checkpoint = await redis.get(get_checkpoint_key(job_name))
+    return checkpoint.decode() if isinstance(checkpoint, bytes) else checkpoint
+
+
+async def set_checkpoint(
+    ctx: dict[str, Any], job_name: str, checkpoint: str | None
+) -> None:
+    """Store where a resumable job stopped, `None` once it has finished."""
+    redis = ctx.get("redis")
+    if redis is None:
+        return
+
+    if checkpoint is None:
+        await redis.delete(get_checkpoint_key(job_name))
+    else:
+        await redis.set(get_checkpoint_key(job_name), checkpoint)
+
+
+async def _record_metrics(
+    ctx: dict[str, Any],
+    job_name: str,
+    succeeded: bool,
+    duration_ms: float,
+    query_stats: QueryStats,
+) -> None:
+    logger.info(
+        f"job={job_name} status={'ok' if succeeded else 'failed'} "
+        f"duration_ms={duration_ms:.1f} "
+        f"db_query_count={query_stats.count} "
+        f"db_time_ms={query_stats.duration * 1000:.1f}"
+    )
+
+    redis = ctx.get("redis")
+    if redis is None:
+        return
+
+    key = get_metrics_key(job_name)
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hincrby(key, "runs", 1)
+            pipe.hincrby(key, "failures", 0 if succeeded else 1)
+            pipe.hincrbyfloat(key, "duration_ms", duration_ms)
+            pipe.hincrby(key, "db_query_count", query_stats.count)
+            pipe.hset(key, "last_duration_ms", f"{duration_ms:.1f}")
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not record metrics of job {job_name}: {e}")
+
+
+def _with_metrics(func: JobFunction) -> JobFunction:
+    @functools.wraps(func)
+    async def wrapper(ctx: dict[str, Any], *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        succeeded = False
+        with collect_query_stats() as query_stats:
+            try:
+                result = await func(ctx, *args, **kwargs)
+                succeeded = True
+                return result
+            finally:
+                await _record_metrics(
+                    ctx,
+                    job_name=func.__qualname__,
+                    succeeded=succeeded,
+                    duration_ms=(time.perf_counter() - start) * 1000,
+                    query_stats=query_stats,
+                )
+
+    return wrapper
+
+
+def job(
+    func: JobFunction | None = None, **options: Any
+) -> JobFunction | Callable[[JobFunction], JobFunction]:
+    """Register a function as a worker job.
+
+    Every run is timed and its database queries are counted. The numbers are
+    logged and accumulated in the `worker:metrics:<job name>` Redis hash.
+    Keyword arguments, e.g. `keep_result` or `timeout`, are passed to
+    `arq.func`.
+
+    Example
+    -------
+    ```python
+    @job
+    async def send_report(ctx: dict[str, Any], user_id: int) -> None:
+        ...
+
+    await queue.pool.enqueue_job("send_report", user_id)
+    ```
+    """
+
+    def decorator(func: JobFunction) -> JobFunction:
+        wrapper = _with_metrics(func)
+        functions.append(arq_func(wrapper, **options) if options else wrapper)
+        return wrapper
+
+    if func is None:
+        return decorator
+    return decorator(func)
+
+
+def cron_job(**kwargs: Any) -> Callable[[JobFunction], JobFunction]:
+    """Register a function as a worker job that also runs on a schedule.
+
+    Keyword arguments are passed to `arq.cron`.
+
+    Example
+    -------
+    ```python
+    @cron_job(hour=3, minute=0)
+    async def nightly_cleanup(ctx: dict[str, Any]) -> None:
+        ...
+    ```
+    """
+
+    def decorator(func: JobFunction) -> JobFunction:
+        wrapper = job(func)
+        cron_jobs.append(cron(wrapper, **kwargs))  # type: ignore
+        return wrapper  # type: ignore
+
+    return decorator
@@ -0,0 +1,17 @@
+from arq.connections import RedisSettings
+
+from ..config import settings
+from . import registry
+from .functions import shutdown, startup
+
+
+class WorkerSettings:
+    # Importing `functions` registers the jobs
+    functions = registry.functions
+    cron_jobs = registry.cron_jobs
+    redis_settings = RedisSettings(
+        host=settings.REDIS_QUEUE_HOST, port=settings.REDIS_QUEUE_PORT
+    )
+    on_startup = startup
+    on_shutdown = shutdown
+    handle_signals = False
@@ -0,0 +1,251 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+from sqlalchemy import ColumnElement, Select, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.group import Group
+from ..models.links.group_purchase_category import GroupPurchaseCategory
+from ..models.links.group_tag import GroupTag
+from ..models.links.transaction_item_tag import TransactionItemTag
+from ..models.links.user_purchase_category import UserPurchaseCategory
+from ..models.links.user_tag import UserTag
+from ..models.purchase_category import PurchaseCategory
+from ..models.tag import Tag
+from ..models.transaction import Transaction
+from ..models.transaction_item import TransactionItem
+from ..models.user import User
+from ..schemas.cascade import CascadeDeleteReport
+from .crud_transactions import delete_transactions
+
+# A user or group id, or a column of them in correlated subqueries
+OwnerId = int | ColumnElement[int] | None
+
+
+def _get_owned_ids(
+    model: type[Transaction] | type[TransactionItem],
+    user_id: OwnerId,
+    group_id: OwnerId,
+) -> Select:
+    owner_filter = (
+        model.owner_user_id == user_id
+        if user_id is not None
+        else model.owner_group_id == group_id
+    )
+    return select(model.id).filter(owner_filter, model.is_deleted.is_(False))
+
+
+def _get_owned_tag_ids(user_id: OwnerId, group_id: OwnerId) -> Select:
+    if user_id is not None:
+        return select(UserTag.tag_id).filter(UserTag.user_id == user_id)
+    return select(GroupTag.tag_id).filter(GroupTag.group_id == group_id)
+
+
+def _get_owned_purchase_category_ids(
+    user_id: OwnerId, group_id: OwnerId
+) -> Select:
+    if user_id is not None:
+        return select(UserPurchaseCategory.purchase_category_id).filter(
+            UserPurchaseCategory.user_id == user_id
+        )
+    return select(GroupPurchaseCategory.purchase_category_id).filter(
+        GroupPurchaseCategory.group_id == group_id
+    )
+
+
+def _has_live_rows(user_id: OwnerId, group_id: OwnerId) -> ColumnElement[bool]:
+    # Nested two levels deep, the link subqueries would not correlate to the
+    # owner on their own
+    return or_(
+        _get_owned_ids(Transaction, user_id, group_id).exists(),
+        _get_owned_ids(TransactionItem, user_id, group_id).exists(),
+        select(Tag.id)
+        .filter(
+            Tag.id.in_(
+                _get_owned_tag_ids(user_id, group_id).correlate_except(
+                    UserTag, GroupTag
+                )
+            ),
+            Tag.is_deleted.is_(False),
+        )
+        .exists(),
+        select(PurchaseCategory.id)
+        .filter(
+            PurchaseCategory.id.in_(
+                _get_owned_purchase_category_ids(
+                    user_id, group_id
+                ).correlate_except(UserPurchaseCategory, GroupPurchaseCategory)
+            ),
+            PurchaseCategory.is_deleted.is_(False),
+        )
+        .exists(),
+    )
+
+
+async def get_owners_pending_cascade(
+    db: AsyncSession, *, deleted_before: datetime, limit: int
+) -> tuple[list[int], list[int]]:
+    """Get the ids of users and groups deleted before `deleted_before` that
+    still own live rows, e.g. because their cascade could not be enqueued.
+    """
+    user_ids = (
+        await db.execute(
+            select(User.id)
+            .filter(
+                User.is_deleted.is_(True),
+                User.deleted_at < deleted_before,
+                _has_live_rows(User.id, None),
+            )
+            .order_by(User.id)
+            .limit(limit)
+        )
+    ).scalars()
+    group_ids = (
+        await db.execute(
+            select(Group.id)
+            .filter(
+                Group.is_deleted.is_(True),
+                Group.deleted_at < deleted_before,
+                _has_live_rows(None, Group.id),
+            )
+            .order_by(Group.id)
+            .limit(limit)
+        )
+    ).scalars()
+    return list(user_ids), list(group_ids)
+
+
+async def _delete_transaction_batch(
+    db: AsyncSession, user_id: int | None, group_id: int | None, limit: int
+) -> int:
+    transactions = list(
+        (
+            await db.execute(
+                select(Transaction).filter(
+                    Transaction.id.in_(
+                        _get_owned_ids(Transaction, user_id, group_id).limit(
+                            limit
+                        )
+                    )
+                )
+            )
+        ).scalars()
+    )
+    await delete_transactions(db=db, transactions=transactions)
+    return len(transactions)
+
+
+async def _delete_transaction_item_batch(
+    db: AsyncSession, user_id: int | None, group_id: int | None, limit: int
+) -> int:
+    # Items left over without a live transaction
+    transaction_item_ids = list(
+        (
+            await db.execute(
+                _get_owned_ids(TransactionItem, user_id, group_id).limit(limit)
+            )
+        ).scalars()
+    )
+    await db.execute(
+        delete(TransactionItemTag).filter(
+            TransactionItemTag.transaction_item_id.in_(transaction_item_ids)
+        )
+    )
+    result = await db.execute(
+        update(TransactionItem)
+        .filter(
+            TransactionItem.id.in_(transaction_item_ids),
+            TransactionItem.is_deleted.is_(False),
+        )
+        .values(is_deleted=True, deleted_at=datetime.now(UTC))
+    )
+    await db.commit()
+    return result.rowcount  # type: ignore
+
+
+async def _delete_batch(
+    db: AsyncSession,
+    model: type[Tag] | type[PurchaseCategory],
+    owned_ids: Select,
+    limit: int,
+) -> int:
+    batch_ids = (
+        select(model.id)
+        .filter(model.id.in_(owned_ids), model.is_deleted.is_(False))
+        .limit(limit)
+    )
+    result = await db.execute(
+        update(model)
+        .filter(model.id.in_(batch_ids))
+        .values(is_deleted=True, deleted_at=datetime.now(UTC))
+    )
+    await db.commit()
+    return result.rowcount  # type: ignore
+
+
+async def cascade_delete_owner(
+    db: AsyncSession,
+    *,
+    user_id: int | None = None,
+    group_id: int | None = None,
+    batch_size: int = 1000,
+    batch_delay: float = 0,
+    on_progress: Callable[[CascadeDeleteReport], Awaitable[None]] | None = None,
+) -> CascadeDeleteReport:
+    """Soft delete everything a deleted user or group owns.
+
+    Transactions with their items, remaining items, tags and purchase
+    categories are deleted in that order, in batches of `batch_size` rows
+    that are each committed separately, waiting `batch_delay` seconds in
+    between. `on_progress` is awaited with the report after every batch.
+
+    Only live rows are picked up, so an interrupted run can simply be
+    repeated.
+    """
+    report = CascadeDeleteReport()
+    steps: list[tuple[str, Callable[[], Awaitable[int]]]] = [
+        (
+            "transaction_count",
+            lambda: _delete_transaction_batch(
+                db, user_id, group_id, batch_size
+            ),
+        ),
+        (
+            "transaction_item_count",
+            lambda: _delete_transaction_item_batch(
+                db, user_id, group_id, batch_size
+            ),
+        ),
+        (
+            "tag_count",
+            lambda: _delete_batch(
+                db, Tag, _get_owned_tag_ids(user_id, group_id), batch_size
+            ),
+        ),
+        (
+            "purchase_category_count",
+            lambda: _delete_batch(
+                db,
+                PurchaseCategory,
+                _get_owned_purchase_category_ids(user_id, group_id),
+                batch_size,
+            ),
+        ),
+    ]
+
+    for counter, delete_batch in steps:
+        while True:
+            if report.batch_count > 0 and batch_delay > 0:
+                await asyncio.sleep(batch_delay)
+
+            deleted_count = await delete_batch()
+            report.batch_count += 1
+            setattr(report, counter, getattr(report, counter) + deleted_count)
+            if on_progress is not None:
+                await on_progress(report)
+
+            if deleted_count < batch_size:
+                break
+
+    return report
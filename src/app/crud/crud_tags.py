@@ -1,7 +1,17 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
 from fastcrud import FastCRUD
+from sqlalchemy import Exists, Select, delete, exists, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..models.links.group_tag import GroupTag
+from ..models.links.transaction_item_tag import TransactionItemTag
+from ..models.links.user_tag import UserTag
 from ..models.tag import Tag
+from ..models.transaction_item import TransactionItem
 from ..schemas.tag import (
+    TagCleanupReport,
     TagCreateInternal,
     TagDelete,
     TagUpdateInternal,
@@ -18,5 +28,191 @@ CRUDTag = FastCRUD[
 crud_tags = CRUDTag(Tag)
 
 
-def cleanup_tags():
-    raise NotImplementedError
+def _is_used() -> Exists:
+    return exists().where(
+        TransactionItemTag.tag_id == Tag.id,
+        TransactionItem.id == TransactionItemTag.transaction_item_id,
+        TransactionItem.is_deleted.is_(False),
+    )
+
+
+def _get_owned_tag_ids(user_id: int | None, group_id: int | None) -> Select:
+    if user_id is not None:
+        return select(UserTag.tag_id).filter(UserTag.user_id == user_id)
+    return select(GroupTag.tag_id).filter(GroupTag.group_id == group_id)
+
+
+async def get_owned_tags_for_share(
+    db: AsyncSession,
+    *,
+    tag_names: list[str],
+    user_id: int | None = None,
+    group_id: int | None = None,
+) -> dict[str, Tag]:
+    """Get the live tags of an owner by name.
+
+    The tags are locked `FOR SHARE` until the end of the transaction, which
+    blocks `delete_tags` from deleting them before they are linked.
+    """
+    result = await db.execute(
+        select(Tag)
+        .filter(
+            Tag.tag_name.in_(tag_names),
+            Tag.is_deleted.is_(False),
+            Tag.id.in_(_get_owned_tag_ids(user_id=user_id, group_id=group_id)),
+        )
+        .order_by(Tag.id)
+        .with_for_update(read=True)
+    )
+    tags: dict[str, Tag] = {}
+    for tag in result.scalars():
+        tags.setdefault(tag.tag_name, tag)
+    return tags
+
+
+async def touch_tags_of_transaction_items(
+    db: AsyncSession, transaction_item_ids: Select | list[int]
+) -> None:
+    """Set `updated_at` of the tags linked to the items, before they are
+    unlinked, so their garbage collection waits for the grace period."""
+    await db.execute(
+        update(Tag)
+        .filter(
+            Tag.id.in_(
+                select(TransactionItemTag.tag_id).filter(
+                    TransactionItemTag.transaction_item_id.in_(
+                        transaction_item_ids
+                    )
+                )
+            ),
+            Tag.is_deleted.is_(False),
+        )
+        .values(updated_at=datetime.now(UTC))
+    )
+
+
+async def get_orphaned_tag_ids(
+    db: AsyncSession,
+    *,
+    after_id: int = 0,
+    limit: int,
+    user_id: int | None = None,
+    group_id: int | None = None,
+    grace_period: timedelta = timedelta(0),
+) -> list[int]:
+    """Get the ids of live tags, in ascending order after `after_id`, that
+    no live transaction item uses, optionally only those of one owner.
+
+    Tags created or updated, e.g. unlinked, within `grace_period` are
+    skipped, they are likely about to be linked again.
+    """
+    cutoff = datetime.now(UTC) - grace_period
+    statement = (
+        select(Tag.id)
+        .filter(
+            Tag.id > after_id,
+            Tag.is_deleted.is_(False),
+            Tag.created_at < cutoff,
+            or_(Tag.updated_at.is_(None), Tag.updated_at < cutoff),
+            ~_is_used(),
+        )
+        .order_by(Tag.id)
+        .limit(limit)
+    )
+    if user_id is not None or group_id is not None:
+        statement = statement.filter(
+            Tag.id.in_(_get_owned_tag_ids(user_id=user_id, group_id=group_id))
+        )
+    return list((await db.execute(statement)).scalars())
+
+
+async def delete_tags(
+    db: AsyncSession, tag_ids: list[int], hard_delete: bool = False
+) -> int:
+    """Delete tags, either by flagging them or together with their links.
+
+    Tags that got used again since they were found are skipped. Returns the
+    number of deleted tags.
+    """
+    # Locking the tags waits for transactions that are linking them, see
+    # `get_owned_tags_for_share`, and blocks new links until the commit.
+    # Usage is checked by a later statement, whose snapshot sees the links
+    # committed while waiting.
+    await db.execute(
+        select(Tag.id).filter(Tag.id.in_(tag_ids)).with_for_update()
+    )
+    tag_ids = list(
+        (
+            await db.execute(
+                select(Tag.id).filter(Tag.id.in_(tag_ids), ~_is_used())
+            )
+        ).scalars()
+    )
+    if hard_delete:
+        for link_model in (TransactionItemTag, UserTag, GroupTag):
+            await db.execute(
+                delete(link_model).filter(link_model.tag_id.in_(tag_ids))
+            )
+        result = await db.execute(delete(Tag).filter(Tag.id.in_(tag_ids)))
+    else:
+        result = await db.execute(
+            update(Tag)
+            .filter(Tag.id.in_(tag_ids), Tag.is_deleted.is_(False))
+            .values(is_deleted=True, deleted_at=datetime.now(UTC))
+        )
+    await db.commit()
+    return result.rowcount  # type: ignore
+
+
+async def cleanup_tags(
+    db: AsyncSession,
+    *,
+    user_id: int | None = None,
+    group_id: int | None = None,
+    after_id: int = 0,
+    batch_size: int = 1000,
+    max_batches: int | None = None,
+    batch_delay: float = 0,
+    hard_delete: bool = False,
+    dry_run: bool = False,
+    grace_period: timedelta = timedelta(0),
+) -> TagCleanupReport:
+    """Delete tags that no live transaction item uses anymore.
+
+    Tags are scanned in batches of `batch_size` by ascending id, each batch
+    is deleted in its own transaction and `batch_delay` seconds are waited
+    between batches. With `dry_run` the orphaned tags are only counted.
+    Tags created or updated within `grace_period` are kept.
+
+    If `max_batches` is reached before all tags were scanned, the report's
+    `resume_after_id` tells where to continue.
+    """
+    report = TagCleanupReport(dry_run=dry_run, hard_delete=hard_delete)
+    while max_batches is None or report.batch_count < max_batches:
+        if report.batch_count > 0 and batch_delay > 0:
+            await asyncio.sleep(batch_delay)
+
+        tag_ids = await get_orphaned_tag_ids(
+            db=db,
+            after_id=after_id,
+            limit=batch_size,
+            user_id=user_id,
+            group_id=group_id,
+            grace_period=grace_period,
+        )
+        if len(tag_ids) == 0:
+            return report
+
+        report.batch_count += 1
+        report.orphaned_tag_count += len(tag_ids)
+        if not dry_run:
+            report.deleted_tag_count += await delete_tags(
+                db=db, tag_ids=tag_ids, hard_delete=hard_delete
+            )
+        after_id = tag_ids[-1]
+
+        if len(tag_ids) < batch_size:
+            return report
+
+    report.resume_after_id = after_id
+    return report
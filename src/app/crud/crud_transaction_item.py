@@ -1,6 +1,23 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
 from fastcrud import FastCRUD
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.utils.export_store import (
+    ExportFormat,
+    import_pyarrow,
+    write_record_batches,
+)
+from ..models.links.transaction_item_tag import TransactionItemTag
+from ..models.purchase_category import PurchaseCategory
+from ..models.tag import Tag
+from ..models.transaction import Transaction
 from ..models.transaction_item import TransactionItem
+from ..schemas.mixins.amount import to_major_units
 from ..schemas.transaction_item import (
     TransactionItemCreateInternal,
     TransactionItemDelete,
@@ -16,3 +33,137 @@ CRUDTransactionItem = FastCRUD[
     TransactionItemDelete,
 ]
 crud_transaction_item = CRUDTransactionItem(TransactionItem)
+
+
+def select_transaction_items_for_export(
+    *,
+    user_id: int | None = None,
+    group_id: int | None = None,
+    before: datetime | None = None,
+    after: datetime | None = None,
+) -> Select:
+    """Select the live items of an owner with their transaction, purchase
+    category and the list of its tag names, one row per item, ordered by
+    timestamp.
+
+    Tags are aggregated by a correlated subquery rather than a `GROUP BY`,
+    so rows can be streamed without sorting the whole result first.
+    """
+    tag_names = (
+        select(func.array_agg(aggregate_order_by(Tag.tag_name, Tag.tag_name)))
+        .join(TransactionItemTag, TransactionItemTag.tag_id == Tag.id)
+        .filter(
+            TransactionItemTag.transaction_item_id == TransactionItem.id,
+            Tag.is_deleted.is_(False),
+        )
+        .scalar_subquery()
+    )
+    statement = (
+        select(
+            Transaction.uuid.label("transaction_uuid"),
+            TransactionItem.timestamp,
+            Transaction.name.label("transaction_name"),
+            Transaction.description.label("transaction_description"),
+            TransactionItem.uuid.label("transaction_item_uuid"),
+            TransactionItem.name,
+            TransactionItem.description,
+            TransactionItem.amount_minor,
+            func.coalesce(TransactionItem.currency, Transaction.currency).label(
+                "currency"
+            ),
+            PurchaseCategory.category_name.label("purchase_category"),
+            tag_names.label("tags"),
+        )
+        .join(Transaction, Transaction.id == TransactionItem.transaction_id)
+        .outerjoin(
+            PurchaseCategory,
+            PurchaseCategory.id == TransactionItem.purchase_category_id,
+        )
+        .filter(
+            TransactionItem.is_deleted.is_(False),
+            Transaction.is_deleted.is_(False),
+        )
+        .order_by(Transaction.timestamp, Transaction.id, TransactionItem.id)
+    )
+    if user_id is not None:
+        statement = statement.filter(Transaction.owner_user_id == user_id)
+    else:
+        statement = statement.filter(Transaction.owner_group_id == group_id)
+    # Items share the timestamp of their transaction, filtering both lets
+    # Postgres prune the partitions of both tables
+    if before is not None:
+        statement = statement.filter(
+            Transaction.timestamp < before, TransactionItem.timestamp < before
+        )
+    if after is not None:
+        statement = statement.filter(
+            Transaction.timestamp > after, TransactionItem.timestamp > after
+        )
+    return statement
+
+
+async def export_transaction_items(
+    db: AsyncSession,
+    *,
+    path: str,
+    export_format: ExportFormat,
+    user_id: int | None = None,
+    group_id: int | None = None,
+    batch_size: int = 10000,
+) -> int:
+    """Write the live items of an owner to a Parquet or Arrow IPC file.
+
+    Rows are streamed from a server side cursor and written as one record
+    batch per `batch_size` rows. Returns the number of written rows.
+    """
+    pa = import_pyarrow()
+    schema = pa.schema(
+        [
+            ("transaction_uuid", pa.string()),
+            ("timestamp", pa.timestamp("us", tz="UTC")),
+            ("transaction_name", pa.string()),
+            ("transaction_description", pa.string()),
+            ("transaction_item_uuid", pa.string()),
+            ("name", pa.string()),
+            ("description", pa.string()),
+            ("amount_minor", pa.int64()),
+            ("amount", pa.float64()),
+            # Parquet dictionary encodes repeated strings by itself
+            ("currency", pa.string()),
+            ("purchase_category", pa.string()),
+            ("tags", pa.list_(pa.string())),
+        ]
+    )
+
+    async def batches() -> AsyncIterator[dict[str, list[Any]]]:
+        result = await db.stream(
+            select_transaction_items_for_export(
+                user_id=user_id, group_id=group_id
+            ).execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield {
+                "transaction_uuid": [str(row.transaction_uuid) for row in rows],
+                "timestamp": [row.timestamp for row in rows],
+                "transaction_name": [row.transaction_name for row in rows],
+                "transaction_description": [
+                    row.transaction_description for row in rows
+                ],
+                "transaction_item_uuid": [
+                    str(row.transaction_item_uuid) for row in rows
+                ],
+                "name": [row.name for row in rows],
+                "description": [row.description for row in rows],
+                "amount_minor": [row.amount_minor for row in rows],
+                "amount": [
+                    to_major_units(row.amount_minor, row.currency)
+                    for row in rows
+                ],
+                "currency": [row.currency.value for row in rows],
+                "purchase_category": [row.purchase_category for row in rows],
+                "tags": [row.tags or [] for row in rows],
+            }
+
+    return await write_record_batches(
+        path=path, export_format=export_format, schema=schema, batches=batches()
+    )
@@ -1,12 +1,26 @@
+import hashlib
+from datetime import UTC, datetime
+
 from fastcrud import FastCRUD
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..models.links.transaction_item_tag import TransactionItemTag
+from ..models.links.transaction_transaction_item import (
+    TransactionTransactionItem,
+)
 from ..models.transaction import Transaction
+from ..models.transaction_item import TransactionItem
+from ..schemas.transaction import (
+    Transaction as TransactionSchema,
+)
 from ..schemas.transaction import (
     TransactionCreateInternal,
     TransactionDelete,
     TransactionUpdateInternal,
     TransactionUpdate,
 )
+from .crud_tags import touch_tags_of_transaction_items
 
 CRUDTransaction = FastCRUD[
     Transaction,
@@ -16,3 +30,85 @@ CRUDTransaction = FastCRUD[
     TransactionDelete,
 ]
 crud_transactions = CRUDTransaction(Transaction)
+
+
+def get_transaction_fingerprint(
+    owner_key: str,
+    timestamp: datetime,
+    amount_minor: int,
+    currency: str,
+    name: str | None,
+) -> bytes:
+    """SHA-256 of what identifies a transaction for deduplication.
+
+    Names are compared case insensitively with whitespace collapsed, and
+    timestamps in UTC, so the same bank statement row always gets the same
+    fingerprint. `owner_key` is the key from `get_owner_key`.
+    """
+    normalized_name = " ".join((name or "").split()).casefold()
+    content = "\x1f".join(
+        (
+            owner_key,
+            timestamp.astimezone(UTC).isoformat(timespec="microseconds"),
+            str(amount_minor),
+            currency,
+            normalized_name,
+        )
+    )
+    return hashlib.sha256(content.encode()).digest()
+
+
+async def delete_transactions(
+    db: AsyncSession, transactions: list[TransactionSchema | Transaction]
+) -> None:
+    """Soft delete transactions together with their items.
+
+    Items are soft deleted with one UPDATE, their tag and transaction links
+    are removed with one DELETE per link table, and the transactions are
+    soft deleted with a final UPDATE, all committed at once.
+    """
+    if len(transactions) == 0:
+        return
+
+    transaction_ids = [transaction.id for transaction in transactions]
+    # Items share the timestamp of their transaction, which lets Postgres
+    # prune partitions when the tables are partitioned
+    timestamps = list({transaction.timestamp for transaction in transactions})
+    deleted_at = datetime.now(UTC)
+
+    transaction_item_ids = select(TransactionItem.id).filter(
+        TransactionItem.transaction_id.in_(transaction_ids),
+        TransactionItem.timestamp.in_(timestamps),
+    )
+    await touch_tags_of_transaction_items(
+        db=db, transaction_item_ids=transaction_item_ids
+    )
+    await db.execute(
+        delete(TransactionItemTag).filter(
+            TransactionItemTag.transaction_item_id.in_(transaction_item_ids)
+        )
+    )
+    await db.execute(
+        delete(TransactionTransactionItem).filter(
+            TransactionTransactionItem.transaction_id.in_(transaction_ids)
+        )
+    )
+    await db.execute(
+        update(TransactionItem)
+        .filter(
+            TransactionItem.transaction_id.in_(transaction_ids),
+            TransactionItem.timestamp.in_(timestamps),
+            TransactionItem.is_deleted.is_(False),
+        )
+        .values(is_deleted=True, deleted_at=deleted_at)
+    )
+    await db.execute(
+        update(Transaction)
+        .filter(
+            Transaction.id.in_(transaction_ids),
+            Transaction.timestamp.in_(timestamps),
+            Transaction.is_deleted.is_(False),
+        )
+        .values(is_deleted=True, deleted_at=deleted_at)
+    )
+    await db.commit()
@@ -0,0 +1,649 @@
+import csv
+import os
+import uuid as uuid_pkg
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Integer,
+    LargeBinary,
+    MetaData,
+    Select,
+    String,
+    Table,
+    Uuid,
+    exists,
+    false,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, ENUM
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.utils.export_store import get_owner_key
+from ..core.utils.uuid7 import uuid7
+from ..models.links.group_purchase_category import GroupPurchaseCategory
+from ..models.links.group_tag import GroupTag
+from ..models.links.group_transaction import GroupTransaction
+from ..models.links.transaction_item_tag import TransactionItemTag
+from ..models.links.transaction_transaction_item import (
+    TransactionTransactionItem,
+)
+from ..models.links.user_purchase_category import UserPurchaseCategory
+from ..models.links.user_tag import UserTag
+from ..models.links.user_transaction import UserTransaction
+from ..models.purchase_category import PurchaseCategory
+from ..models.tag import Tag
+from ..models.transaction import Currency, Transaction
+from ..models.transaction_item import TransactionItem
+from ..schemas.mixins.amount import to_minor_units
+from ..schemas.transaction_import import (
+    TransactionImportMapping,
+    TransactionImportReport,
+)
+from .crud_transactions import get_transaction_fingerprint
+
+# Only this many errors are listed in the report, the rest are counted
+MAX_REPORTED_ERRORS = 20
+
+# Dropped at the end of the import transaction, so concurrent imports on
+# other connections never see each other's rows
+_staging_metadata = MetaData()
+transaction_import_staging = Table(
+    "transaction_import_staging",
+    _staging_metadata,
+    Column("line", Integer),
+    Column("transaction_uuid", Uuid),
+    Column("transaction_item_uuid", Uuid),
+    Column("timestamp", DateTime(timezone=True)),
+    Column("amount_minor", BigInteger),
+    Column("currency", ENUM(Currency, name="currency", create_type=False)),
+    Column("name", String),
+    Column("description", String),
+    Column("purchase_category_name", String),
+    Column("tag_names", ARRAY(String)),
+    Column("fingerprint", LargeBinary),
+    # Resolved by the import
+    Column("purchase_category_id", Integer),
+    Column("purchase_category_uuid", Uuid),
+    Column("transaction_id", Integer),
+    Column("transaction_item_id", Integer),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+# Filled from the CSV, in this order
+_STAGED_COLUMNS = (
+    "line",
+    "transaction_uuid",
+    "transaction_item_uuid",
+    "timestamp",
+    "amount_minor",
+    "currency",
+    "name",
+    "description",
+    "purchase_category_name",
+    "tag_names",
+    "fingerprint",
+)
+
+
+def get_import_path(owner_key: str, import_id: str) -> str:
+    if not import_id.isalnum():
+        raise ValueError(f"Invalid import id {import_id!r}")
+    return os.path.join(
+        settings.IMPORT_STORE_PATH, owner_key, f"{import_id}.csv"
+    )
+
+
+@dataclass
+class ImportOwner:
+    """The user or group the imported transactions are created for."""
+
+    id: int
+    uuid: uuid_pkg.UUID
+    is_group: bool = False
+    # Group transactions record who created them
+    created_by_user_id: int | None = None
+    created_by_user_uuid: uuid_pkg.UUID | None = None
+
+    @property
+    def key(self) -> str:
+        if self.is_group:
+            return get_owner_key(group_id=self.id)
+        return get_owner_key(user_id=self.id)
+
+    @property
+    def owner_column(self) -> str:
+        return "owner_group_id" if self.is_group else "owner_user_id"
+
+    @property
+    def link_id_column(self) -> str:
+        return "group_id" if self.is_group else "user_id"
+
+    @property
+    def link_columns(self) -> dict[str, Any]:
+        if self.is_group:
+            return {"group_id": self.id, "group_uuid": self.uuid}
+        return {"user_id": self.id, "user_uuid": self.uuid}
+
+    @property
+    def purchase_category_link(
+        self,
+    ) -> type[GroupPurchaseCategory] | type[UserPurchaseCategory]:
+        return GroupPurchaseCategory if self.is_group else UserPurchaseCategory
+
+    @property
+    def tag_link(self) -> type[GroupTag] | type[UserTag]:
+        return GroupTag if self.is_group else UserTag
+
+
+def _parse_amount(value: str, mapping: TransactionImportMapping) -> Decimal:
+    value = value.strip().replace(" ", "").replace("\u00a0", "")
+    if mapping.decimal_separator != ".":
+        value = value.replace(".", "").replace(mapping.decimal_separator, ".")
+    else:
+        value = value.replace(",", "")
+    try:
+        amount = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"invalid amount {value!r}") from None
+    if not amount.is_finite():
+        raise ValueError(f"invalid amount {value!r}")
+    return amount
+
+
+def _parse_timestamp(value: str, mapping: TransactionImportMapping) -> datetime:
+    value = value.strip()
+    if mapping.timestamp_format is not None:
+        timestamp = datetime.strptime(value, mapping.timestamp_format)
+    else:
+        timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp
+
+
+def _get_required(row: dict[str, str], column: str) -> str:
+    # Short rows, e.g. a statement footer, have no value for later columns
+    value = row.get(column)
+    if value is None:
+        raise ValueError(f"missing value for column {column!r}")
+    return value
+
+
+def _get_optional(row: dict[str, str], column: str | None) -> str | None:
+    if column is None:
+        return None
+    value = (row.get(column) or "").strip()
+    return value or None
+
+
+def parse_row(
+    line: int,
+    row: dict[str, str],
+    mapping: TransactionImportMapping,
+    owner_key: str,
+) -> tuple[Any, ...] | None:
+    """Convert a CSV row to a staging table record.
+
+    Returns `None` for rows with the sign of an income, raises `ValueError`
+    for invalid rows, including amounts that don't fit the BIGINT column.
+    """
+    amount = _parse_amount(_get_required(row, mapping.amount_column), mapping)
+    if mapping.negative_expenses:
+        amount = -amount
+    if amount < 0:
+        return None
+
+    currency_value = _get_optional(row, mapping.currency_column)
+    try:
+        currency = (
+            Currency(currency_value.upper())
+            if currency_value is not None
+            else mapping.default_currency
+        )
+    except ValueError:
+        raise ValueError(f"unknown currency {currency_value!r}") from None
+
+    tags_value = _get_optional(row, mapping.tags_column)
+    tag_names = (
+        list(
+            dict.fromkeys(
+                tag_name.strip()
+                for tag_name in tags_value.split(mapping.tag_separator)
+                if tag_name.strip()
+            )
+        )
+        if tags_value is not None
+        else []
+    )
+
+    timestamp = _parse_timestamp(
+        _get_required(row, mapping.timestamp_column), mapping
+    )
+    amount_minor = to_minor_units(amount, currency)
+    name = _get_optional(row, mapping.name_column)
+    return (
+        line,
+        uuid7(),
+        uuid7(),
+        timestamp,
+        amount_minor,
+        currency.name,
+        name,
+        _get_optional(row, mapping.description_column),
+        _get_optional(row, mapping.purchase_category_column)
+        or mapping.default_purchase_category_name,
+        tag_names,
+        get_transaction_fingerprint(
+            owner_key, timestamp, amount_minor, currency.name, name
+        ),
+    )
+
+
+def read_csv_records(
+    path: str,
+    mapping: TransactionImportMapping,
+    owner_key: str,
+    report: TransactionImportReport,
+    batch_size: int,
+) -> Iterator[list[tuple[Any, ...]]]:
+    """Read the staging records of a CSV file in batches of `batch_size`.
+
+    Invalid and skipped rows are counted in `report`.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        reader = csv.DictReader(file, delimiter=mapping.delimiter)
+        required_columns = {mapping.timestamp_column, mapping.amount_column}
+        missing_columns = required_columns - set(reader.fieldnames or ())
+        if missing_columns:
+            raise ValueError(
+                f"Missing columns: {', '.join(sorted(missing_columns))}"
+            )
+
+        records: list[tuple[Any, ...]] = []
+        for row in reader:
+            report.row_count += 1
+            try:
+                record = parse_row(reader.line_num, row, mapping, owner_key)
+            except (ValueError, TypeError, ArithmeticError) as e:
+                report.invalid_row_count += 1
+                if len(report.errors) < MAX_REPORTED_ERRORS:
+                    report.errors.append(f"Line {reader.line_num}: {e}")
+                continue
+
+            if record is None:
+                report.skipped_row_count += 1
+                continue
+
+            records.append(record)
+            if len(records) >= batch_size:
+                yield records
+                records = []
+
+        if records:
+            yield records
+
+
+def _get_owned(
+    owner: ImportOwner,
+    model: type[PurchaseCategory] | type[Tag],
+    link: Any,
+    link_id_column: str,
+) -> Select:
+    return (
+        select(model)
+        .join(link, getattr(link, link_id_column) == model.id)
+        .filter(
+            getattr(link, owner.link_id_column) == owner.id,
+            model.is_deleted.is_(False),
+        )
+    )
+
+
+async def _create_missing(
+    db: AsyncSession,
+    owner: ImportOwner,
+    model: type[PurchaseCategory] | type[Tag],
+    name_column: str,
+    link: Any,
+    link_columns: tuple[str, str],
+    staged_names: Select,
+) -> int:
+    """Create the rows of `model`, by name, that the owner does not have
+    yet. Returns the number of created rows."""
+    names = staged_names.subquery()
+    owned = _get_owned(owner, model, link, link_columns[0]).subquery()
+    created = (
+        insert(model)
+        .from_select(
+            [name_column, "created_at", "is_deleted"],
+            select(names.c.name, func.now(), false())
+            .distinct()
+            .filter(
+                ~exists().where(owned.c[name_column] == names.c.name),
+            ),
+            include_defaults=False,
+        )
+        .returning(model.id, model.uuid)
+        .cte("created")
+    )
+    result = await db.execute(
+        insert(link)
+        .from_select(
+            [*owner.link_columns, *link_columns, "created_at"],
+            select(
+                *(literal(value) for value in owner.link_columns.values()),
+                created.c.id,
+                created.c.uuid,
+                func.now(),
+            ),
+        )
+        .add_cte(created)
+    )
+    return result.rowcount  # type: ignore
+
+
+async def import_transactions(
+    db: AsyncSession,
+    *,
+    owner: ImportOwner,
+    path: str,
+    mapping: TransactionImportMapping,
+    batch_size: int = 10000,
+    on_progress: (
+        Callable[[TransactionImportReport], Awaitable[None]] | None
+    ) = None,
+) -> TransactionImportReport:
+    """Import the rows of a CSV file as transactions of `owner`.
+
+    Rows are parsed and copied with `COPY` into a temporary staging table
+    in batches of `batch_size`. Purchase categories and tags that the owner
+    does not have yet are created by name. The transactions, their items
+    and all links are then created with one set based statement each. The
+    whole import is a single transaction, either every valid row is
+    imported or none.
+
+    Rows whose fingerprint matches a live transaction of the owner, e.g.
+    from importing the same file again, are skipped and counted as
+    duplicates. Identical rows within one file are all imported.
+
+    Each row becomes one transaction with a single item, like a transaction
+    created without items through the API.
+    """
+    staging = transaction_import_staging
+    report = TransactionImportReport()
+
+    connection = await db.connection()
+    await connection.run_sync(staging.create)
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+
+    staged_count = 0
+    for records in read_csv_records(
+        path, mapping, owner.key, report, batch_size
+    ):
+        await driver_connection.copy_records_to_table(  # type: ignore
+            staging.name, records=records, columns=_STAGED_COLUMNS
+        )
+        staged_count += len(records)
+        if on_progress is not None:
+            await on_progress(report)
+
+    # Identical rows within the file are distinct transactions, e.g. two
+    # coffees on the same day, the repeats are numbered into the fingerprint
+    occurrences = select(
+        staging.c.line,
+        func.row_number()
+        .over(partition_by=staging.c.fingerprint, order_by=staging.c.line)
+        .label("occurrence"),
+    ).subquery()
+    await db.execute(
+        update(staging)
+        .values(
+            fingerprint=func.sha256(
+                staging.c.fingerprint.op("||")(
+                    func.int8send(occurrences.c.occurrence - 1)
+                )
+            )
+        )
+        .where(
+            staging.c.line == occurrences.c.line,
+            occurrences.c.occurrence > 1,
+        )
+    )
+
+    # Purchase categories
+    category_link = owner.purchase_category_link
+    report.created_purchase_category_count = await _create_missing(
+        db,
+        owner,
+        PurchaseCategory,
+        "category_name",
+        category_link,
+        ("purchase_category_id", "purchase_category_uuid"),
+        select(staging.c.purchase_category_name.label("name")),
+    )
+    owned_categories = _get_owned(
+        owner, PurchaseCategory, category_link, "purchase_category_id"
+    ).subquery()
+    await db.execute(
+        update(staging)
+        .values(
+            purchase_category_id=owned_categories.c.id,
+            purchase_category_uuid=owned_categories.c.uuid,
+        )
+        .where(
+            staging.c.purchase_category_name == owned_categories.c.category_name
+        )
+    )
+
+    # Tags, the owned ones that get linked are locked against the tag
+    # garbage collection, one it deleted meanwhile is created again
+    await db.execute(
+        _get_owned(owner, Tag, owner.tag_link, "tag_id")
+        .filter(Tag.tag_name.in_(select(func.unnest(staging.c.tag_names))))
+        .with_for_update(read=True, of=Tag)
+    )
+    report.created_tag_count = await _create_missing(
+        db,
+        owner,
+        Tag,
+        "tag_name",
+        owner.tag_link,
+        ("tag_id", "tag_uuid"),
+        select(func.unnest(staging.c.tag_names).label("name")),
+    )
+
+    # Transactions, rows imported before are skipped by their fingerprint
+    inserted_transactions = (
+        pg_insert(Transaction)
+        .from_select(
+            [
+                "uuid",
+                "amount_minor",
+                "currency",
+                "name",
+                "description",
+                "timestamp",
+                owner.owner_column,
+                "fingerprint",
+                "created_at",
+                "is_deleted",
+            ],
+            select(
+                staging.c.transaction_uuid,
+                staging.c.amount_minor,
+                staging.c.currency,
+                staging.c.name,
+                staging.c.description,
+                staging.c.timestamp,
+                literal(owner.id),
+                staging.c.fingerprint,
+                func.now(),
+                false(),
+            ).order_by(staging.c.line),
+            include_defaults=False,
+        )
+        .on_conflict_do_nothing(
+            index_elements=[Transaction.fingerprint, Transaction.timestamp],
+            index_where=text("NOT is_deleted AND fingerprint IS NOT NULL"),
+        )
+        .returning(Transaction.id, Transaction.uuid)
+        .cte("inserted_transactions")
+    )
+    result = await db.execute(
+        update(staging)
+        .values(transaction_id=inserted_transactions.c.id)
+        .where(staging.c.transaction_uuid == inserted_transactions.c.uuid)
+        .add_cte(inserted_transactions)
+    )
+    report.imported_count = result.rowcount  # type: ignore
+    report.duplicate_row_count = staged_count - report.imported_count
+
+    imported = staging.c.transaction_id.is_not(None)
+    transaction_link_columns: dict[str, Any] = dict(owner.link_columns)
+    transaction_link: Any = UserTransaction
+    if owner.is_group:
+        transaction_link = GroupTransaction
+        transaction_link_columns["created_by_user_id"] = (
+            owner.created_by_user_id
+        )
+        transaction_link_columns["created_by_user_uuid"] = (
+            owner.created_by_user_uuid
+        )
+    await db.execute(
+        insert(transaction_link).from_select(
+            [
+                *transaction_link_columns,
+                "transaction_id",
+                "transaction_uuid",
+                "created_at",
+            ],
+            select(
+                *(
+                    literal(value)
+                    for value in transaction_link_columns.values()
+                ),
+                staging.c.transaction_id,
+                staging.c.transaction_uuid,
+                func.now(),
+            ).filter(imported),
+        )
+    )
+
+    # Items
+    inserted_items = (
+        insert(TransactionItem)
+        .from_select(
+            [
+                "uuid",
+                "transaction_id",
+                owner.owner_column,
+                "purchase_category_id",
+                "purchase_category_uuid",
+                "amount_minor",
+                "name",
+                "description",
+                "timestamp",
+                "currency",
+                "created_at",
+                "is_deleted",
+            ],
+            select(
+                staging.c.transaction_item_uuid,
+                staging.c.transaction_id,
+                literal(owner.id),
+                staging.c.purchase_category_id,
+                staging.c.purchase_category_uuid,
+                staging.c.amount_minor,
+                staging.c.name,
+                staging.c.description,
+                staging.c.timestamp,
+                staging.c.currency,
+                func.now(),
+                false(),
+            )
+            .filter(imported)
+            .order_by(staging.c.line),
+            include_defaults=False,
+        )
+        .returning(TransactionItem.id, TransactionItem.uuid)
+        .cte("inserted_items")
+    )
+    await db.execute(
+        update(staging)
+        .values(transaction_item_id=inserted_items.c.id)
+        .where(staging.c.transaction_item_uuid == inserted_items.c.uuid)
+        .add_cte(inserted_items)
+    )
+    imported_items = staging.c.transaction_item_id.is_not(None)
+    await db.execute(
+        insert(TransactionTransactionItem).from_select(
+            [
+                "transaction_id",
+                "transaction_uuid",
+                "transaction_item_id",
+                "transaction_item_uuid",
+                "created_at",
+            ],
+            select(
+                staging.c.transaction_id,
+                staging.c.transaction_uuid,
+                staging.c.transaction_item_id,
+                staging.c.transaction_item_uuid,
+                func.now(),
+            ).filter(imported_items),
+        )
+    )
+
+    # Item tags
+    item_tag_names = (
+        select(
+            staging.c.transaction_item_id,
+            staging.c.transaction_item_uuid,
+            func.unnest(staging.c.tag_names).label("tag_name"),
+        )
+        .filter(imported_items)
+        .subquery()
+    )
+    owned_tags = _get_owned(owner, Tag, owner.tag_link, "tag_id").subquery()
+    await db.execute(
+        insert(TransactionItemTag).from_select(
+            [
+                "transaction_item_id",
+                "transaction_item_uuid",
+                "tag_id",
+                "tag_uuid",
+                "created_at",
+            ],
+            select(
+                item_tag_names.c.transaction_item_id,
+                item_tag_names.c.transaction_item_uuid,
+                owned_tags.c.id,
+                owned_tags.c.uuid,
+                func.now(),
+            )
+            .distinct()
+            .join(
+                owned_tags,
+                owned_tags.c.tag_name == item_tag_names.c.tag_name,
+            ),
+        )
+    )
+
+    await db.commit()
+    return report
@@ -0,0 +1,82 @@
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+
+from ..core.db.instrumentation import collect_query_stats
+from ..core.logger import logging
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """Middleware to count the database statements issued by each request.
+
+    Parameters
+    ----------
+    app: FastAPI
+        The FastAPI application instance.
+    repeated_query_threshold: int, optional
+        How many times the same normalized statement may run in one request
+        before a possible N+1 query is reported. Defaults to 10.
+
+    Attributes
+    ----------
+    repeated_query_threshold: int
+        How many times the same normalized statement may run in one request.
+
+    Methods
+    -------
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        Process the request and report the statements it executed.
+
+    Note
+    ----
+        - The statement count and total database time are exposed in the
+        `Server-Timing` header and logged with `db_query_count` and
+        `db_time_ms` as structured fields.
+    """
+
+    def __init__(
+        self, app: FastAPI, repeated_query_threshold: int = 10
+    ) -> None:
+        super().__init__(app)
+        self.repeated_query_threshold = repeated_query_threshold
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        with collect_query_stats() as stats:
+            response: Response = await call_next(request)
+
+        db_time_ms = stats.duration * 1000
+        response.headers.append(
+            "Server-Timing",
+            f'db;dur={db_time_ms:.1f};desc="{stats.count} queries"',
+        )
+
+        path = request.url.path
+        fields = {
+            "method": request.method,
+            "path": path,
+            "status_code": response.status_code,
+            "db_query_count": stats.count,
+            "db_time_ms": round(db_time_ms, 1),
+        }
+        logger.info(
+            f"{request.method} {path} db_query_count={stats.count} "
+            f"db_time_ms={db_time_ms:.1f}",
+            extra=fields,
+        )
+
+        for statement, count in stats.repeated_statements(
+            self.repeated_query_threshold
+        ):
+            logger.warning(
+                f"Possible N+1 query: statement executed {count} times in "
+                f"{request.method} {path}: {statement}",
+                extra={**fields, "repeated_count": count},
+            )
+
+        return response
@@ -0,0 +1,17 @@
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class OwnerMixin:
+    """Denormalized owner of a row, exactly one of the two is set.
+
+    Mirrors the user or group link table of the transaction the row belongs
+    to, so reads can filter on the owner without joining the link tables.
+    """
+
+    owner_user_id: Mapped[int | None] = mapped_column(
+        ForeignKey("user.id"), default=None
+    )
+    owner_group_id: Mapped[int | None] = mapped_column(
+        ForeignKey("group.id"), default=None
+    )
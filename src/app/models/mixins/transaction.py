@@ -0,0 +1,8 @@
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class TransactionOptionalMixin:
+    transaction_id: Mapped[int | None] = mapped_column(
+        ForeignKey("transaction.id"), default=None
+    )
@@ -1,3 +1,4 @@
+from sqlalchemy import Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..core.db.database import Base
@@ -12,5 +13,13 @@ from ..core.models.mixins import (
 class PurchaseCategory(
     IDMixin, UUIDMixin, TimestampMixin, SoftDeleteMixin, Base, kw_only=True
 ):
-    category_name: Mapped[str] = mapped_column(index=True)
+    __table_args__ = (
+        Index(
+            "ix_purchase_category_category_name_live",
+            "category_name",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+    )
+
+    category_name: Mapped[str] = mapped_column()
     category_description: Mapped[str | None] = mapped_column()
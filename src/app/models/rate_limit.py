@@ -1,6 +1,6 @@
 import uuid as uuid_pkg
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..core.db.database import Base
@@ -15,6 +15,15 @@ from ..core.models.mixins import (
 class RateLimit(
     IDMixin, UUIDMixin, TimestampMixin, SoftDeleteMixin, Base, kw_only=True
 ):
+    __table_args__ = (
+        Index(
+            "ix_rate_limit_tier_uuid_path_live",
+            "tier_uuid",
+            "path",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+    )
+
     tier_id: Mapped[int] = mapped_column(
         ForeignKey("tier.id"), index=True, nullable=False
     )
@@ -1,3 +1,4 @@
+from sqlalchemy import Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..core.db.database import Base
@@ -12,4 +13,12 @@ from ..core.models.mixins import (
 class Tag(
     IDMixin, UUIDMixin, TimestampMixin, SoftDeleteMixin, Base, kw_only=True
 ):
-    tag_name: Mapped[str] = mapped_column(index=True)
+    __table_args__ = (
+        Index(
+            "ix_tag_tag_name_live",
+            "tag_name",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+    )
+
+    tag_name: Mapped[str] = mapped_column()
@@ -1,5 +1,6 @@
 from enum import Enum
 
+from sqlalchemy import BigInteger, Index, LargeBinary, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..core.db.database import Base
@@ -10,6 +11,7 @@ from ..core.models.mixins import (
     UUIDMixin,
 )
 from .mixins.misc import TimeMixin
+from .mixins.owner import OwnerMixin
 
 
 class Currency(Enum):
@@ -19,6 +21,7 @@ class Currency(Enum):
 
 
 class Transaction(
+    OwnerMixin,
     TimeMixin,
     IDMixin,
     UUIDMixin,
@@ -27,7 +30,43 @@ class Transaction(
     Base,
     kw_only=True,
 ):
-    amount: Mapped[float] = mapped_column(index=True)
+    __table_args__ = (
+        Index(
+            "ix_transaction_timestamp_id_live",
+            "timestamp",
+            "id",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        Index(
+            "ix_transaction_owner_user_id_timestamp_id_live",
+            "owner_user_id",
+            "timestamp",
+            "id",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        Index(
+            "ix_transaction_owner_group_id_timestamp_id_live",
+            "owner_group_id",
+            "timestamp",
+            "id",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        # Includes the partition key, so it can stay unique when partitioned
+        Index(
+            "ux_transaction_fingerprint_timestamp_live",
+            "fingerprint",
+            "timestamp",
+            unique=True,
+            postgresql_where=text("NOT is_deleted AND fingerprint IS NOT NULL"),
+        ),
+    )
+
+    # In the minor unit of the currency, e.g. cents
+    amount_minor: Mapped[int] = mapped_column(BigInteger, index=True)
     currency: Mapped[Currency] = mapped_column(index=True)
     name: Mapped[str | None] = mapped_column()
     description: Mapped[str | None] = mapped_column()
+    # Set for imported transactions, see `get_transaction_fingerprint`
+    fingerprint: Mapped[bytes | None] = mapped_column(
+        LargeBinary(32), default=None
+    )
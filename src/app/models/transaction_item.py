@@ -1,3 +1,6 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..core.db.database import Base
@@ -7,10 +10,15 @@ from ..core.models.mixins import (
     TimestampMixin,
     UUIDMixin,
 )
+from .mixins.owner import OwnerMixin
 from .mixins.purchase_category import PurchaseCategoryMixin
+from .mixins.transaction import TransactionOptionalMixin
+from .transaction import Currency
 
 
 class TransactionItem(
+    TransactionOptionalMixin,
+    OwnerMixin,
     PurchaseCategoryMixin,
     IDMixin,
     UUIDMixin,
@@ -19,6 +27,45 @@ class TransactionItem(
     Base,
     kw_only=True,
 ):
-    amount: Mapped[float] = mapped_column(index=True)
+    __table_args__ = (
+        Index(
+            "ix_transaction_item_purchase_category_id_live",
+            "purchase_category_id",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        Index(
+            "ix_transaction_item_transaction_id_live",
+            "transaction_id",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        # Covering indexes for the category statistics
+        Index(
+            "ix_transaction_item_owner_user_id_category_live",
+            "owner_user_id",
+            "purchase_category_id",
+            "currency",
+            "timestamp",
+            postgresql_include=["amount_minor"],
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        Index(
+            "ix_transaction_item_owner_group_id_category_live",
+            "owner_group_id",
+            "purchase_category_id",
+            "currency",
+            "timestamp",
+            postgresql_include=["amount_minor"],
+            postgresql_where=text("NOT is_deleted"),
+        ),
+    )
+
+    # In the minor unit of the currency, e.g. cents
+    amount_minor: Mapped[int] = mapped_column(BigInteger, index=True)
     name: Mapped[str | None] = mapped_column()
     description: Mapped[str | None] = mapped_column()
+
+    # Copied from the transaction, so item queries need no join to filter
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default_factory=lambda: datetime.now(UTC)
+    )
+    currency: Mapped[Currency | None] = mapped_column(default=None)
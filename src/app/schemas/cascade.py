@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class CascadeDeleteReport(BaseModel):
+    batch_count: int = 0
+    transaction_count: int = 0
+    transaction_item_count: int = 0
+    tag_count: int = 0
+    purchase_category_count: int = 0
@@ -15,14 +15,14 @@ class GroupTagExternal(GroupTagBase):
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Group UUID must be a valid UUIDv4.",
+            description="Group UUID must be a valid UUID.",
         ),
     ]
     tag_uuid: Annotated[
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Tag UUID must be a valid UUIDv4.",
+            description="Tag UUID must be a valid UUID.",
         ),
     ]
 
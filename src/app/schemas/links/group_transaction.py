@@ -15,21 +15,21 @@ class GroupTransactionBaseExternal(GroupTransactionBase):
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Transaction UUID must be a valid UUIDv4.",
+            description="Transaction UUID must be a valid UUID.",
         ),
     ]
     group_uuid: Annotated[
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Group UUID must be a valid UUIDv4.",
+            description="Group UUID must be a valid UUID.",
         ),
     ]
     created_by_user_uuid: Annotated[
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="User UUID must be a valid UUIDv4.",
+            description="User UUID must be a valid UUID.",
         ),
     ]
 
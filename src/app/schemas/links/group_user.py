@@ -19,14 +19,14 @@ class GroupUserExternal(GroupUserBase):
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Group UUID must be a valid UUIDv4.",
+            description="Group UUID must be a valid UUID.",
         ),
     ]
     user_uuid: Annotated[
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="User UUID must be a valid UUIDv4.",
+            description="User UUID must be a valid UUID.",
         ),
     ]
 
@@ -81,3 +81,19 @@ class GroupUserUpdateInternal(GroupUserUpdate):
 
 class GroupUserDelete(BaseModel):
     model_config = ConfigDict(extra="forbid")
+
+
+class GroupMembership(BaseModel):
+    group_id: int
+    group_uuid: uuid_pkg.UUID
+    group_is_deleted: bool
+    user_id: int
+    user_role: UserRole | None
+
+    @property
+    def is_member(self) -> bool:
+        return self.user_role is not None
+
+    @property
+    def is_admin(self) -> bool:
+        return self.user_role == UserRole.ADMIN
@@ -15,14 +15,14 @@ class TransactionReceiptExternal(TransactionReceiptBase):
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Transaction UUID must be a valid UUIDv4.",
+            description="Transaction UUID must be a valid UUID.",
         ),
     ]
     receipt_uuid: Annotated[
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Receipt UUID must be a valid UUIDv4.",
+            description="Receipt UUID must be a valid UUID.",
         ),
     ]
 
@@ -15,14 +15,14 @@ class TransactionTransactionItemBaseExternal(TransactionTransactionItemBase):
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Transaction UUID must be a valid UUIDv4.",
+            description="Transaction UUID must be a valid UUID.",
         ),
     ]
     transaction_item_uuid: Annotated[
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Transaction item UUID must be a valid UUIDv4.",
+            description="Transaction item UUID must be a valid UUID.",
         ),
     ]
 
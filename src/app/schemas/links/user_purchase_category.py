@@ -15,14 +15,14 @@ class UserPurchaseCategoryBaseExternal(UserPurchaseCategoryBase):
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="User UUID must be a valid UUIDv4.",
+            description="User UUID must be a valid UUID.",
         ),
     ]
     purchase_category_uuid: Annotated[
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Purchase category UUID must be a valid UUIDv4.",
+            description="Purchase category UUID must be a valid UUID.",
         ),
     ]
 
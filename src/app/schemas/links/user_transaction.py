@@ -15,14 +15,14 @@ class UserTransactionExternal(UserTransactionBase):
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="User UUID must be a valid UUIDv4.",
+            description="User UUID must be a valid UUID.",
         ),
     ]
     transaction_uuid: Annotated[
         uuid_pkg.UUID,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Transaction UUID must be a valid UUIDv4.",
+            description="Transaction UUID must be a valid UUID.",
         ),
     ]
 
@@ -0,0 +1,108 @@
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Annotated, Any
+
+from pydantic import BaseModel, Field, model_validator
+
+from ...models.transaction import Currency
+
+# ISO 4217 minor unit exponents, e.g. 1 EUR is 100 cents
+MINOR_UNIT_EXPONENTS: dict[Currency, int] = {
+    Currency.EUR: 2,
+    Currency.USD: 2,
+    Currency.HUF: 2,
+}
+DEFAULT_MINOR_UNIT_EXPONENT = 2
+
+# Amounts are stored as BIGINT minor units, larger ones are rejected
+MAX_AMOUNT_MINOR = 2**63 - 1
+MAX_AMOUNT = float(MAX_AMOUNT_MINOR // 10 ** max(MINOR_UNIT_EXPONENTS.values()))
+
+
+def _get_exponent(currency: Currency | str | None) -> int:
+    if currency is None:
+        return DEFAULT_MINOR_UNIT_EXPONENT
+    return MINOR_UNIT_EXPONENTS[Currency(currency)]
+
+
+def to_minor_units(amount: float | Decimal, currency: Currency | None) -> int:
+    """Convert an amount in the major unit of `currency` to minor units.
+
+    The amount goes through its decimal representation, so `0.1` becomes
+    exactly `10` cents instead of suffering from binary float errors.
+    Raises `ValueError` for amounts that are not finite or do not fit in
+    the stored BIGINT.
+    """
+    decimal_amount = Decimal(str(amount))
+    if not decimal_amount.is_finite():
+        raise ValueError(f"Amount {amount} is not a finite number")
+    minor_amount = decimal_amount.scaleb(_get_exponent(currency))
+    if abs(minor_amount) > MAX_AMOUNT_MINOR:
+        raise ValueError(f"Amount {amount} is too large")
+    return int(minor_amount.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def to_major_units_decimal(
+    amount_minor: int, currency: Currency | str | None
+) -> Decimal:
+    """Exact amount in the major unit, e.g. `Decimal("12.50")` for 1250."""
+    return Decimal(amount_minor).scaleb(-_get_exponent(currency))
+
+
+def to_major_units(amount_minor: int, currency: Currency | None) -> float:
+    return float(to_major_units_decimal(amount_minor, currency))
+
+
+class AmountSchema(BaseModel):
+    amount: Annotated[
+        float,
+        Field(
+            ge=0,
+            lt=MAX_AMOUNT,
+            allow_inf_nan=False,
+            examples=[100.0, 200.0, 300.0],
+            description="Value in the major unit of the currency.",
+        ),
+    ]
+
+    @model_validator(mode="before")
+    @classmethod
+    def convert_from_minor_units(cls, data: Any) -> Any:
+        if (
+            isinstance(data, dict)
+            and "amount" not in data
+            and "amount_minor" in data
+        ):
+            data = {
+                **data,
+                "amount": to_major_units(
+                    data["amount_minor"], data.get("currency")
+                ),
+            }
+        return data
+
+
+class AmountMinorSchema(BaseModel):
+    amount_minor: Annotated[
+        int,
+        Field(
+            ge=0,
+            examples=[10000, 20000, 30000],
+            description="Value in the minor unit of the currency.",
+        ),
+    ]
+
+    @model_validator(mode="before")
+    @classmethod
+    def convert_to_minor_units(cls, data: Any) -> Any:
+        if (
+            isinstance(data, dict)
+            and "amount_minor" not in data
+            and data.get("amount") is not None
+        ):
+            data = {
+                **data,
+                "amount_minor": to_minor_units(
+                    data["amount"], data.get("currency")
+                ),
+            }
+        return data
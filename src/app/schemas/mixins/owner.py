@@ -0,0 +1,20 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class OwnerIDSchema(BaseModel):
+    owner_user_id: Annotated[
+        int | None,
+        Field(
+            default=None,
+            description="ID of the user owning the row, if owned by a user.",
+        ),
+    ]
+    owner_group_id: Annotated[
+        int | None,
+        Field(
+            default=None,
+            description="ID of the group owning the row, if owned by a group.",
+        ),
+    ]
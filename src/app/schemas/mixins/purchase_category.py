@@ -20,7 +20,7 @@ class PurchaseCategoryUUIDSchema(BaseModel):
         Field(
             title="Purchase category UUID",
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Purchase category UUID must be a valid UUIDv4.",
+            description="Purchase category UUID must be a valid UUID.",
         ),
     ]
 
@@ -31,7 +31,7 @@ class PurchaseCategoryOptionalUUIDSchema(BaseModel):
         Field(
             default=None,
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Purchase category UUID must be a valid UUIDv4.",
+            description="Purchase category UUID must be a valid UUID.",
         ),
     ]
 
@@ -20,7 +20,7 @@ class TagUUIDSchema(BaseModel):
         Field(
             title="Tag UUID",
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Tag UUID must be a valid UUIDv4.",
+            description="Tag UUID must be a valid UUID.",
         ),
     ]
 
@@ -31,7 +31,7 @@ class TagOptionalUUIDSchema(BaseModel):
         Field(
             default=None,
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Tag UUID must be a valid UUIDv4.",
+            description="Tag UUID must be a valid UUID.",
         ),
     ]
 
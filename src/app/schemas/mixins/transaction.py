@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from ...models.transaction import Currency
+
+
+class TransactionOptionalIDSchema(BaseModel):
+    transaction_id: Annotated[
+        int | None,
+        Field(
+            default=None,
+            title="Transaction ID",
+            description="ID of the transaction the item belongs to.",
+        ),
+    ]
+
+
+class TransactionDataOptionalSchema(BaseModel):
+    timestamp: Annotated[
+        datetime | None,
+        Field(
+            default=None,
+            description="Timestamp of the transaction the item belongs to.",
+        ),
+    ]
+    currency: Annotated[
+        Currency | None,
+        Field(
+            default=None,
+            description="Currency of the transaction the item belongs to.",
+        ),
+    ]
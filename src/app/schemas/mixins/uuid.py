@@ -10,6 +10,6 @@ class OptionalUUIDSchema(BaseModel):
         Field(
             default=None,
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="UUID must be a valid UUIDv4.",
+            description="UUID must be a valid UUID.",
         ),
     ]
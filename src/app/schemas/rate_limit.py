@@ -54,7 +54,7 @@ class RateLimitBaseExternal(UUIDSchema, RateLimitBase):
             max_length=36,
             pattern="^[a-f0-9]{8}-[a-f0-9]{4}-4[a-f0-9]{3}-[89ab][a-f0-9]{3}-[a-f0-9]{12}$",
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Tier UUID must be a valid UUIDv4.",
+            description="Tier UUID must be a valid UUID.",
         ),
     ]
 
@@ -122,7 +122,7 @@ class RateLimitUpdateInternal(RateLimitUpdate):
             max_length=36,
             pattern="^[a-f0-9]{8}-[a-f0-9]{4}-4[a-f0-9]{3}-[89ab][a-f0-9]{3}-[a-f0-9]{12}$",
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="UUID of the rate limit to update. Must be a valid UUIDv4.",
+            description="UUID of the rate limit to update. Must be a valid UUID.",
         ),
     ]
 
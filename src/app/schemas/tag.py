@@ -76,3 +76,13 @@ class TagUpdateInternal(TagUpdate):
 
 class TagDelete(BaseModel):
     model_config = ConfigDict(extra="forbid")
+
+
+class TagCleanupReport(BaseModel):
+    dry_run: bool
+    hard_delete: bool
+    batch_count: int = 0
+    orphaned_tag_count: int = 0
+    deleted_tag_count: int = 0
+    # Set if the run stopped at the batch limit, the next run resumes there
+    resume_after_id: int | None = None
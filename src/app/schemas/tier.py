@@ -74,7 +74,7 @@ class TierUpdateInternal(BaseModel):
             max_length=36,
             pattern="^[a-f0-9]{8}-[a-f0-9]{4}-4[a-f0-9]{3}-[89ab][a-f0-9]{3}-[a-f0-9]{12}$",
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="UUID of the tier to update. Must be a valid UUIDv4.",
+            description="UUID of the tier to update. Must be a valid UUID.",
         ),
     ]
 
@@ -1,6 +1,7 @@
+import uuid as uuid_pkg
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..core.schemas.mixins import (
     IDSchema,
@@ -9,20 +10,14 @@ from ..core.schemas.mixins import (
     UUIDSchema,
 )
 from ..models.transaction import Currency
+from .mixins.amount import MAX_AMOUNT, AmountMinorSchema, AmountSchema
 from .mixins.misc import CurrentTimeSchema
+from .mixins.owner import OwnerIDSchema
 from .mixins.purchase_category import PurchaseCategoryOptionalUUIDSchema
 from .transaction_item import TransactionItemCreate, TransactionItemRead
 
 
 class TransactionBase(CurrentTimeSchema, BaseModel):
-    amount: Annotated[
-        float,
-        Field(
-            ge=0,
-            examples=[100.0, 200.0, 300.0],
-            description="Value of the transaction.",
-        ),
-    ]
     currency: Annotated[
         Currency,
         Field(
@@ -52,11 +47,13 @@ class TransactionBase(CurrentTimeSchema, BaseModel):
     ]
 
 
-class TransactionBaseExternal(TransactionBase):
+class TransactionBaseExternal(AmountSchema, TransactionBase):
     pass
 
 
-class TransactionBaseInternal(TransactionBaseExternal):
+class TransactionBaseInternal(
+    OwnerIDSchema, AmountMinorSchema, TransactionBase
+):
     pass
 
 
@@ -109,6 +106,8 @@ class TransactionUpdate(PurchaseCategoryOptionalUUIDSchema, BaseModel):
         float,
         Field(
             ge=0,
+            lt=MAX_AMOUNT,
+            allow_inf_nan=False,
             default=None,
             examples=[100.0, 200.0, 300.0],
             description="Value of the transaction.",
@@ -161,16 +160,7 @@ class TransactionUpdate(PurchaseCategoryOptionalUUIDSchema, BaseModel):
     ]
 
 
-class TransactionUpdateInternal(BaseModel):
-    amount: Annotated[
-        float,
-        Field(
-            ge=0,
-            default=None,
-            examples=[100.0, 200.0, 300.0],
-            description="Value of the transaction.",
-        ),
-    ]
+class TransactionUpdateInternal(AmountMinorSchema, BaseModel):
     currency: Annotated[
         Currency,
         Field(
@@ -205,3 +195,17 @@ class TransactionUpdateInternal(BaseModel):
 
 class TransactionDelete(BaseModel):
     pass
+
+
+class TransactionBulkDelete(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    transaction_uuids: Annotated[
+        list[uuid_pkg.UUID],
+        Field(
+            min_length=1,
+            max_length=1000,
+            examples=[[uuid_pkg.uuid4(), uuid_pkg.uuid4()]],
+            description="UUIDs of the transactions to delete.",
+        ),
+    ]
@@ -0,0 +1,59 @@
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..models.transaction import Currency
+
+
+class TransactionImportMapping(BaseModel):
+    """Which CSV columns hold which transaction field.
+
+    The defaults read the files of the CSV export. Columns mapped to `None`
+    are not read, their fields get the default value or stay empty.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    timestamp_column: str = "timestamp"
+    amount_column: str = "amount"
+    currency_column: str | None = "currency"
+    name_column: str | None = "name"
+    description_column: str | None = "description"
+    purchase_category_column: str | None = "purchase_category"
+    tags_column: str | None = "tags"
+    default_currency: Currency = Currency.HUF
+    default_purchase_category_name: Annotated[
+        str, Field(min_length=1, examples=["Imported"])
+    ] = "Imported"
+    delimiter: Annotated[str, Field(min_length=1, max_length=1)] = ","
+    tag_separator: Annotated[str, Field(min_length=1)] = ";"
+    decimal_separator: Annotated[str, Field(min_length=1, max_length=1)] = "."
+    timestamp_format: Annotated[
+        str | None,
+        Field(
+            examples=["%Y-%m-%d", "%d.%m.%Y %H:%M"],
+            description="A `strptime` format, ISO 8601 if not set. "
+            "Timestamps without a timezone are read as UTC.",
+        ),
+    ] = None
+    negative_expenses: Annotated[
+        bool,
+        Field(
+            description="Whether expenses have negative amounts, as in most "
+            "bank statements. Rows with the other sign are skipped."
+        ),
+    ] = False
+
+
+class TransactionImportReport(BaseModel):
+    row_count: int = 0
+    imported_count: int = 0
+    invalid_row_count: int = 0
+    # Rows with the sign of an income
+    skipped_row_count: int = 0
+    # Rows already imported earlier, by their fingerprint
+    duplicate_row_count: int = 0
+    created_purchase_category_count: int = 0
+    created_tag_count: int = 0
+    # The first few problems, with their line numbers
+    errors: list[str] = []
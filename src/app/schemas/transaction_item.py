@@ -10,24 +10,22 @@ from ..core.schemas.mixins import (
     UUIDSchema,
 )
 from ..schemas.purchase_category import PurchaseCategoryBase
+from .mixins.amount import MAX_AMOUNT, AmountMinorSchema, AmountSchema
 from .mixins.misc import TimeSchema
+from .mixins.owner import OwnerIDSchema
 from .mixins.purchase_category import (
     PurchaseCategoryIDSchema,
     PurchaseCategoryOptionalIDSchema,
     PurchaseCategoryOptionalUUIDSchema,
     PurchaseCategoryUUIDSchema,
 )
+from .mixins.transaction import (
+    TransactionDataOptionalSchema,
+    TransactionOptionalIDSchema,
+)
 
 
 class TransactionItemBase(BaseModel):
-    amount: Annotated[
-        float,
-        Field(
-            ge=0,
-            examples=[100.0, 200.0, 300.0],
-            description="Value of the transaction.",
-        ),
-    ]
     name: Annotated[
         str | None,
         Field(
@@ -52,13 +50,19 @@ class TransactionItemBase(BaseModel):
 
 
 class TransactionItemBaseExternal(
-    PurchaseCategoryUUIDSchema, TransactionItemBase
+    PurchaseCategoryUUIDSchema, AmountSchema, TransactionItemBase
 ):
     pass
 
 
 class TransactionItemBaseInternal(
-    PurchaseCategoryIDSchema, TransactionItemBaseExternal
+    TransactionDataOptionalSchema,
+    TransactionOptionalIDSchema,
+    OwnerIDSchema,
+    PurchaseCategoryIDSchema,
+    PurchaseCategoryUUIDSchema,
+    AmountMinorSchema,
+    TransactionItemBase,
 ):
     pass
 
@@ -115,6 +119,8 @@ class TransactionItemUpdate(PurchaseCategoryOptionalUUIDSchema, BaseModel):
         float,
         Field(
             ge=0,
+            lt=MAX_AMOUNT,
+            allow_inf_nan=False,
             examples=[100.0, 200.0, 300.0],
             description="Value of the transaction.",
         ),
@@ -153,16 +159,9 @@ class TransactionItemUpdate(PurchaseCategoryOptionalUUIDSchema, BaseModel):
 class TransactionItemUpdateInternal(
     PurchaseCategoryOptionalIDSchema,
     PurchaseCategoryOptionalUUIDSchema,
+    AmountMinorSchema,
     BaseModel,
 ):
-    amount: Annotated[
-        float,
-        Field(
-            ge=0,
-            examples=[100.0, 200.0, 300.0],
-            description="Value of the transaction.",
-        ),
-    ]
     name: Annotated[
         str | None,
         Field(
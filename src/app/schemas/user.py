@@ -39,7 +39,7 @@ class UserBaseExternal(UserBase):
         Field(
             default=None,
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Tier UUID must be a valid UUIDv4.",
+            description="Tier UUID must be a valid UUID.",
         ),
     ]
 
@@ -142,7 +142,7 @@ class UserTierUpdate(BaseModel):
         uuid_pkg.UUID | None,
         Field(
             examples=[uuid_pkg.uuid4(), uuid_pkg.uuid4(), uuid_pkg.uuid4()],
-            description="Tier UUID must be a valid UUIDv4.",
+            description="Tier UUID must be a valid UUID.",
         ),
     ]
 
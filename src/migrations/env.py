@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 from app.core.config import settings
 from app.core.db.database import Base
+from app.core.db.partitioning import PARTITIONED_TABLES, is_partition_table
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -38,6 +39,24 @@ from app.core.models import *  # noqa: F403, E402
 # ... etc.
 
 
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    # Monthly partitions are created by migrations and the worker, not models
+    if type_ == "table" and reflected and is_partition_table(name):
+        return False
+
+    # Partitioned tables can't have these, see the partitioning migration
+    if settings.DATABASE_PARTITIONING:
+        if type_ == "foreign_key_constraint" and (
+            object.referred_table.name in PARTITIONED_TABLES
+        ):
+            return False
+        if type_ == "index" and object.table.name in PARTITIONED_TABLES:
+            if name in (f"ix_{object.table.name}_{c}" for c in ("id", "uuid")):
+                return False
+
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -50,6 +69,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -59,7 +79,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,112 @@
+"""empty message
+
+Revision ID: 049295830801
+Revises: 630e87ff63ab
+Create Date: 2026-10-19 05:23:03.431746
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '049295830801'
+down_revision: Union[str, None] = '630e87ff63ab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 10000
+
+
+def _backfill_in_batches(table: str, statement: str) -> None:
+    """Run `statement` for consecutive `id` ranges of `table`.
+
+    Each batch is committed separately so the backfill does not hold row
+    locks on the whole table for the duration of the migration.
+    """
+    connection = op.get_bind()
+    max_id = connection.execute(
+        sa.text(f'SELECT max(id) FROM "{table}"')
+    ).scalar()
+    if max_id is None:
+        return
+
+    with op.get_context().autocommit_block():
+        for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+            connection.execute(
+                sa.text(statement),
+                {"start": start, "end": start + BACKFILL_BATCH_SIZE},
+            )
+
+
+def upgrade() -> None:
+    op.add_column('transaction', sa.Column('owner_user_id', sa.Integer(), nullable=True))
+    op.add_column('transaction', sa.Column('owner_group_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('transaction_owner_group_id_fkey', 'transaction', 'group', ['owner_group_id'], ['id'])
+    op.create_foreign_key('transaction_owner_user_id_fkey', 'transaction', 'user', ['owner_user_id'], ['id'])
+    op.add_column('transaction_item', sa.Column('transaction_id', sa.Integer(), nullable=True))
+    op.add_column('transaction_item', sa.Column('owner_user_id', sa.Integer(), nullable=True))
+    op.add_column('transaction_item', sa.Column('owner_group_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('transaction_item_transaction_id_fkey', 'transaction_item', 'transaction', ['transaction_id'], ['id'])
+    op.create_foreign_key('transaction_item_owner_group_id_fkey', 'transaction_item', 'group', ['owner_group_id'], ['id'])
+    op.create_foreign_key('transaction_item_owner_user_id_fkey', 'transaction_item', 'user', ['owner_user_id'], ['id'])
+
+    _backfill_in_batches(
+        'transaction',
+        '''
+        UPDATE "transaction" SET owner_user_id = user_transaction.user_id
+        FROM user_transaction
+        WHERE user_transaction.transaction_id = "transaction".id
+          AND "transaction".id > :start AND "transaction".id <= :end
+        ''',
+    )
+    _backfill_in_batches(
+        'transaction',
+        '''
+        UPDATE "transaction" SET owner_group_id = group_transaction.group_id
+        FROM group_transaction
+        WHERE group_transaction.transaction_id = "transaction".id
+          AND "transaction".id > :start AND "transaction".id <= :end
+        ''',
+    )
+    _backfill_in_batches(
+        'transaction_item',
+        '''
+        UPDATE transaction_item
+        SET transaction_id = "transaction".id,
+            owner_user_id = "transaction".owner_user_id,
+            owner_group_id = "transaction".owner_group_id
+        FROM transaction_transaction_item
+        JOIN "transaction"
+          ON "transaction".id = transaction_transaction_item.transaction_id
+        WHERE transaction_transaction_item.transaction_item_id = transaction_item.id
+          AND transaction_item.id > :start AND transaction_item.id <= :end
+        ''',
+    )
+
+    # Indexes are built after the backfill instead of being updated per row
+    op.create_index('ix_transaction_owner_group_id_timestamp_id_live', 'transaction', ['owner_group_id', 'timestamp', 'id'], unique=False, postgresql_where=sa.text('NOT is_deleted'))
+    op.create_index('ix_transaction_owner_user_id_timestamp_id_live', 'transaction', ['owner_user_id', 'timestamp', 'id'], unique=False, postgresql_where=sa.text('NOT is_deleted'))
+    op.create_index('ix_transaction_item_owner_group_id_live', 'transaction_item', ['owner_group_id'], unique=False, postgresql_where=sa.text('NOT is_deleted'))
+    op.create_index('ix_transaction_item_owner_user_id_live', 'transaction_item', ['owner_user_id'], unique=False, postgresql_where=sa.text('NOT is_deleted'))
+    op.create_index('ix_transaction_item_transaction_id_live', 'transaction_item', ['transaction_id'], unique=False, postgresql_where=sa.text('NOT is_deleted'))
+
+
+def downgrade() -> None:
+    op.drop_constraint('transaction_item_owner_user_id_fkey', 'transaction_item', type_='foreignkey')
+    op.drop_constraint('transaction_item_owner_group_id_fkey', 'transaction_item', type_='foreignkey')
+    op.drop_constraint('transaction_item_transaction_id_fkey', 'transaction_item', type_='foreignkey')
+    op.drop_index('ix_transaction_item_transaction_id_live', table_name='transaction_item', postgresql_where=sa.text('NOT is_deleted'))
+    op.drop_index('ix_transaction_item_owner_user_id_live', table_name='transaction_item', postgresql_where=sa.text('NOT is_deleted'))
+    op.drop_index('ix_transaction_item_owner_group_id_live', table_name='transaction_item', postgresql_where=sa.text('NOT is_deleted'))
+    op.drop_column('transaction_item', 'owner_group_id')
+    op.drop_column('transaction_item', 'owner_user_id')
+    op.drop_column('transaction_item', 'transaction_id')
+    op.drop_constraint('transaction_owner_user_id_fkey', 'transaction', type_='foreignkey')
+    op.drop_constraint('transaction_owner_group_id_fkey', 'transaction', type_='foreignkey')
+    op.drop_index('ix_transaction_owner_user_id_timestamp_id_live', table_name='transaction', postgresql_where=sa.text('NOT is_deleted'))
+    op.drop_index('ix_transaction_owner_group_id_timestamp_id_live', table_name='transaction', postgresql_where=sa.text('NOT is_deleted'))
+    op.drop_column('transaction', 'owner_group_id')
+    op.drop_column('transaction', 'owner_user_id')
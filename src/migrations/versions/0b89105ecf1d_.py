@@ -0,0 +1,93 @@
+"""empty message
+
+Revision ID: 0b89105ecf1d
+Revises: 14b8adc9733d
+Create Date: 2026-10-19 05:35:07.460755
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b89105ecf1d'
+down_revision: Union[str, None] = '14b8adc9733d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 10000
+
+# Every currency in use has two decimal places
+MINOR_UNIT_FACTOR = 100
+
+COVERING_INDEXES = (
+    ('ix_transaction_item_owner_user_id_category_live', 'owner_user_id'),
+    ('ix_transaction_item_owner_group_id_category_live', 'owner_group_id'),
+)
+
+
+def _backfill_in_batches(table: str, statement: str) -> None:
+    """Run `statement` for consecutive `id` ranges of `table`.
+
+    Each batch is committed separately so the backfill does not hold row
+    locks on the whole table for the duration of the migration.
+    """
+    connection = op.get_bind()
+    max_id = connection.execute(
+        sa.text(f'SELECT max(id) FROM "{table}"')
+    ).scalar()
+    if max_id is None:
+        return
+
+    with op.get_context().autocommit_block():
+        for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+            connection.execute(
+                sa.text(statement),
+                {"start": start, "end": start + BACKFILL_BATCH_SIZE},
+            )
+
+
+def _create_covering_indexes(amount_column: str) -> None:
+    for name, owner_column in COVERING_INDEXES:
+        op.create_index(name, 'transaction_item', [owner_column, 'purchase_category_id', 'currency', 'timestamp'], unique=False, postgresql_include=[amount_column], postgresql_where=sa.text('NOT is_deleted'))
+
+
+def upgrade() -> None:
+    for table in ('transaction', 'transaction_item'):
+        op.add_column(table, sa.Column('amount_minor', sa.BigInteger(), nullable=True))
+        _backfill_in_batches(
+            table,
+            f'''
+            UPDATE "{table}" SET amount_minor = round(amount::numeric * {MINOR_UNIT_FACTOR})
+            WHERE id > :start AND id <= :end
+            ''',
+        )
+        op.alter_column(table, 'amount_minor', existing_type=sa.BigInteger(), nullable=False)
+        op.drop_index(f'ix_{table}_amount', table_name=table)
+        op.create_index(f'ix_{table}_amount_minor', table, ['amount_minor'], unique=False)
+
+    # Dropping the float column also drops the covering indexes including it
+    op.drop_column('transaction', 'amount')
+    op.drop_column('transaction_item', 'amount')
+    _create_covering_indexes('amount_minor')
+
+
+def downgrade() -> None:
+    for table in ('transaction', 'transaction_item'):
+        op.add_column(table, sa.Column('amount', sa.Double(), nullable=True))
+        _backfill_in_batches(
+            table,
+            f'''
+            UPDATE "{table}" SET amount = amount_minor::double precision / {MINOR_UNIT_FACTOR}
+            WHERE id > :start AND id <= :end
+            ''',
+        )
+        op.alter_column(table, 'amount', existing_type=sa.Double(), nullable=False)
+        op.drop_index(f'ix_{table}_amount_minor', table_name=table)
+        op.create_index(f'ix_{table}_amount', table, ['amount'], unique=False)
+
+    op.drop_column('transaction', 'amount_minor')
+    op.drop_column('transaction_item', 'amount_minor')
+    _create_covering_indexes('amount')
@@ -0,0 +1,74 @@
+"""empty message
+
+Revision ID: 14b8adc9733d
+Revises: f611a31bea89
+Create Date: 2026-10-19 05:32:47.593611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '14b8adc9733d'
+down_revision: Union[str, None] = 'f611a31bea89'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables using UUIDMixin. Only the column default changes, existing rows
+# keep their UUIDs.
+UUID_TABLES = (
+    'group',
+    'income',
+    'purchase_category',
+    'rate_limit',
+    'receipt',
+    'tag',
+    'tier',
+    'transaction',
+    'transaction_item',
+    'user',
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+        SELECT encode(
+            set_bit(
+                set_bit(
+                    overlay(
+                        uuid_send(gen_random_uuid())
+                        PLACING substring(
+                            int8send(
+                                floor(
+                                    extract(epoch FROM clock_timestamp()) * 1000
+                                )::bigint
+                            )
+                            FROM 3
+                        )
+                        FROM 1 FOR 6
+                    ),
+                    52,
+                    1
+                ),
+                53,
+                1
+            ),
+            'hex'
+        )::uuid
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+    for table in UUID_TABLES:
+        op.alter_column(table, 'uuid', existing_type=sa.Uuid(), server_default=sa.text('uuid_generate_v7()'))
+
+
+def downgrade() -> None:
+    for table in UUID_TABLES:
+        op.alter_column(table, 'uuid', existing_type=sa.Uuid(), server_default=None)
+    op.execute('DROP FUNCTION uuid_generate_v7()')
@@ -0,0 +1,74 @@
+"""empty message
+
+Revision ID: 6c300e33fdba
+Revises: 049295830801
+Create Date: 2026-10-19 05:26:32.880171
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c300e33fdba'
+down_revision: Union[str, None] = '049295830801'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 10000
+
+
+def _backfill_in_batches(table: str, statement: str) -> None:
+    """Run `statement` for consecutive `id` ranges of `table`.
+
+    Each batch is committed separately so the backfill does not hold row
+    locks on the whole table for the duration of the migration.
+    """
+    connection = op.get_bind()
+    max_id = connection.execute(
+        sa.text(f'SELECT max(id) FROM "{table}"')
+    ).scalar()
+    if max_id is None:
+        return
+
+    with op.get_context().autocommit_block():
+        for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+            connection.execute(
+                sa.text(statement),
+                {"start": start, "end": start + BACKFILL_BATCH_SIZE},
+            )
+
+
+def upgrade() -> None:
+    op.add_column('transaction_item', sa.Column('timestamp', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('transaction_item', sa.Column('currency', postgresql.ENUM('EUR', 'USD', 'HUF', name='currency', create_type=False), nullable=True))
+
+    _backfill_in_batches(
+        'transaction_item',
+        '''
+        UPDATE transaction_item
+        SET timestamp = "transaction".timestamp,
+            currency = "transaction".currency
+        FROM "transaction"
+        WHERE "transaction".id = transaction_item.transaction_id
+          AND transaction_item.id > :start AND transaction_item.id <= :end
+        ''',
+    )
+
+    # Indexes are built after the backfill instead of being updated per row
+    op.drop_index('ix_transaction_item_owner_group_id_live', table_name='transaction_item', postgresql_where=sa.text('NOT is_deleted'))
+    op.drop_index('ix_transaction_item_owner_user_id_live', table_name='transaction_item', postgresql_where=sa.text('NOT is_deleted'))
+    op.create_index('ix_transaction_item_owner_group_id_category_live', 'transaction_item', ['owner_group_id', 'purchase_category_id', 'currency', 'timestamp'], unique=False, postgresql_include=['amount'], postgresql_where=sa.text('NOT is_deleted'))
+    op.create_index('ix_transaction_item_owner_user_id_category_live', 'transaction_item', ['owner_user_id', 'purchase_category_id', 'currency', 'timestamp'], unique=False, postgresql_include=['amount'], postgresql_where=sa.text('NOT is_deleted'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transaction_item_owner_user_id_category_live', table_name='transaction_item', postgresql_include=['amount'], postgresql_where=sa.text('NOT is_deleted'))
+    op.drop_index('ix_transaction_item_owner_group_id_category_live', table_name='transaction_item', postgresql_include=['amount'], postgresql_where=sa.text('NOT is_deleted'))
+    op.create_index('ix_transaction_item_owner_user_id_live', 'transaction_item', ['owner_user_id'], unique=False, postgresql_where=sa.text('NOT is_deleted'))
+    op.create_index('ix_transaction_item_owner_group_id_live', 'transaction_item', ['owner_group_id'], unique=False, postgresql_where=sa.text('NOT is_deleted'))
+    op.drop_column('transaction_item', 'currency')
+    op.drop_column('transaction_item', 'timestamp')
@@ -0,0 +1,29 @@
+"""empty message
+
+Revision ID: 7ece5c729d2d
+Revises: 5d5dec542bec
+Create Date: 2026-10-19 06:02:52.971980
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7ece5c729d2d'
+down_revision: Union[str, None] = '5d5dec542bec'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing transactions keep no fingerprint, only new imports are deduplicated
+    op.add_column('transaction', sa.Column('fingerprint', sa.LargeBinary(length=32), nullable=True))
+    op.create_index('ux_transaction_fingerprint_timestamp_live', 'transaction', ['fingerprint', 'timestamp'], unique=True, postgresql_where=sa.text('NOT is_deleted AND fingerprint IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ux_transaction_fingerprint_timestamp_live', table_name='transaction', postgresql_where=sa.text('NOT is_deleted AND fingerprint IS NOT NULL'))
+    op.drop_column('transaction', 'fingerprint')
@@ -0,0 +1,40 @@
+"""empty message
+
+Revision ID: 8f74e9833ac8
+Revises: 0b89105ecf1d
+Create Date: 2026-10-19 05:47:56.027954
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f74e9833ac8'
+down_revision: Union[str, None] = '0b89105ecf1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('token_blacklist', sa.Column('token_digest', sa.LargeBinary(length=32), nullable=True))
+    # Expired entries are no longer checked, so they are not worth hashing
+    op.execute('DELETE FROM token_blacklist WHERE expires_at < now()')
+    op.execute("UPDATE token_blacklist SET token_digest = sha256(convert_to(token, 'UTF8'))")
+    op.alter_column('token_blacklist', 'token_digest', nullable=False)
+    op.drop_index(op.f('ix_token_blacklist_token'), table_name='token_blacklist')
+    op.create_index(op.f('ix_token_blacklist_token_digest'), 'token_blacklist', ['token_digest'], unique=True)
+    op.drop_column('token_blacklist', 'token')
+
+
+def downgrade() -> None:
+    op.add_column('token_blacklist', sa.Column('token', sa.VARCHAR(), autoincrement=False, nullable=True))
+    # The tokens cannot be recovered from their digests, the hex digest only
+    # keeps the column unique and non-null, so these tokens stop being blocked
+    op.execute("UPDATE token_blacklist SET token = encode(token_digest, 'hex')")
+    op.alter_column('token_blacklist', 'token', nullable=False)
+    op.drop_index(op.f('ix_token_blacklist_token_digest'), table_name='token_blacklist')
+    op.create_index(op.f('ix_token_blacklist_token'), 'token_blacklist', ['token'], unique=True)
+    op.drop_column('token_blacklist', 'token_digest')
@@ -0,0 +1,146 @@
+"""empty message
+
+Revision ID: f611a31bea89
+Revises: 6c300e33fdba
+Create Date: 2026-10-19 05:29:47.715659
+
+Make the transaction item timestamp required and optionally partition
+transaction and transaction_item by timestamp month.
+
+Partitioning only runs when DATABASE_PARTITIONING is enabled. The tables are rewritten
+and locked while their rows are copied, so run it in a maintenance window.
+
+"""
+from datetime import UTC, date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f611a31bea89'
+down_revision: Union[str, None] = '6c300e33fdba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONED_TABLES = ('transaction', 'transaction_item')
+
+# Unique keys of a partitioned table must contain the partition key, so these
+# become plain indexes and the foreign keys pointing at the tables are dropped.
+UNIQUE_INDEXES = {
+    'transaction': ('ix_transaction_id', 'ix_transaction_uuid'),
+    'transaction_item': ('ix_transaction_item_id', 'ix_transaction_item_uuid'),
+}
+REFERENCING_FOREIGN_KEYS = (
+    ('group_transaction', 'group_transaction_transaction_id_fkey', 'transaction_id', 'transaction'),
+    ('user_transaction', 'user_transaction_transaction_id_fkey', 'transaction_id', 'transaction'),
+    ('transaction_receipt', 'transaction_receipt_transaction_id_fkey', 'transaction_id', 'transaction'),
+    ('transaction_transaction_item', 'transaction_transaction_item_transaction_id_fkey', 'transaction_id', 'transaction'),
+    ('transaction_item', 'transaction_item_transaction_id_fkey', 'transaction_id', 'transaction'),
+    ('transaction_item_tag', 'transaction_item_tag_transaction_item_id_fkey', 'transaction_item_id', 'transaction_item'),
+    ('transaction_transaction_item', 'transaction_transaction_item_transaction_item_id_fkey', 'transaction_item_id', 'transaction_item'),
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _is_partitioned(table: str) -> bool:
+    return bool(
+        op.get_bind().execute(
+            sa.text('SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))'),
+            {'table': f'"{table}"'},
+        ).scalar()
+    )
+
+
+def _get_table_definition(table: str) -> tuple[list[tuple[str, str]], list[tuple[str, str]], str]:
+    """Return the index and foreign key definitions and the id sequence."""
+    connection = op.get_bind()
+    indexes = connection.execute(
+        sa.text('SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = :table AND indexname != :pkey'),
+        {'table': table, 'pkey': f'{table}_pkey'},
+    ).all()
+    foreign_keys = connection.execute(
+        sa.text("SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = to_regclass(:table) AND contype = 'f'"),
+        {'table': f'"{table}"'},
+    ).all()
+    sequence = connection.execute(
+        sa.text("SELECT pg_get_serial_sequence(:table, 'id')"),
+        {'table': f'"{table}"'},
+    ).scalar()
+    return [tuple(row) for row in indexes], [tuple(row) for row in foreign_keys], sequence
+
+
+def _rebuild_table(table: str, partitioned: bool) -> None:
+    indexes, foreign_keys, sequence = _get_table_definition(table)
+    old_table = f'{table}_old'
+
+    op.execute(f'ALTER TABLE "{table}" RENAME TO "{old_table}"')
+    if partitioned:
+        op.execute(f'CREATE TABLE "{table}" (LIKE "{old_table}" INCLUDING DEFAULTS) PARTITION BY RANGE (timestamp)')
+        _create_partitions(table, old_table)
+    else:
+        op.execute(f'CREATE TABLE "{table}" (LIKE "{old_table}" INCLUDING DEFAULTS)')
+
+    op.execute(f'INSERT INTO "{table}" SELECT * FROM "{old_table}"')
+    op.execute(f'ALTER SEQUENCE {sequence} OWNED BY "{table}".id')
+    op.execute(f'DROP TABLE "{old_table}" CASCADE')
+
+    primary_key = '(id, timestamp)' if partitioned else '(id)'
+    op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY {primary_key}')
+    for name, definition in indexes:
+        if partitioned:
+            definition = definition.replace('CREATE UNIQUE INDEX', 'CREATE INDEX', 1)
+        elif name in UNIQUE_INDEXES[table]:
+            definition = definition.replace('CREATE INDEX', 'CREATE UNIQUE INDEX', 1)
+        # Partitioned indexes are not listed with the ONLY keyword
+        op.execute(definition.replace(' ON ONLY ', ' ON ', 1))
+    for name, definition in foreign_keys:
+        op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {definition}')
+
+
+def _create_partitions(table: str, old_table: str) -> None:
+    first_timestamp = op.get_bind().execute(
+        sa.text(f'SELECT min(timestamp) FROM "{old_table}"')
+    ).scalar()
+    current_month = datetime.now(UTC).date().replace(day=1)
+    month = first_timestamp.date().replace(day=1) if first_timestamp else current_month
+    last_month = _add_months(current_month, settings.DATABASE_PARTITIONS_AHEAD)
+
+    op.execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+    while month <= last_month:
+        op.execute(
+            f'CREATE TABLE "{table}_p{month:%Y_%m}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') TO ('{_add_months(month, 1).isoformat()} 00:00+00')"
+        )
+        month = _add_months(month, 1)
+
+
+def upgrade() -> None:
+    # The partition key has to be part of the primary key, so it can't be null
+    op.execute('UPDATE transaction_item SET timestamp = created_at WHERE timestamp IS NULL')
+    op.alter_column('transaction_item', 'timestamp', existing_type=sa.DateTime(timezone=True), nullable=False)
+
+    if not settings.DATABASE_PARTITIONING:
+        return
+
+    for table, name, _, _ in REFERENCING_FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+    for table in PARTITIONED_TABLES:
+        _rebuild_table(table, partitioned=True)
+
+
+def downgrade() -> None:
+    if any(_is_partitioned(table) for table in PARTITIONED_TABLES):
+        for table in PARTITIONED_TABLES:
+            _rebuild_table(table, partitioned=False)
+        for table, name, column, referred_table in REFERENCING_FOREIGN_KEYS:
+            op.create_foreign_key(name, table, referred_table, [column], ['id'])
+
+    op.alter_column('transaction_item', 'timestamp', existing_type=sa.DateTime(timezone=True), nullable=True)